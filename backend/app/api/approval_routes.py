@@ -1,31 +1,70 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Response
+from typing import Optional
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.concurrency import run_db_with_retry
+from app.core.database import get_session, run_db
 from app.core.dependencies import get_current_user
-from app.models.user_model import User
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.principal_cache import AuthenticatedPrincipal
+from app.core.responses import trusted_response
 from app.services import approval_service
 from app.schemas.approval_schema import (
     ExpenseApprovalResponse,
+    ExpenseBatchRequest,
+    ExpenseBatchResult,
     PendingApprovalResponse
 )
 
 router = APIRouter(prefix="/expenses", tags=["Approvals"])
 
 
+# ============================================
+# BATCH APPROVE / REJECT
+# (one transaction; per-item results, failed items are left untouched)
+# ============================================
+
+@router.post("/batch/approve", response_model=ExpenseBatchResult)
+async def approve_expenses(
+    data: ExpenseBatchRequest,
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
+):
+    return await run_db(
+        db,
+        approval_service.approve_expenses,
+        data.expense_ids,
+        current_user.user_id
+    )
+
+
+@router.post("/batch/reject", response_model=ExpenseBatchResult)
+async def reject_expenses(
+    data: ExpenseBatchRequest,
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
+):
+    return await run_db(
+        db,
+        approval_service.reject_expenses,
+        data.expense_ids,
+        current_user.user_id
+    )
+
+
 # ============================================
 # APPROVE EXPENSE
 # ============================================
 
 @router.post("/{expense_id}/approve", response_model=ExpenseApprovalResponse)
-def approve_expense(
+async def approve_expense(
     expense_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return approval_service.approve_expense(
+    return await run_db_with_retry(
         db,
+        approval_service.approve_expense,
         expense_id,
         current_user.user_id
     )
@@ -36,13 +75,14 @@ def approve_expense(
 # ============================================
 
 @router.post("/{expense_id}/reject", response_model=ExpenseApprovalResponse)
-def reject_expense(
+async def reject_expense(
     expense_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return approval_service.reject_expense(
+    return await run_db(
         db,
+        approval_service.reject_expense,
         expense_id,
         current_user.user_id
     )
@@ -50,14 +90,28 @@ def reject_expense(
 
 # ============================================
 # GET MY PENDING APPROVALS
+# (newest first, next page cursor in X-Next-Cursor)
 # ============================================
 
 @router.get("/pending", response_model=list[PendingApprovalResponse])
-def get_my_pending_approvals(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_my_pending_approvals(
+    response: Response,
+    co_space_id: Optional[UUID] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return approval_service.get_pending_approvals(
+    expenses, next_cursor = await run_db(
         db,
-        current_user.user_id
+        approval_service.get_pending_approvals,
+        current_user.user_id,
+        co_space_id,
+        cursor,
+        limit
     )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return trusted_response(list[PendingApprovalResponse], expenses, response)
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_session
 from app.schemas.auth_schema import SignupRequest, LoginRequest, TokenResponse
 from app.services import auth_service
 
@@ -8,10 +7,10 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/signup", response_model=TokenResponse)
-def signup(data: SignupRequest, db: Session = Depends(get_db)):
-    return auth_service.signup(db, data)
+async def signup(data: SignupRequest, db=Depends(get_session)):
+    return await auth_service.signup(db, data)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(data: LoginRequest, db: Session = Depends(get_db)):
-    return auth_service.login(db, data)
+async def login(data: LoginRequest, db=Depends(get_session)):
+    return await auth_service.login(db, data)
@@ -1,14 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Response
+from typing import Optional
 from uuid import UUID
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user_model import User
-from app.models.co_space_model import CoSpace
-from app.models.co_space_member_model import CoSpaceMember
-from app.services import co_space_service
+from app.core.database import get_session, run_db
+from app.core.co_space_access import CoSpaceAccess
+from app.core.dependencies import get_co_space_access, get_current_user
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.principal_cache import AuthenticatedPrincipal
+from app.core.responses import trusted_response
+from app.models.expense_model import Expense
+from app.services import co_space_service, expense_service, expense_export_service
+from app.schemas.expense_schema import ExpenseHistoryItem, ExpenseHistoryFilters
 from app.schemas.co_space_schema import (
+    BulkMembersRequest,
+    BulkMembersResult,
     CoSpaceCreate,
     CoSpaceResponse,
     CoSpaceMemberResponse
@@ -22,13 +27,14 @@ router = APIRouter(prefix="/co-spaces", tags=["Co-Spaces"])
 # ============================================
 
 @router.post("", response_model=CoSpaceResponse)
-def create_co_space(
+async def create_co_space(
     data: CoSpaceCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return co_space_service.create_co_space(
+    return await run_db(
         db,
+        co_space_service.create_co_space,
         data,
         current_user.user_id
     )
@@ -39,45 +45,79 @@ def create_co_space(
 # ============================================
 
 @router.get("", response_model=list[CoSpaceResponse])
-def get_my_co_spaces(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_my_co_spaces(
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return co_space_service.get_user_co_spaces(
+    co_spaces = await run_db(
         db,
+        co_space_service.get_user_co_spaces,
         current_user.user_id
     )
 
+    return trusted_response(list[CoSpaceResponse], co_spaces)
+
 
 # ============================================
 # INVITE MEMBER (Admin Only)
 # ============================================
 
 @router.post("/{co_space_id}/invite")
-def invite_member(
+async def invite_member(
     co_space_id: UUID,
     invited_user_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    access: CoSpaceAccess = Depends(get_co_space_access),
+    db=Depends(get_session)
+):
+    # Ensure current user is creator/admin
+    access.ensure_admin("Only co-space admin can invite members")
+
+    return await run_db(
+        db,
+        co_space_service.invite_member,
+        co_space_id,
+        invited_user_id
+    )
+
+
+# ============================================
+# BULK INVITE / ACCEPT (Admin Only)
+# (per-user results; accept is for admins migrating existing groups)
+# ============================================
+
+@router.post("/{co_space_id}/invite/bulk", response_model=BulkMembersResult)
+async def bulk_invite_members(
+    co_space_id: UUID,
+    data: BulkMembersRequest,
+    access: CoSpaceAccess = Depends(get_co_space_access),
+    db=Depends(get_session)
 ):
     # Ensure current user is creator/admin
-    co_space = db.query(CoSpace).filter(
-        CoSpace.co_space_id == co_space_id
-    ).first()
+    access.ensure_admin("Only co-space admin can invite members")
+
+    return await run_db(
+        db,
+        co_space_service.bulk_invite_members,
+        co_space_id,
+        data.user_ids
+    )
 
-    if not co_space:
-        raise HTTPException(status_code=404, detail="Co-space not found")
 
-    if co_space.co_space_created_by_user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=403,
-            detail="Only co-space admin can invite members"
-        )
+@router.post("/{co_space_id}/accept/bulk", response_model=BulkMembersResult)
+async def bulk_accept_members(
+    co_space_id: UUID,
+    data: BulkMembersRequest,
+    access: CoSpaceAccess = Depends(get_co_space_access),
+    db=Depends(get_session)
+):
+    # Ensure current user is creator/admin
+    access.ensure_admin("Only co-space admin can accept members")
 
-    return co_space_service.invite_member(
+    return await run_db(
         db,
+        co_space_service.bulk_accept_members,
         co_space_id,
-        invited_user_id
+        data.user_ids
     )
 
 
@@ -86,13 +126,14 @@ def invite_member(
 # ============================================
 
 @router.post("/{co_space_id}/accept")
-def accept_invite(
+async def accept_invite(
     co_space_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return co_space_service.accept_invite(
+    return await run_db(
         db,
+        co_space_service.accept_invite,
         co_space_id,
         current_user.user_id
     )
@@ -103,21 +144,74 @@ def accept_invite(
 # ============================================
 
 @router.get("/{co_space_id}/members", response_model=list[CoSpaceMemberResponse])
-def get_members(
+async def get_members(
+    co_space_id: UUID,
+    access: CoSpaceAccess = Depends(get_co_space_access),
+    db=Depends(get_session)
+):
+    access.ensure_member()
+
+    members = await run_db(db, co_space_service.get_members, co_space_id)
+
+    return trusted_response(list[CoSpaceMemberResponse], members)
+
+
+# ============================================
+# CO-SPACE EXPENSE HISTORY (Accepted Members Only)
+# (newest first, next page cursor in X-Next-Cursor)
+# ============================================
+
+@router.get("/{co_space_id}/expenses", response_model=list[ExpenseHistoryItem])
+async def get_co_space_expenses(
+    co_space_id: UUID,
+    response: Response,
+    filters: ExpenseHistoryFilters = Depends(),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    access: CoSpaceAccess = Depends(get_co_space_access),
+    db=Depends(get_session)
+):
+    access.ensure_member()
+
+    expenses, next_cursor = await run_db(
+        db,
+        expense_service.get_co_space_expenses,
+        co_space_id,
+        filters,
+        cursor,
+        limit
+    )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return trusted_response(list[ExpenseHistoryItem], expenses, response)
+
+
+# ============================================
+# CO-SPACE EXPENSE EXPORT (Accepted Members Only)
+# (CSV or NDJSON, streamed, optional gzip)
+# ============================================
+
+@router.get("/{co_space_id}/expenses/export")
+async def export_co_space_expenses(
     co_space_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    export_format: str = Query("csv", alias="format"),
+    compress: bool = Query(False, alias="gzip"),
+    filters: ExpenseHistoryFilters = Depends(),
+    access: CoSpaceAccess = Depends(get_co_space_access),
+    db=Depends(get_session)
 ):
-    membership = db.query(CoSpaceMember).filter(
-        CoSpaceMember.co_space_id == co_space_id,
-        CoSpaceMember.user_id == current_user.user_id,
-        CoSpaceMember.co_space_member_status == "accepted"
-    ).first()
-
-    if not membership:
-        raise HTTPException(
-            status_code=403,
-            detail="You are not a member of this co-space"
-        )
-
-    return co_space_service.get_members(db, co_space_id)
+    access.ensure_member()
+
+    statement = expense_export_service.export_statement(
+        Expense.co_space_id == co_space_id,
+        filters
+    )
+
+    return expense_export_service.export_response(
+        statement,
+        export_format,
+        compress,
+        f"co-space-{co_space_id}-expenses"
+    )
@@ -1,12 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException
+from typing import Optional
 from uuid import UUID
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user_model import User
-from app.models.co_space_member_model import CoSpaceMember
-from app.services import dashboard_service
+from app.core.co_space_access import CoSpaceAccess
+from app.core.dependencies import get_co_space_access, get_current_user
+from app.core.principal_cache import AuthenticatedPrincipal
+from app.services import dashboard_cache
 from app.schemas.dashboard_schema import (
     UserDashboardResponse,
     CoSpaceDashboardResponse
@@ -17,37 +16,40 @@ router = APIRouter(tags=["Dashboard"])
 
 # ============================================
 # USER DASHBOARD (Token-Based Identity)
+# (cached JSON with a weak ETag; If-None-Match answered with 304)
 # ============================================
 
 @router.get("/users/me/dashboard", response_model=UserDashboardResponse)
-def user_dashboard(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def user_dashboard(
+    if_none_match: Optional[str] = Header(default=None),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user)
 ):
-    return dashboard_service.get_user_dashboard(db, current_user.user_id)
+    dashboard = await dashboard_cache.get_user_dashboard(current_user.user_id)
+
+    if dashboard is None:
+        raise HTTPException(status_code=404, detail="User fund not found")
+
+    return dashboard.respond(if_none_match)
 
 
 # ============================================
 # CO-SPACE DASHBOARD (Membership Enforced)
+# (cached JSON with a weak ETag; If-None-Match answered with 304)
 # ============================================
 
 @router.get("/co-spaces/{co_space_id}/dashboard", response_model=CoSpaceDashboardResponse)
-def co_space_dashboard(
+async def co_space_dashboard(
     co_space_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(default=None),
+    access: CoSpaceAccess = Depends(get_co_space_access)
 ):
-    # Ensure current user is accepted member
-    membership = db.query(CoSpaceMember).filter(
-        CoSpaceMember.co_space_id == co_space_id,
-        CoSpaceMember.user_id == current_user.user_id,
-        CoSpaceMember.co_space_member_status == "accepted"
-    ).first()
-
-    if not membership:
-        raise HTTPException(
-            status_code=403,
-            detail="You are not authorized to view this co-space"
-        )
-
-    return dashboard_service.get_co_space_dashboard(db, co_space_id)
+    # Ensure current user is accepted member (membership is resolved and
+    # cached separately from the dashboard body)
+    access.ensure_member("You are not authorized to view this co-space")
+
+    dashboard = await dashboard_cache.get_co_space_dashboard(co_space_id)
+
+    if dashboard is None:
+        raise HTTPException(status_code=404, detail="Co-space has no funds yet")
+
+    return dashboard.respond(if_none_match)
@@ -1,11 +1,27 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import tempfile
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
-from app.models.user_model import User
-from app.schemas.expense_schema import ExpenseCreate, ExpenseResponse
-from app.services import expense_service
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.concurrency import run_db_with_retry
+from app.core.config import settings
+from app.core.database import get_session, run_db
+from app.core.dependencies import get_current_user, resolve_co_space_access
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.query_metrics import expect_repeated_statements
+from app.core.principal_cache import AuthenticatedPrincipal
+from app.core.responses import trusted_response
+from app.schemas.expense_schema import (
+    ExpenseCreate,
+    ExpenseResponse,
+    ExpenseHistoryItem,
+    ExpenseHistoryFilters,
+    ExpenseImportResult
+)
+from app.models.expense_model import Expense
+from app.services import expense_service, expense_import_service, expense_export_service
 
 router = APIRouter(prefix="/expenses", tags=["Expenses"])
 
@@ -15,13 +31,122 @@ router = APIRouter(prefix="/expenses", tags=["Expenses"])
 # ============================================
 
 @router.post("", response_model=ExpenseResponse)
-def create_expense(
+async def create_expense(
     data: ExpenseCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return expense_service.create_expense(
+    access = None
+
+    if data.expense_from_fund_type == "co_space" and data.co_space_id:
+        access = await resolve_co_space_access(db, data.co_space_id, current_user.user_id)
+
+    return await run_db_with_retry(
         db,
+        expense_service.create_expense,
         data,
-        current_user.user_id
+        current_user.user_id,
+        access
     )
+
+
+# ============================================
+# MY EXPENSE HISTORY (as payer)
+# (newest first, next page cursor in X-Next-Cursor)
+# ============================================
+
+@router.get("", response_model=list[ExpenseHistoryItem])
+async def get_my_expenses(
+    response: Response,
+    filters: ExpenseHistoryFilters = Depends(),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
+):
+    expenses, next_cursor = await run_db(
+        db,
+        expense_service.get_user_expenses,
+        current_user.user_id,
+        filters,
+        cursor,
+        limit
+    )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return trusted_response(list[ExpenseHistoryItem], expenses, response)
+
+
+# ============================================
+# EXPORT MY EXPENSES (CSV or NDJSON, streamed, optional gzip)
+# ============================================
+
+@router.get("/export")
+async def export_my_expenses(
+    export_format: str = Query("csv", alias="format"),
+    compress: bool = Query(False, alias="gzip"),
+    filters: ExpenseHistoryFilters = Depends(),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user)
+):
+    statement = expense_export_service.export_statement(
+        Expense.expense_payer_user_id == current_user.user_id,
+        filters
+    )
+
+    return expense_export_service.export_response(
+        statement,
+        export_format,
+        compress,
+        "expenses"
+    )
+
+
+# ============================================
+# BULK IMPORT (CSV or NDJSON body, streamed)
+# The body is spooled to a temporary file as it arrives, then parsed and
+# applied in batches; see expense_import_service.
+# ============================================
+
+_IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post("/import", response_model=ExpenseImportResult)
+async def import_expenses(
+    request: Request,
+    import_format: str | None = Query(None, alias="format"),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
+):
+    if import_format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        import_format = _IMPORT_CONTENT_TYPES.get(content_type)
+
+    if import_format not in expense_import_service.IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=415,
+            detail="Upload must be CSV (text/csv) or NDJSON (application/x-ndjson)"
+        )
+
+    # One INSERT per batch is the point here, not an N+1
+    expect_repeated_statements()
+
+    with tempfile.SpooledTemporaryFile(max_size=settings.EXPENSE_IMPORT_SPOOL_BYTES) as upload:
+
+        async for chunk in request.stream():
+            await run_in_threadpool(upload.write, chunk)
+
+        await run_in_threadpool(upload.seek, 0)
+
+        return await expense_import_service.import_expenses(
+            db,
+            upload,
+            import_format,
+            current_user.user_id
+        )
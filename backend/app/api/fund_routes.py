@@ -1,25 +1,48 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, Response
+from typing import Optional
 
-from app.core.database import get_db
+from app.core.concurrency import run_db_with_retry
+from app.core.conditional import etag_matches, not_modified, set_etag, version_etag
+from app.core.database import get_session, run_db
 from app.core.dependencies import get_current_user
-from app.models.user_model import User
+from app.core.principal_cache import AuthenticatedPrincipal
 from app.services import fund_service
 from app.schemas.fund_schema import UserFundCreate, UserFundResponse
 
 router = APIRouter(tags=["User Fund"])
 
 
+def _fund_etag(user_id, fund) -> str:
+    # fund is the UserFund row or just its version columns
+    return version_etag("user_fund", user_id, fund.user_fund_version, fund.user_fund_updated_at)
+
+
 # ============================================
 # GET CURRENT USER FUND
+# (weak ETag from the row version; a matching If-None-Match is answered
+# with 304 after reading the version columns only)
 # ============================================
 
 @router.get("/users/me/fund", response_model=UserFundResponse)
-def get_my_fund(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_my_fund(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return fund_service.get_user_fund(db, current_user.user_id)
+    if if_none_match:
+        version = await run_db(db, fund_service.get_user_fund_version, current_user.user_id)
+
+        if version is not None:
+            etag = _fund_etag(current_user.user_id, version)
+
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+    fund = await run_db(db, fund_service.get_user_fund, current_user.user_id)
+    set_etag(response, _fund_etag(current_user.user_id, fund))
+
+    return fund
 
 
 # ============================================
@@ -27,13 +50,14 @@ def get_my_fund(
 # ============================================
 
 @router.post("/users/me/fund", response_model=UserFundResponse)
-def create_my_fund(
+async def create_my_fund(
     data: UserFundCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return fund_service.create_user_fund(
+    return await run_db_with_retry(
         db,
+        fund_service.initialize_user_fund,
         current_user.user_id,
         data
     )
@@ -44,13 +68,14 @@ def create_my_fund(
 # ============================================
 
 @router.put("/users/me/fund", response_model=UserFundResponse)
-def update_my_fund(
+async def update_my_fund(
     data: UserFundCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
 ):
-    return fund_service.update_user_fund(
+    return await run_db_with_retry(
         db,
+        fund_service.update_user_fund,
         current_user.user_id,
         data
     )
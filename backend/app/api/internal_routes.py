@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends
+
+from app.core import database
+from app.core.cache import registered_caches
+from app.core.password_executor import password_executor
+from app.core.dependencies import require_internal_token
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    dependencies=[Depends(require_internal_token)]
+)
+
+
+# ============================================
+# CONNECTION POOL STATS
+# ============================================
+
+@router.get("/db/pool")
+def db_pool_stats():
+
+    pools = [database.pool_metrics.snapshot()]
+
+    if database.async_pool_metrics is not None:
+        pools.append(database.async_pool_metrics.snapshot())
+
+    return {"pools": pools}
+
+
+# ============================================
+# CACHE STATS (hit / miss counters)
+# ============================================
+
+@router.get("/cache")
+def cache_stats():
+    return {"caches": [cache.stats() for cache in registered_caches()]}
+
+
+# ============================================
+# PASSWORD HASHING POOL (queue depth / latency)
+# ============================================
+
+@router.get("/password-hashing")
+def password_hashing_stats():
+    return password_executor.stats()
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+from uuid import UUID
+
+from app.core.database import get_session, run_db
+from app.core.co_space_access import CoSpaceAccess
+from app.core.dependencies import get_co_space_access, get_current_user
+from app.core.principal_cache import AuthenticatedPrincipal
+from app.services import spending_period_service
+from app.schemas.spending_schema import UserSpendingResponse, CoSpaceSpendingResponse
+
+router = APIRouter(tags=["Spending"])
+
+
+# ============================================
+# USER SPENDING BY MONTH (Token-Based Identity)
+# (from / to as YYYY-MM, inclusive; defaults to this year so far)
+# ============================================
+
+@router.get("/users/me/spending", response_model=UserSpendingResponse)
+async def user_spending(
+    start: Optional[str] = Query(None, alias="from"),
+    end: Optional[str] = Query(None, alias="to"),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
+):
+    start_period, end_period = spending_period_service.resolve_period_range(start, end)
+
+    return await run_db(
+        db,
+        spending_period_service.get_user_spending,
+        current_user.user_id,
+        start_period,
+        end_period
+    )
+
+
+# ============================================
+# CO-SPACE SPENDING BY MONTH (Accepted Members Only)
+# ============================================
+
+@router.get("/co-spaces/{co_space_id}/spending", response_model=CoSpaceSpendingResponse)
+async def co_space_spending(
+    co_space_id: UUID,
+    start: Optional[str] = Query(None, alias="from"),
+    end: Optional[str] = Query(None, alias="to"),
+    access: CoSpaceAccess = Depends(get_co_space_access),
+    db=Depends(get_session)
+):
+    start_period, end_period = spending_period_service.resolve_period_range(start, end)
+
+    access.ensure_member()
+
+    return await run_db(
+        db,
+        spending_period_service.get_co_space_spending,
+        co_space_id,
+        start_period,
+        end_period
+    )
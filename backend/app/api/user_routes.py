@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, Response
+from typing import Optional
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.concurrency import run_db_with_retry
+from app.core.conditional import etag_matches, not_modified, set_etag, version_etag
+from app.core.database import get_session, run_db
 from app.schemas.user_schema import UserCreate, UserUpdate, UserResponse
 from app.services import user_service
 
@@ -14,17 +16,42 @@ router = APIRouter(prefix="/users", tags=["Users"])
 # ============================================
 
 @router.post("", response_model=UserResponse)
-def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
-    return user_service.create_user(db, user_data)
+async def create_user(user_data: UserCreate, db=Depends(get_session)):
+    return await run_db(db, user_service.create_user, user_data)
+
+
+def _user_etag(user_id, user) -> str:
+    # user is the User row or just its version; user_version is bumped by
+    # every ORM update
+    return version_etag("user", user_id, user.user_version)
 
 
 # ============================================
 # GET /users/{user_id}
+# (weak ETag from user_version; a matching If-None-Match is answered
+# with 304 after reading the version only)
 # ============================================
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: UUID, db: Session = Depends(get_db)):
-    return user_service.get_user_by_id(db, user_id)
+async def get_user(
+    user_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    db=Depends(get_session)
+):
+    if if_none_match:
+        version = await run_db(db, user_service.get_user_version, user_id)
+
+        if version is not None:
+            etag = _user_etag(user_id, version)
+
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+    user = await run_db(db, user_service.get_user_by_id, user_id)
+    set_etag(response, _user_etag(user_id, user))
+
+    return user
 
 
 # ============================================
@@ -32,8 +59,8 @@ def get_user(user_id: UUID, db: Session = Depends(get_db)):
 # ============================================
 
 @router.put("/{user_id}", response_model=UserResponse)
-def update_user(user_id: UUID, user_data: UserUpdate, db: Session = Depends(get_db)):
-    return user_service.update_user(db, user_id, user_data)
+async def update_user(user_id: UUID, user_data: UserUpdate, db=Depends(get_session)):
+    return await run_db_with_retry(db, user_service.update_user, user_id, user_data)
 
 
 # ============================================
@@ -41,5 +68,5 @@ def update_user(user_id: UUID, user_data: UserUpdate, db: Session = Depends(get_
 # ============================================
 
 @router.patch("/{user_id}/deactivate", response_model=UserResponse)
-def deactivate_user(user_id: UUID, db: Session = Depends(get_db)):
-    return user_service.deactivate_user(db, user_id)
+async def deactivate_user(user_id: UUID, db=Depends(get_session)):
+    return await run_db_with_retry(db, user_service.deactivate_user, user_id)
@@ -0,0 +1,266 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+# ============================================
+# Invalidation Backends
+# Local: invalidations stay inside this process.
+# Redis: invalidations are broadcast to every worker over pub/sub.
+# ============================================
+
+class LocalInvalidationBackend:
+
+    def publish(self, cache_name: str, key: str):
+        pass
+
+    def start(self, on_message):
+        pass
+
+
+class RedisInvalidationBackend:
+
+    def __init__(self, url: str, channel: str = "expense-tracker:cache-invalidation"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "CACHE_INVALIDATION_BACKEND=redis requires the 'redis' package"
+            ) from e
+
+        self._client = redis.Redis.from_url(url)
+        self._channel = channel
+        self._thread = None
+
+    def publish(self, cache_name: str, key: str):
+        try:
+            self._client.publish(self._channel, f"{cache_name}|{key}")
+        except Exception:
+            # Peers fall back to TTL expiry; the local entry is already gone
+            logger.exception("Cache invalidation publish failed")
+
+    def start(self, on_message):
+
+        def listen():
+            while True:
+                try:
+                    pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe(self._channel)
+
+                    for message in pubsub.listen():
+                        cache_name, _, key = message["data"].decode().partition("|")
+                        on_message(cache_name, key)
+                except Exception:
+                    logger.exception("Cache invalidation listener failed, reconnecting")
+                    time.sleep(1)
+
+        self._thread = threading.Thread(
+            target=listen,
+            name="cache-invalidation-listener",
+            daemon=True
+        )
+        self._thread.start()
+
+
+def _build_backend():
+
+    if settings.CACHE_INVALIDATION_BACKEND == "redis":
+        return RedisInvalidationBackend(settings.CACHE_REDIS_URL)
+
+    if settings.CACHE_INVALIDATION_BACKEND != "local":
+        raise ValueError("CACHE_INVALIDATION_BACKEND must be either 'local' or 'redis'")
+
+    return LocalInvalidationBackend()
+
+
+_registry = {}
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def _on_remote_invalidation(cache_name: str, key: str):
+
+    cache = _registry.get(cache_name)
+
+    if cache is not None:
+        cache.invalidate(key, broadcast=False)
+
+
+def get_invalidation_backend():
+    global _backend
+
+    with _backend_lock:
+        if _backend is None:
+            _backend = _build_backend()
+            _backend.start(_on_remote_invalidation)
+
+    return _backend
+
+
+def register_cache(cache):
+    """Caches are registered by name for stats and remote invalidation."""
+    _registry[cache.name] = cache
+
+
+def registered_caches():
+    return list(_registry.values())
+
+
+# ============================================
+# TTL + LRU Cache (thread-safe, string keys)
+# A value loaded from the database can be out of date by the time it is
+# set: the row may have changed, and the key been invalidated, while the
+# load ran. Callers read generation() before loading and pass it to
+# set(), which drops the value if the key was invalidated since. Each
+# invalidation is numbered; the numbers of the last maxsize invalidated
+# keys are kept, older ones only as a floor (which may drop a value that
+# was fine, never keep one that was not).
+# ============================================
+
+class TTLCache:
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._generation = 0
+        self._invalidated_at = OrderedDict()
+        self._invalidated_floor = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.discarded_loads = 0
+
+        register_cache(self)
+
+    def get(self, key: str):
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return MISSING
+
+            expires_at, value = entry
+
+            if expires_at <= now:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self) -> int:
+
+        with self._lock:
+            return self._generation
+
+    def set(self, key: str, value, generation: int = None):
+
+        with self._lock:
+            if generation is not None and (
+                self._invalidated_at.get(key, self._invalidated_floor) > generation
+            ):
+                self.discarded_loads += 1
+                return
+
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str, broadcast: bool = True):
+
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self.invalidations += 1
+
+            # Numbered even when nothing was cached: a load may be running
+            self._generation += 1
+            self._invalidated_at[key] = self._generation
+            self._invalidated_at.move_to_end(key)
+
+            while len(self._invalidated_at) > self.maxsize:
+                _, self._invalidated_floor = self._invalidated_at.popitem(last=False)
+
+        if broadcast:
+            get_invalidation_backend().publish(self.name, key)
+
+    def clear(self):
+
+        with self._lock:
+            self._data.clear()
+
+            self._generation += 1
+            self._invalidated_at.clear()
+            self._invalidated_floor = self._generation
+
+    def stats(self) -> dict:
+
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "discarded_loads": self.discarded_loads,
+            }
+
+
+# ============================================
+# Invalidate On Commit
+# Services queue keys on the session; they are dropped only once the
+# transaction has actually committed, and forgotten on rollback.
+# ============================================
+
+_PENDING_KEY = "cache_invalidations"
+
+
+def invalidate_on_commit(db: Session, cache, key: str):
+    db.info.setdefault(_PENDING_KEY, []).append((cache, key))
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_invalidations(session):
+
+    for cache, key in session.info.pop(_PENDING_KEY, []):
+        cache.invalidate(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache, invalidate_on_commit
+from app.core.config import settings
+
+
+# ============================================
+# Co-Space Access
+# What a user may do in one co-space, resolved once per request (and
+# cached across requests) instead of re-querying CoSpaceMember in the
+# route and again in the service
+# ============================================
+
+@dataclass(frozen=True)
+class CoSpaceAccess:
+    co_space_id: UUID
+    user_id: UUID
+    co_space_exists: bool
+    # None when the user has no membership row (never invited)
+    member_status: Optional[str]
+    is_admin: bool
+
+    @property
+    def is_member(self) -> bool:
+        return self.member_status == "accepted"
+
+    def ensure_member(self, detail: str = "You are not a member of this co-space"):
+
+        if not self.is_member:
+            raise HTTPException(status_code=403, detail=detail)
+
+    def ensure_admin(self, detail: str):
+
+        if not self.co_space_exists:
+            raise HTTPException(status_code=404, detail="Co-space not found")
+
+        if not self.is_admin:
+            raise HTTPException(status_code=403, detail=detail)
+
+
+co_space_access_cache = TTLCache(
+    "co_space_access",
+    maxsize=settings.CO_SPACE_ACCESS_CACHE_MAX_SIZE,
+    ttl=settings.CO_SPACE_ACCESS_CACHE_TTL_SECONDS
+)
+
+
+def co_space_access_key(co_space_id, user_id) -> str:
+    return f"{co_space_id}:{user_id}"
+
+
+def invalidate_co_space_access(db: Session, co_space_id, *user_ids):
+    """Call wherever a membership row is created, changes status or is removed."""
+
+    for user_id in user_ids:
+        invalidate_on_commit(db, co_space_access_cache, co_space_access_key(co_space_id, user_id))
@@ -0,0 +1,74 @@
+import asyncio
+import random
+
+from fastapi import HTTPException
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.core.config import settings
+from app.core.database import run_db
+
+
+# ============================================
+# Optimistic Concurrency Retry
+# User, UserFund and CoSpaceFund carry a version column (version_id_col),
+# so a write based on a stale read fails with StaleDataError at flush
+# instead of silently overwriting a concurrent update. The whole service call is
+# then retried, re-reading the row, after a "full jitter" backoff:
+# uniform(0, min(max_delay, base_delay * 2 ** attempt)). The wait is an
+# asyncio sleep, so a retrying request holds neither a worker thread nor
+# a connection (services roll back before re-raising).
+# ============================================
+
+_retry_stats = {
+    "conflicts": 0,
+    "retries": 0,
+    "exhausted": 0,
+}
+
+
+def retry_stats() -> dict:
+    return dict(_retry_stats)
+
+
+def _backoff(attempt: int) -> float:
+
+    ceiling = min(
+        settings.CONCURRENCY_RETRY_MAX_DELAY_SECONDS,
+        settings.CONCURRENCY_RETRY_BASE_DELAY_SECONDS * 2 ** attempt
+    )
+
+    return random.uniform(0, ceiling)
+
+
+def _rollback(db):
+    db.rollback()
+
+
+async def run_db_with_retry(db, fn, *args, **kwargs):
+    """
+    run_db for services that write versioned rows. Gives up after
+    CONCURRENCY_RETRY_ATTEMPTS conflicts with a 409.
+    """
+
+    attempts = settings.CONCURRENCY_RETRY_ATTEMPTS
+
+    for attempt in range(attempts):
+
+        try:
+            return await run_db(db, fn, *args, **kwargs)
+
+        except StaleDataError:
+            _retry_stats["conflicts"] += 1
+            await run_db(db, _rollback)
+
+            if attempt + 1 == attempts:
+                _retry_stats["exhausted"] += 1
+                break
+
+            _retry_stats["retries"] += 1
+            await asyncio.sleep(_backoff(attempt))
+
+    raise HTTPException(
+        status_code=409,
+        detail="The record was updated concurrently, please retry"
+    )
@@ -0,0 +1,91 @@
+import hashlib
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+ETAG_HEADER = "ETag"
+
+# Per-user content: browsers may keep it but must revalidate each time
+# (which the ETag makes cheap); shared caches must not keep it
+CACHE_CONTROL = "private, no-cache"
+
+
+# ============================================
+# Weak ETags
+# Weak (W/) because the same representation may go out gzip-encoded or
+# not; the tag names the content, not the bytes on the wire.
+# ============================================
+
+def _weak(digest_input: bytes) -> str:
+    return f'W/"{hashlib.blake2b(digest_input, digest_size=12).hexdigest()}"'
+
+
+def version_etag(*parts) -> str:
+    """From whatever identifies a row's state (key, version, updated_at)."""
+    return _weak("|".join(str(part) for part in parts).encode())
+
+
+def body_etag(body: bytes) -> str:
+    return _weak(body)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def set_etag(response: Response, etag: str):
+    response.headers[ETAG_HEADER] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+
+    response = Response(status_code=304)
+    set_etag(response, etag)
+
+    return response
+
+
+# ============================================
+# Pre-encoded Responses
+# For cached responses: the body is encoded and tagged once, when the
+# entry is loaded, so a cache hit is either a 304 or the stored bytes.
+# ============================================
+
+class EncodedResponse:
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+
+    @classmethod
+    def from_model(cls, model: BaseModel):
+
+        body = model.model_dump_json().encode()
+
+        return cls(body, body_etag(body))
+
+    def respond(self, if_none_match: str | None) -> Response:
+
+        if etag_matches(if_none_match, self.etag):
+            return not_modified(self.etag)
+
+        response = Response(self.body, media_type="application/json")
+        set_etag(response, self.etag)
+
+        return response
@@ -11,8 +11,15 @@ class Settings:
     SUPABASE_DB_USER = os.getenv("SUPABASE_DB_USER")
     SUPABASE_DB_PASSWORD = os.getenv("SUPABASE_DB_PASSWORD")
 
+    # "sync" (psycopg2 + threadpool) or "async" (asyncpg + AsyncSession)
+    DB_ENGINE_MODE = os.getenv("DB_ENGINE_MODE", "sync").lower()
+
     @property
     def DATABASE_URL(self) -> str:
+        override = os.getenv("DATABASE_URL")
+        if override:
+            return override
+
         return (
             f"postgresql+psycopg2://{self.SUPABASE_DB_USER}:"
             f"{self.SUPABASE_DB_PASSWORD}@"
@@ -21,6 +28,112 @@ class Settings:
             f"{self.SUPABASE_DB_NAME}"
         )
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        override = os.getenv("ASYNC_DATABASE_URL")
+        if override:
+            return override
+
+        return (
+            f"postgresql+asyncpg://{self.SUPABASE_DB_USER}:"
+            f"{self.SUPABASE_DB_PASSWORD}@"
+            f"{self.SUPABASE_DB_HOST}:"
+            f"{self.SUPABASE_DB_PORT}/"
+            f"{self.SUPABASE_DB_NAME}"
+        )
+
+    # CONNECTION POOL
+    DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # Per-connection statement_timeout in milliseconds (0 disables)
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000))
+
+    # Shared secret for /internal endpoints (unset disables them)
+    INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+    # CACHES
+    # "local" keeps invalidations in-process, "redis" shares them across workers
+    CACHE_INVALIDATION_BACKEND = os.getenv("CACHE_INVALIDATION_BACKEND", "local").lower()
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 60))
+    PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", 10000))
+    # Dashboards: served fresh for TTL, then stale (while refreshing) for STALE
+    DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", 5))
+    DASHBOARD_CACHE_STALE_SECONDS = float(os.getenv("DASHBOARD_CACHE_STALE_SECONDS", 30))
+    DASHBOARD_CACHE_MAX_SIZE = int(os.getenv("DASHBOARD_CACHE_MAX_SIZE", 10000))
+    # Co-space membership/admin status per (co-space, user); invalidated on
+    # invite, accept and removal, so the TTL only bounds cross-worker lag
+    CO_SPACE_ACCESS_CACHE_TTL_SECONDS = float(os.getenv("CO_SPACE_ACCESS_CACHE_TTL_SECONDS", 60))
+    CO_SPACE_ACCESS_CACHE_MAX_SIZE = int(os.getenv("CO_SPACE_ACCESS_CACHE_MAX_SIZE", 50000))
+
+    # EXPENSE IMPORT
+    EXPENSE_IMPORT_BATCH_SIZE = int(os.getenv("EXPENSE_IMPORT_BATCH_SIZE", 1000))
+    # Uploads larger than this are spooled to a temporary file
+    EXPENSE_IMPORT_SPOOL_BYTES = int(os.getenv("EXPENSE_IMPORT_SPOOL_BYTES", 8 * 1024 * 1024))
+    EXPENSE_IMPORT_MAX_REPORTED_ERRORS = int(os.getenv("EXPENSE_IMPORT_MAX_REPORTED_ERRORS", 1000))
+
+    # EXPENSE EXPORT (rows fetched per server-side cursor round trip)
+    EXPENSE_EXPORT_BATCH_SIZE = int(os.getenv("EXPENSE_EXPORT_BATCH_SIZE", 2000))
+
+    # FUND LEDGER SNAPSHOTS (how long a round waits for transactions that
+    # were writing ledger entries when it started before leaving those
+    # entries to the next round)
+    FUND_SNAPSHOT_WAIT_SECONDS = float(os.getenv("FUND_SNAPSHOT_WAIT_SECONDS", 30))
+
+    # PER-REQUEST QUERY METRICS (X-DB-* headers, log fields). A statement
+    # shape repeated more than THRESHOLD times in one request is logged as
+    # a likely N+1; STRICT turns that into an error (for tests)
+    QUERY_METRICS_ENABLED = os.getenv("QUERY_METRICS_ENABLED", "true").lower() == "true"
+    QUERY_N_PLUS_ONE_THRESHOLD = int(os.getenv("QUERY_N_PLUS_ONE_THRESHOLD", 10))
+    QUERY_N_PLUS_ONE_STRICT = os.getenv("QUERY_N_PLUS_ONE_STRICT", "false").lower() == "true"
+
+    # REQUEST PROFILING (sampled stacks, folded format). A request is
+    # profiled when it carries X-Profile: <INTERNAL_API_TOKEN>, or at
+    # random with SAMPLE_RATE (0 disables); the newest MAX_FILES profiles
+    # are kept in DIR
+    PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", 0))
+    PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", 5))
+    PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", 30))
+    PROFILE_MAX_CONCURRENT = int(os.getenv("PROFILE_MAX_CONCURRENT", 2))
+    PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+    PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", 200))
+
+    # JSON RESPONSES: orjson for responses without a response_model, and
+    # unvalidated encoding for routes serving trusted ORM rows (see
+    # app/core/responses.py); false restores plain JSONResponse everywhere
+    FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").lower() == "true"
+
+    # RESPONSE COMPRESSION (gzip for clients that accept it, bodies of at
+    # least MINIMUM_SIZE bytes only)
+    GZIP_ENABLED = os.getenv("GZIP_ENABLED", "true").lower() == "true"
+    GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", 1024))
+    GZIP_COMPRESS_LEVEL = int(os.getenv("GZIP_COMPRESS_LEVEL", 6))
+
+    # PROMETHEUS METRICS (GET /metrics, behind INTERNAL_API_TOKEN like
+    # /internal; per worker process, scrape each one)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # BATCH APPROVE / REJECT (expense ids per request)
+    APPROVAL_BATCH_MAX_SIZE = int(os.getenv("APPROVAL_BATCH_MAX_SIZE", 500))
+
+    # BULK CO-SPACE INVITE / ACCEPT (user ids per request)
+    CO_SPACE_BULK_MEMBERS_MAX_SIZE = int(os.getenv("CO_SPACE_BULK_MEMBERS_MAX_SIZE", 1000))
+
+    # OPTIMISTIC CONCURRENCY (versioned fund rows: attempts per request and
+    # the full-jitter backoff bounds between them)
+    CONCURRENCY_RETRY_ATTEMPTS = int(os.getenv("CONCURRENCY_RETRY_ATTEMPTS", 8))
+    CONCURRENCY_RETRY_BASE_DELAY_SECONDS = float(os.getenv("CONCURRENCY_RETRY_BASE_DELAY_SECONDS", 0.01))
+    CONCURRENCY_RETRY_MAX_DELAY_SECONDS = float(os.getenv("CONCURRENCY_RETRY_MAX_DELAY_SECONDS", 0.2))
+
+    # PASSWORD HASHING (dedicated bcrypt pool)
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+    PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))
+    PASSWORD_HASH_RETRY_AFTER_SECONDS = int(os.getenv("PASSWORD_HASH_RETRY_AFTER_SECONDS", 1))
+
     # NEW JWT VARIABLES
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
     JWT_ALGORITHM = os.getenv("JWT_ALGORITHM")
@@ -30,4 +143,3 @@ class Settings:
 
 
 settings = Settings()
-
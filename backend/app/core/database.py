@@ -1,8 +1,58 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
+from app.core import profiling, query_metrics
+from app.core.pool_metrics import PoolMetrics, instrumented_pool_class
 
-engine = create_engine(settings.DATABASE_URL, echo=True)
+if settings.DB_ENGINE_MODE not in ("sync", "async"):
+    raise ValueError("DB_ENGINE_MODE must be either 'sync' or 'async'")
+
+
+# ============================================
+# Engine / Pool Options (shared by both engines)
+# ============================================
+
+def _engine_options(url: str, base_pool_class, metrics: PoolMetrics) -> dict:
+
+    options = {
+        "echo": settings.DB_ECHO,
+        "poolclass": instrumented_pool_class(base_pool_class, metrics),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+    parsed = make_url(url)
+
+    if settings.DB_STATEMENT_TIMEOUT_MS and parsed.get_backend_name() == "postgresql":
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": timeout}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={timeout}"
+            }
+
+    return options
+
+
+pool_metrics = PoolMetrics("sync")
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    **_engine_options(settings.DATABASE_URL, QueuePool, pool_metrics)
+)
+pool_metrics.attach(engine)
+query_metrics.attach(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -10,6 +60,36 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# ============================================
+# Async Engine (only built when selected, asyncpg is optional otherwise)
+# ============================================
+
+async_engine = None
+AsyncSessionLocal = None
+async_pool_metrics = None
+
+if settings.DB_ENGINE_MODE == "async":
+    async_pool_metrics = PoolMetrics("async")
+
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        **_engine_options(
+            settings.ASYNC_DATABASE_URL,
+            AsyncAdaptedQueuePool,
+            async_pool_metrics
+        )
+    )
+    async_pool_metrics.attach(async_engine.sync_engine)
+    query_metrics.attach(async_engine.sync_engine)
+
+    # Objects are handed to response serialization after commit, so they
+    # must not expire (an expired attribute cannot lazy-load outside a greenlet)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
 Base = declarative_base()
 
 def get_db():
@@ -18,3 +98,119 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Session dependency used by the routes, picked once at startup
+get_session = get_async_db if settings.DB_ENGINE_MODE == "async" else get_db
+
+
+# ============================================
+# Dialect INSERT (for ON CONFLICT upserts)
+# ============================================
+
+def dialect_insert(db, model):
+
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+
+    return insert(model)
+
+
+# ============================================
+# Run a (sync) service function against either session type
+# ============================================
+
+async def run_db(db, fn, *args, **kwargs):
+    """
+    Services are written against a sync Session. With an AsyncSession they
+    run through run_sync (greenlet on the event loop, asyncpg underneath);
+    with a sync Session they run on the threadpool as before.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(profiling.bind(fn, "run_sync"), *args, **kwargs)
+
+    return await run_in_threadpool(profiling.bind(fn, "threadpool"), db, *args, **kwargs)
+
+
+
+def _call_and_release(db, fn, *args, **kwargs):
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+async def run_db_and_release(db, fn, *args, **kwargs):
+    """
+    Like run_db, but the session's transaction ends inside the same call,
+    so its pooled connection is back in the pool before the caller awaits
+    anything else (bcrypt, the next threadpool hop). The session remains
+    usable and checks out a fresh connection on its next query.
+
+    Doing the release in a separate threadpool call instead can deadlock:
+    every worker thread waiting on the pool while the connections are held
+    by requests queued for a worker thread.
+    """
+    return await run_db(db, _call_and_release, fn, *args, **kwargs)
+
+
+async def run_in_new_session(fn, *args, **kwargs):
+    """
+    Runs fn against a session of its own, for work that is not tied to a
+    request (background cache refreshes). The session is closed before
+    returning.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(fn, *args, **kwargs)
+
+    return await run_in_threadpool(_call_and_release, SessionLocal(), fn, *args, **kwargs)
+
+
+# ============================================
+# Stream a large SELECT (server-side cursor), one partition at a time
+# ============================================
+
+async def stream_partitions(statement, batch_size: int):
+    """
+    Async iterator over lists of rows, at most batch_size each, read
+    through a server-side cursor on a session of its own (the stream
+    outlives the request handler). Only one partition is in memory at a
+    time; with a sync engine each fetch runs on the threadpool.
+    """
+    statement = statement.execution_options(yield_per=batch_size)
+
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(statement)
+
+            async for partition in result.partitions():
+                yield partition
+
+        return
+
+    db = SessionLocal()
+
+    try:
+        partitions = (await run_in_threadpool(db.execute, statement)).partitions()
+
+        while True:
+            partition = await run_in_threadpool(next, partitions, None)
+
+            if partition is None:
+                break
+
+            yield partition
+    finally:
+        await run_in_threadpool(db.close)
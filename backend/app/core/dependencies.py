@@ -1,20 +1,34 @@
-from fastapi import Depends, HTTPException, status
+import secrets
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.cache import MISSING
+from app.core.co_space_access import CoSpaceAccess, co_space_access_cache, co_space_access_key
+from app.core.database import get_session, run_db_and_release
+from app.core.principal_cache import AuthenticatedPrincipal, principal_cache
 from app.core.security import decode_access_token
 from app.models.user_model import User
+from app.services.co_space_service import load_co_space_access
 
 
 security = HTTPBearer()
 
 
-def get_current_user(
+def _load_user(db: Session, user_id: UUID):
+    return db.query(User).filter(
+        User.user_id == user_id
+    ).first()
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
+    db=Depends(get_session)
+) -> AuthenticatedPrincipal:
 
     token = credentials.credentials
 
@@ -28,20 +42,79 @@ def get_current_user(
             detail="Invalid token payload"
         )
 
-    user = db.query(User).filter(
-        User.user_id == UUID(user_id)
-    ).first()
+    user_id = UUID(user_id)
+    principal = principal_cache.get(str(user_id))
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+    if principal is MISSING:
+        # Read before the load: a deactivation committed while it runs
+        # must not leave the old, active principal cached
+        generation = principal_cache.generation()
+        user = await run_db_and_release(db, _load_user, user_id)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
 
-    if not user.user_is_active:
+        principal = AuthenticatedPrincipal.from_user(user)
+        principal_cache.set(str(user_id), principal, generation)
+
+    if not principal.user_is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User is deactivated"
         )
 
-    return user
+    return principal
+
+
+# ============================================
+# Co-Space Access (membership + admin, once per request)
+# Routes with the co-space in the path depend on get_co_space_access and
+# pass the result to services; routes that only learn the co-space from
+# the body call resolve_co_space_access themselves.
+# ============================================
+
+async def resolve_co_space_access(db, co_space_id: UUID, user_id: UUID) -> CoSpaceAccess:
+
+    key = co_space_access_key(co_space_id, user_id)
+    access = co_space_access_cache.get(key)
+
+    if access is MISSING:
+        generation = co_space_access_cache.generation()
+        access = await run_db_and_release(db, load_co_space_access, co_space_id, user_id)
+        co_space_access_cache.set(key, access, generation)
+
+    return access
+
+
+async def get_co_space_access(
+    co_space_id: UUID,
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db=Depends(get_session)
+) -> CoSpaceAccess:
+
+    return await resolve_co_space_access(db, co_space_id, current_user.user_id)
+
+
+# ============================================
+# Internal Endpoints (shared-secret header)
+# ============================================
+
+def require_internal_token(
+    x_internal_token: Optional[str] = Header(default=None)
+):
+
+    # Without a configured token the internal surface does not exist
+    if not settings.INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if not x_internal_token or not secrets.compare_digest(
+        x_internal_token,
+        settings.INTERNAL_API_TOKEN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid internal token"
+        )
@@ -0,0 +1,226 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from app.core.config import settings
+from app.core.query_metrics import current_query_stats
+
+
+# ============================================
+# Request Metrics
+# Labelled by route template ("/co-spaces/{co_space_id}/dashboard"),
+# never the raw path, so label cardinality is bounded by the route table
+# ============================================
+
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Requests handled, by route template and status code",
+    ["method", "route", "status"]
+)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency (until the last body chunk was sent)",
+    ["method", "route"]
+)
+
+# By method only: the route is resolved inside the router, after this
+# middleware has to count the request as started
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests currently being handled",
+    ["method"]
+)
+
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL statements per request",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+HTTP_REQUEST_DB_STATEMENTS = Counter(
+    "http_request_db_statements_total",
+    "SQL statements executed while handling requests",
+    ["method", "route"]
+)
+
+# Observed in app/core/security.py around the bcrypt calls themselves
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "bcrypt time per operation",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+
+def route_template(scope) -> str:
+    """
+    The matched route's path template. The router records the route on
+    the request scope, so this is only meaningful once the app has run.
+    """
+
+    route = scope.get("route")
+
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """
+    Sits inside QueryMetricsMiddleware, so the request's SQL statement
+    stats are still reachable when the request finishes.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+
+        async def send_with_status(message):
+
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+
+            route = route_template(scope)
+            HTTP_REQUEST_SECONDS.labels(method, route).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route, str(status["code"])).inc()
+
+            stats = current_query_stats()
+
+            if stats is not None:
+                HTTP_REQUEST_DB_SECONDS.labels(method, route).observe(stats.seconds)
+                HTTP_REQUEST_DB_STATEMENTS.labels(method, route).inc(stats.statements)
+
+
+# ============================================
+# Collectors For Existing Stats
+# Pool, cache and password-executor counters are already kept by their
+# owners (the same numbers /internal serves); these read them at scrape
+# time instead of duplicating the bookkeeping. describe() is empty so
+# registering them does not call collect() while app.core.database may
+# still be importing.
+# ============================================
+
+class DatabasePoolCollector:
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        from app.core import database
+
+        pools = [database.pool_metrics.snapshot()]
+
+        if database.async_pool_metrics is not None:
+            pools.append(database.async_pool_metrics.snapshot())
+
+        gauges = {
+            "size": "Configured pool size",
+            "checked_out": "Connections currently checked out",
+            "idle": "Connections idle in the pool",
+            "overflow": "Overflow connections currently open",
+        }
+        counters = {
+            "connects": "New DBAPI connections opened",
+            "checkouts": "Connection checkouts",
+            "invalidations": "Connections invalidated",
+            "timeouts": "Checkouts that timed out waiting for a connection",
+            "wait_seconds": "Time spent waiting for a connection",
+        }
+
+        for name, documentation in gauges.items():
+            family = GaugeMetricFamily(f"db_pool_{name}", documentation, labels=["pool"])
+
+            for pool in pools:
+                family.add_metric([pool["name"]], pool[name])
+
+            yield family
+
+        for name, documentation in counters.items():
+            family = CounterMetricFamily(f"db_pool_{name}", documentation, labels=["pool"])
+
+            for pool in pools:
+                family.add_metric(
+                    [pool["name"]],
+                    pool["wait_seconds_total"] if name == "wait_seconds" else pool[name]
+                )
+
+            yield family
+
+
+class CacheCollector:
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        from app.core.cache import registered_caches
+
+        stats = [cache.stats() for cache in registered_caches()]
+
+        size = GaugeMetricFamily("cache_entries", "Entries currently cached", labels=["cache"])
+
+        for cache in stats:
+            size.add_metric([cache["name"]], cache["size"])
+
+        yield size
+
+        for name in ("hits", "misses", "evictions", "expirations", "invalidations", "discarded_loads"):
+            family = CounterMetricFamily(f"cache_{name}", f"Cache {name}", labels=["cache"])
+
+            for cache in stats:
+                family.add_metric([cache["name"]], cache[name])
+
+            yield family
+
+
+class PasswordExecutorCollector:
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        from app.core.password_executor import password_executor
+
+        stats = password_executor.stats()
+
+        yield GaugeMetricFamily(
+            "password_executor_queue_depth",
+            "Password hashing jobs waiting for a worker",
+            value=stats["queue_depth"]
+        )
+        yield GaugeMetricFamily(
+            "password_executor_running",
+            "Password hashing jobs running",
+            value=stats["running"]
+        )
+        yield CounterMetricFamily(
+            "password_executor_rejected",
+            "Password hashing jobs refused with 503 (queue full)",
+            value=stats["rejected"]
+        )
+
+
+for _collector in (DatabasePoolCollector(), CacheCollector(), PasswordExecutorCollector()):
+    REGISTRY.register(_collector)
@@ -0,0 +1,66 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+# ============================================
+# Keyset Cursors
+# A cursor is the (created_at, id) of the last row of a page,
+# listings are ordered newest first on exactly those two columns
+# ============================================
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def after_cursor(created_at_column, id_column, cursor: str):
+    """Filter for the rows following `cursor` in newest-first order."""
+
+    created_at, row_id = decode_cursor(cursor)
+    return tuple_(created_at_column, id_column) < tuple_(created_at, row_id)
+
+
+def paginate(query, created_at_column, id_column, cursor, limit: int):
+    """
+    Applies keyset ordering to an ORM query and returns (rows, next_cursor).
+    One extra row is fetched to know whether another page exists.
+    """
+
+    if cursor:
+        query = query.filter(after_cursor(created_at_column, id_column, cursor))
+
+    rows = query.order_by(
+        created_at_column.desc(),
+        id_column.desc()
+    ).limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+
+    return rows, encode_cursor(
+        getattr(last, created_at_column.key),
+        getattr(last, id_column.key)
+    )
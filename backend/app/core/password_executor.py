@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+from app.core import profiling
+from app.core.config import settings
+from app.core.security import hash_password, verify_password
+
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+# ============================================
+# Bounded Password Executor
+# bcrypt releases the GIL, so a small dedicated thread pool keeps
+# password work off the shared request threadpool. Work beyond
+# workers + max_queue is refused with 503 instead of piling up.
+# ============================================
+
+class PasswordExecutor:
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+
+        self.in_flight = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.run_seconds_total = 0.0
+        self.run_seconds_max = 0.0
+        self.latency_bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def _reserve_slot(self):
+
+        with self._lock:
+            if self.in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication is busy, please retry",
+                    headers={"Retry-After": str(self.retry_after)}
+                )
+
+            self.in_flight += 1
+            self.submitted += 1
+
+    def _run(self, fn, args, queued_at):
+
+        started = time.perf_counter()
+
+        with self._lock:
+            self.running += 1
+            self.wait_seconds_total += started - queued_at
+
+        try:
+            return fn(*args)
+        finally:
+            finished = time.perf_counter()
+            elapsed = finished - started
+            latency = finished - queued_at
+
+            with self._lock:
+                self.running -= 1
+                self.in_flight -= 1
+                self.completed += 1
+                self.run_seconds_total += elapsed
+                self.run_seconds_max = max(self.run_seconds_max, elapsed)
+                self.latency_bucket_counts[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    async def submit(self, fn, *args):
+
+        self._reserve_slot()
+
+        try:
+            future = self._executor.submit(
+                self._run,
+                profiling.bind(fn, "password-hash"),
+                args,
+                time.perf_counter()
+            )
+        except BaseException:
+            with self._lock:
+                self.in_flight -= 1
+            raise
+
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self.in_flight - self.running,
+                "running": self.running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_seconds_avg": round(
+                    self.wait_seconds_total / self.completed, 6
+                ) if self.completed else 0.0,
+                "run_seconds_avg": round(
+                    self.run_seconds_total / self.completed, 6
+                ) if self.completed else 0.0,
+                "run_seconds_max": round(self.run_seconds_max, 6),
+                "latency_buckets": dict(zip(
+                    [str(b) for b in LATENCY_BUCKETS] + ["+Inf"],
+                    self.latency_bucket_counts
+                )),
+            }
+
+
+password_executor = PasswordExecutor(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS
+)
+
+
+# ============================================
+# Async API
+# ============================================
+
+async def hash_password_async(password: str):
+    return await password_executor.submit(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str):
+    return await password_executor.submit(verify_password, plain_password, hashed_password)
@@ -0,0 +1,114 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+
+
+# ============================================
+# Pool Metrics (fed by SQLAlchemy pool events)
+# ============================================
+
+class PoolMetrics:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.engine = None
+
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def attach(self, engine):
+        """
+        Registers the pool event listeners on a sync engine
+        (for an AsyncEngine pass async_engine.sync_engine).
+        """
+        self.engine = engine
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        # engine.dispose() swaps in a fresh pool, so read through the engine's
+        # current pool object rather than a reference kept from startup
+        pool = self.engine.pool if self.engine is not None else None
+
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": pool.size() if pool is not None else 0,
+                "checked_out": pool.checkedout() if pool is not None else 0,
+                "idle": pool.checkedin() if pool is not None else 0,
+                "overflow": max(pool.overflow(), 0) if pool is not None else 0,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_count": self.wait_count,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(
+                    self.wait_seconds_total / self.wait_count, 6
+                ) if self.wait_count else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+# ============================================
+# Pool class with timed checkout
+# There is no "before checkout" pool event, so the time spent waiting
+# for a free connection is measured around the pool's own _do_get
+# ============================================
+
+def instrumented_pool_class(base_pool_class, metrics: PoolMetrics):
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = base_pool_class._do_get(self)
+        except sa_exc.TimeoutError:
+            metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+
+        metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    return type(
+        f"Instrumented{base_pool_class.__name__}",
+        (base_pool_class,),
+        {"_do_get": _do_get}
+    )
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache, invalidate_on_commit
+from app.core.config import settings
+
+
+# ============================================
+# Authenticated Principal
+# The slice of User that request handling needs, safe to share
+# between requests (no session attached)
+# ============================================
+
+@dataclass(frozen=True)
+class AuthenticatedPrincipal:
+    user_id: UUID
+    user_name: str
+    user_email: str
+    user_is_active: bool
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(
+            user_id=user.user_id,
+            user_name=user.user_name,
+            user_email=user.user_email,
+            user_is_active=bool(user.user_is_active)
+        )
+
+
+principal_cache = TTLCache(
+    "principals",
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_principal(db: Session, user_id):
+    invalidate_on_commit(db, principal_cache, str(user_id))
@@ -0,0 +1,334 @@
+import json
+import logging
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+
+from app.core.config import settings
+from app.core.metrics import route_template
+
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# Stacks are attributed to these when any of their frames matches
+CATEGORIES = {
+    "sqlalchemy": lambda path, name: "/sqlalchemy/" in path,
+    "pydantic": lambda path, name: (
+        "/pydantic/" in path
+        or "/pydantic_core/" in path
+        or "/fastapi/encoders.py" in path
+        or name == "serialize_response"
+    ),
+    "bcrypt": lambda path, name: "/passlib/" in path or "/bcrypt/" in path,
+}
+
+
+# ============================================
+# Request Profile
+# A sampler thread reads sys._current_frames() every PROFILE_INTERVAL_MS
+# and keeps the stacks of threads currently working for the request.
+# Those are found through anchors: the middleware's own frame on the
+# event loop thread, and the frame of every function handed to the
+# threadpool, run_sync or the password executor through bind(). A
+# stack counts only while it runs below one of its thread's anchors, so
+# other requests sharing the event loop or a worker thread are left out.
+# Time a coroutine spends suspended (awaiting asyncpg, say) has no stack
+# and so no samples.
+# ============================================
+
+class RequestProfile:
+
+    def __init__(self, method: str, path: str):
+        self.profile_id = uuid.uuid4().hex[:12]
+        self.method = method
+        self.path = path
+        self.started_at = datetime.utcnow()
+        self.interval = settings.PROFILE_INTERVAL_MS / 1000
+        self.stacks = Counter()
+        self.samples = 0
+        self.truncated = False
+
+        self._anchors = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._sample_loop,
+            name=f"profiler-{self.profile_id}",
+            daemon=True
+        )
+
+    @contextmanager
+    def anchor(self, frame, root: str):
+
+        ident = threading.get_ident()
+        key = id(frame)
+
+        with self._lock:
+            self._anchors.setdefault(ident, {})[key] = root
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                anchors = self._anchors[ident]
+                del anchors[key]
+
+                if not anchors:
+                    del self._anchors[ident]
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _sample_loop(self):
+
+        deadline = time.monotonic() + settings.PROFILE_MAX_SECONDS
+
+        while not self._stopped.wait(self.interval):
+
+            if time.monotonic() > deadline:
+                self.truncated = True
+                return
+
+            self._sample()
+
+    def _sample(self):
+
+        with self._lock:
+            anchors = {ident: dict(frames) for ident, frames in self._anchors.items()}
+
+        current = sys._current_frames()
+
+        for ident, frames in anchors.items():
+
+            frame = current.get(ident)
+            codes = []
+
+            while frame is not None:
+
+                root = frames.get(id(frame))
+
+                if root is not None:
+                    self.stacks[(root, tuple(reversed(codes)))] += 1
+                    self.samples += 1
+                    break
+
+                codes.append(frame.f_code)
+                frame = frame.f_back
+
+    # ============================================
+    # Output
+    # <id>.folded: one "root;outer;...;inner count" line per distinct
+    # stack (flamegraph.pl, speedscope, inferno)
+    # <id>.json: the request, sample counts and estimated time per category
+    # ============================================
+
+    def write(self, directory: str, route: str, status_code):
+
+        os.makedirs(directory, exist_ok=True)
+
+        name = f"{self.started_at:%Y%m%dT%H%M%S}-{self.profile_id}"
+        labels = {}
+        folded = []
+        categories = Counter()
+
+        for (root, codes), count in self.stacks.items():
+
+            frames = [labels.get(code) or labels.setdefault(code, _label(code)) for code in codes]
+            folded.append(";".join([root, *frames]) + f" {count}")
+
+            for category, matches in CATEGORIES.items():
+                if any(matches(code.co_filename, code.co_name) for code in codes):
+                    categories[category] += count
+
+        with open(os.path.join(directory, f"{name}.folded"), "w") as handle:
+            handle.write("\n".join(folded) + "\n")
+
+        summary = {
+            "profile_id": self.profile_id,
+            "method": self.method,
+            "path": self.path,
+            "route": route,
+            "status_code": status_code,
+            "started_at": self.started_at.isoformat(timespec="milliseconds"),
+            "duration_ms": round(self.duration * 1000, 2),
+            "interval_ms": settings.PROFILE_INTERVAL_MS,
+            "samples": self.samples,
+            "truncated": self.truncated,
+            "categories": {
+                category: {
+                    "samples": categories[category],
+                    "estimated_ms": round(categories[category] * self.interval * 1000, 2),
+                }
+                for category in CATEGORIES
+            },
+        }
+
+        with open(os.path.join(directory, f"{name}.json"), "w") as handle:
+            json.dump(summary, handle, indent=2)
+
+        _enforce_retention(directory, settings.PROFILE_MAX_FILES)
+
+
+def _label(code) -> str:
+
+    path = code.co_filename
+
+    for marker in ("site-packages/", "dist-packages/", "backend/"):
+        if marker in path:
+            path = path.split(marker, 1)[1]
+            break
+
+    return f"{code.co_name} ({path}:{code.co_firstlineno})"
+
+
+def _enforce_retention(directory: str, max_profiles: int):
+
+    profiles = sorted(
+        (entry for entry in os.scandir(directory) if entry.name.endswith(".folded")),
+        key=lambda entry: entry.stat().st_mtime
+    )
+
+    for entry in profiles[:max(len(profiles) - max_profiles, 0)]:
+        for path in (entry.path, entry.path[:-len(".folded")] + ".json"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+# ============================================
+# Work Handed Off To Other Threads
+# ============================================
+
+_active_profile: ContextVar = ContextVar("request_profile", default=None)
+
+
+def bind(fn, root: str):
+    """
+    Returns fn unchanged unless the current request is being profiled;
+    then a wrapper that anchors the thread it ends up running on. Call
+    it in the request's context, before handing fn to another thread.
+    """
+
+    profile = _active_profile.get()
+
+    if profile is None:
+        return fn
+
+    def profiled(*args, **kwargs):
+        with profile.anchor(sys._getframe(), root):
+            return fn(*args, **kwargs)
+
+    return profiled
+
+
+# ============================================
+# Middleware
+# ============================================
+
+_running = 0
+_running_lock = threading.Lock()
+
+
+def _requested(scope) -> bool:
+
+    if settings.INTERNAL_API_TOKEN:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return secrets.compare_digest(value.decode("latin-1"), settings.INTERNAL_API_TOKEN)
+
+    return settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE
+
+
+def _reserve() -> bool:
+
+    global _running
+
+    with _running_lock:
+        if _running >= settings.PROFILE_MAX_CONCURRENT:
+            return False
+
+        _running += 1
+        return True
+
+
+def _release():
+
+    global _running
+
+    with _running_lock:
+        _running -= 1
+
+
+class ProfilingMiddleware:
+    """
+    Innermost of the app's middleware: the profile covers routing,
+    dependencies, the endpoint and response serialization. Profiled
+    responses carry X-Profile-Id, the name of the files written.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http" or not _requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not _reserve():
+            logger.info("profile skipped, PROFILE_MAX_CONCURRENT reached", extra={"path": scope["path"]})
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"])
+        status = {}
+
+        async def send_with_profile_id(message):
+
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = profile.profile_id
+
+            await send(message)
+
+        token = _active_profile.set(profile)
+        profile.start()
+
+        try:
+            with profile.anchor(sys._getframe(), "request"):
+                await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.stop()
+            _active_profile.reset(token)
+            _release()
+
+        try:
+            await run_in_threadpool(
+                profile.write,
+                settings.PROFILE_DIR,
+                route_template(scope),
+                status.get("code")
+            )
+        except Exception:
+            logger.exception("could not write profile %s", profile.profile_id)
@@ -0,0 +1,200 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_COUNT_HEADER = "X-DB-Statement-Count"
+STATEMENT_TIME_HEADER = "X-DB-Time-Ms"
+
+
+class NPlusOneDetected(Exception):
+    """Raised at the end of a request in strict mode (see QueryMetricsMiddleware)."""
+
+
+# ============================================
+# Per-Request Statement Stats
+# One object per request, reached through a ContextVar. run_in_threadpool
+# and the async engine's greenlets both run inside a copy of the
+# request's context, so statements issued by services land on the same
+# object whichever engine mode is in use.
+# ============================================
+
+# Placeholder lists from expanding IN parameters (?, ?, ...), (%(p_1)s, ...),
+# ($1, $2, ...) collapse to one shape whatever their length
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|\$\d+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RequestQueryStats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.statements = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+        # Set by routes whose repeated statements are batches by design
+        self.repeats_expected = False
+
+    def record(self, statement: str, seconds: float):
+        shape = statement_shape(statement)
+
+        with self._lock:
+            self.statements += 1
+            self.seconds += seconds
+            self.shapes[shape] += 1
+
+    def repeated(self, threshold: int) -> list:
+        with self._lock:
+            return [
+                (shape, count)
+                for shape, count in self.shapes.most_common()
+                if count > threshold
+            ]
+
+
+_current_stats: ContextVar = ContextVar("request_query_stats", default=None)
+
+
+def current_query_stats():
+    return _current_stats.get()
+
+
+def expect_repeated_statements():
+    """
+    Exempts the current request from the N+1 check, for endpoints that
+    repeat one statement per batch on purpose (imports, bulk writes).
+    """
+
+    stats = _current_stats.get()
+
+    if stats is not None:
+        stats.repeats_expected = True
+
+
+# ============================================
+# Engine Instrumentation
+# The start time rides on the statement's execution context, which a
+# failed statement takes with it (after_cursor_execute never runs for
+# one). Cursor executions SQLAlchemy issues without a context go
+# untimed.
+# ============================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current_stats.get() is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+
+    stats = _current_stats.get()
+    started = getattr(context, "_query_started_at", None)
+
+    if stats is None or started is None:
+        return
+
+    stats.record(statement, time.perf_counter() - started)
+
+
+def attach(engine):
+    """Registers the listeners on a sync engine (for an AsyncEngine pass .sync_engine)."""
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ============================================
+# Middleware
+# Statement count and database time go out as response headers (as of
+# the response start, so a streamed body's queries are only in the log)
+# and as structured log fields once the request is done. Statement
+# shapes repeated more than QUERY_N_PLUS_ONE_THRESHOLD times in one
+# request are logged as a likely N+1; with QUERY_N_PLUS_ONE_STRICT the
+# request then fails with NPlusOneDetected, which the test client
+# re-raises. Both settings are read per request, so tests can flip them
+# on the settings object.
+# ============================================
+
+class QueryMetricsMiddleware:
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http" or not settings.QUERY_METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        status = {}
+
+        async def send_with_metrics(message):
+
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers[STATEMENT_COUNT_HEADER] = str(stats.statements)
+                headers[STATEMENT_TIME_HEADER] = f"{stats.seconds * 1000:.2f}"
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _current_stats.reset(token)
+
+        _report(scope, status.get("code"), stats)
+
+
+def _report(scope, status_code, stats: RequestQueryStats):
+
+    fields = {
+        "method": scope.get("method"),
+        "path": scope.get("path"),
+        "status_code": status_code,
+        "db_statements": stats.statements,
+        "db_time_ms": round(stats.seconds * 1000, 2),
+    }
+
+    logger.info("request database usage", extra=fields)
+
+    if stats.repeats_expected:
+        return
+
+    repeated = stats.repeated(settings.QUERY_N_PLUS_ONE_THRESHOLD)
+
+    if not repeated:
+        return
+
+    logger.warning(
+        "repeated statements in one request (likely N+1)",
+        extra={
+            **fields,
+            "repeated_statements": [
+                {"count": count, "statement": shape[:300]}
+                for shape, count in repeated
+            ],
+        }
+    )
+
+    if settings.QUERY_N_PLUS_ONE_STRICT:
+        shape, count = repeated[0]
+        raise NPlusOneDetected(
+            f"{fields['method']} {fields['path']}: statement ran {count} times "
+            f"(threshold {settings.QUERY_N_PLUS_ONE_THRESHOLD}): {shape[:300]}"
+        )
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.cache import get_invalidation_backend, register_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# Response Cache (async, string keys)
+# fresh  (age < ttl):              served from memory
+# stale  (age < ttl + stale_ttl):  served from memory while one background
+#                                  task reloads the entry
+# miss:                            one loader per key; concurrent callers
+#                                  await the same result (single-flight)
+# Invalidation drops the entry outright. A load that was already running
+# when its key was invalidated still answers its callers, but its result
+# is not stored.
+# ============================================
+
+class _Entry:
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+
+    def __init__(self, name: str, maxsize: int, ttl: float, stale_ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+
+        self._data = OrderedDict()
+        # Only keys with a load in flight; bumped by invalidate()
+        self._versions = {}
+        self._inflight = {}
+        self._tasks = set()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.discarded_loads = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+        register_cache(self)
+
+    async def get_or_load(self, key: str, loader):
+        """loader is an async callable taking no arguments."""
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is not None and entry.stale_until <= now:
+                del self._data[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is not None:
+                self._data.move_to_end(key)
+
+                if now < entry.fresh_until:
+                    self.hits += 1
+                    return entry.value
+
+                self.stale_hits += 1
+            elif key in self._inflight:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+
+        if entry is not None:
+            if key not in self._inflight:
+                self._refresh_in_background(key, loader)
+
+            return entry.value
+
+        return await self._load(key, loader)
+
+    async def _load(self, key: str, loader):
+
+        with self._lock:
+            future = self._inflight.get(key)
+
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[key] = future
+                self._versions[key] = 0
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return await asyncio.shield(future)
+
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved; there may be no other caller waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self._store(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                self._versions.pop(key, None)
+
+    def _store(self, key: str, value):
+
+        now = time.monotonic()
+
+        with self._lock:
+            if self._versions.get(key):
+                self.discarded_loads += 1
+                return
+
+            self._data[key] = _Entry(value, now + self.ttl, now + self.ttl + self.stale_ttl)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def _refresh_in_background(self, key: str, loader):
+
+        with self._lock:
+            self.refreshes += 1
+
+        task = asyncio.get_running_loop().create_task(self._refresh(key, loader))
+
+        # The loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: str, loader):
+
+        try:
+            await self._load(key, loader)
+        except Exception:
+            with self._lock:
+                self.refresh_failures += 1
+
+            logger.exception("Background refresh of %s:%s failed", self.name, key)
+
+    def invalidate(self, key: str, broadcast: bool = True):
+
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self.invalidations += 1
+
+            if key in self._versions:
+                self._versions[key] += 1
+
+        if broadcast:
+            get_invalidation_backend().publish(self.name, key)
+
+    def clear(self):
+
+        with self._lock:
+            self._data.clear()
+
+            for key in self._versions:
+                self._versions[key] += 1
+
+    def stats(self) -> dict:
+
+        with self._lock:
+            served = self.hits + self.stale_hits
+            lookups = served + self.misses + self.coalesced
+
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "stale_seconds": self.stale_ttl,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "hit_ratio": round(served / lookups, 4) if lookups else 0.0,
+                "in_flight": len(self._inflight),
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+                "discarded_loads": self.discarded_loads,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,139 @@
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from inspect import isclass
+from types import UnionType
+from typing import Union, get_args, get_origin
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from app.core.config import settings
+
+
+# ============================================
+# orjson Response Class
+# UUID and datetime are native to orjson; Decimal goes out as its string
+# form ("12.30"), the same as Pydantic's JSON mode, so amounts keep their
+# scale whichever path produced the body.
+# ============================================
+
+def _default(value):
+
+    if isinstance(value, Decimal):
+        return str(value)
+
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+# ============================================
+# Trusted Responses
+# Routes whose content comes straight from our own queries can skip
+# response-model validation: the fields the model declares are read off
+# the rows (or dicts) and encoded as they are. Only plain models are
+# supported (no validators, aliases or custom serializers); anything
+# else is refused when the encoder is built, on the first request.
+# ============================================
+
+_SCALARS = (UUID, Decimal, str, int, float, bool, datetime, date)
+
+
+@lru_cache(maxsize=None)
+def _encoder(annotation):
+    """None when orjson can take the value as it is."""
+
+    origin = get_origin(annotation)
+
+    if origin in (Union, UnionType):
+        options = [arg for arg in get_args(annotation) if arg is not type(None)]
+
+        if len(options) != 1:
+            raise TypeError(f"{annotation!r} has no trusted encoding")
+
+        inner = _encoder(options[0])
+
+        if inner is None:
+            return None
+
+        return lambda value: None if value is None else inner(value)
+
+    if origin is list:
+        inner = _encoder(get_args(annotation)[0])
+
+        if inner is None:
+            return list
+
+        return lambda values: [inner(value) for value in values]
+
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return _model_encoder(annotation)
+
+    if annotation in _SCALARS:
+        return None
+
+    raise TypeError(f"{annotation!r} has no trusted encoding")
+
+
+def _model_encoder(model):
+
+    fields = [
+        (name, _encoder(field.annotation))
+        for name, field in model.model_fields.items()
+    ]
+
+    def encode(row):
+
+        if isinstance(row, dict):
+            return {
+                name: row[name] if encode_field is None else encode_field(row[name])
+                for name, encode_field in fields
+            }
+
+        return {
+            name: getattr(row, name) if encode_field is None else encode_field(getattr(row, name))
+            for name, encode_field in fields
+        }
+
+    return encode
+
+
+def trusted_response(response_model, content, response: Response = None):
+    """
+    Encodes content (ORM rows, dicts or model instances) as response_model
+    (a model or list[model]) without validating it. Headers already set
+    on the route's injected `response` are carried over.
+
+    With FAST_JSON_RESPONSES off, content is returned unchanged and goes
+    through the route's response_model as usual.
+    """
+
+    if not settings.FAST_JSON_RESPONSES:
+        return content
+
+    encode = _encoder(response_model)
+    trusted = FastJSONResponse(content if encode is None else encode(content))
+
+    if response is not None:
+        trusted.raw_headers.extend(
+            (name, value)
+            for name, value in response.raw_headers
+            if name != b"content-length"
+        )
+
+    return trusted
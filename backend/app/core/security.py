@@ -7,6 +7,7 @@ from fastapi import HTTPException, status
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 from app.core.config import settings
+from app.core.metrics import PASSWORD_HASH_SECONDS
 
 SECRET_KEY = settings.JWT_SECRET_KEY
 ALGORITHM = settings.JWT_ALGORITHM
@@ -18,12 +19,14 @@ if not SECRET_KEY:
 
 # Hash password
 def hash_password(password: str):
-    return pwd_context.hash(password)
+    with PASSWORD_HASH_SECONDS.labels("hash").time():
+        return pwd_context.hash(password)
 
 
 # Verify password
 def verify_password(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
+    with PASSWORD_HASH_SECONDS.labels("verify").time():
+        return pwd_context.verify(plain_password, hashed_password)
 
 
 # Create JWT token
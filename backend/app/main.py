@@ -1,19 +1,51 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Response
+from fastapi.datastructures import Default
+from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import GZipMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from app.core.config import settings
+from app.core.dependencies import require_internal_token
+from app.core.metrics import PrometheusMiddleware
+from app.core.profiling import ProfilingMiddleware
+from app.core.responses import FastJSONResponse
+from app.core.query_metrics import QueryMetricsMiddleware
 from app.api.user_routes import router as user_router
 from app.api.fund_routes import router as fund_router
 from app.api.co_space_routes import router as co_space_router
 from app.api.expense_routes import router as expense_router
 from app.api.approval_routes import router as approval_router
 from app.api.dashboard_routes import router as dashboard_router
+from app.api.spending_routes import router as spending_router
 from app.api.auth_routes import router as auth_router
+from app.api.internal_routes import router as internal_router
 
 
 app = FastAPI(
     title="Collaborative Fund-Based Expense Management System",
     description="Backend APIs with Approval Workflow & AI Integration",
-    version="1.0.0"
+    version="1.0.0",
+    # Wrapped in Default() so routes with a response_model keep FastAPI's
+    # direct Pydantic-to-JSON path; only the rest go through orjson
+    default_response_class=Default(
+        FastJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
+    )
 )
 
+# Innermost first: PrometheusMiddleware runs inside QueryMetricsMiddleware
+# so it can read the request's SQL stats
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(PrometheusMiddleware)
+app.add_middleware(QueryMetricsMiddleware)
+
+# Outermost: compresses whatever the rest produced (already-gzipped
+# exports are left alone)
+if settings.GZIP_ENABLED:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compresslevel=settings.GZIP_COMPRESS_LEVEL
+    )
+
 app.include_router(auth_router)
 app.include_router(user_router)
 app.include_router(fund_router)
@@ -21,6 +53,19 @@ app.include_router(co_space_router)
 app.include_router(expense_router)
 app.include_router(approval_router)
 app.include_router(dashboard_router)
+app.include_router(spending_router)
+app.include_router(internal_router)
+
+
+# Same secret as /internal (scrape with the X-Internal-Token header);
+# pool, cache and per-route timings are not for the public
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_internal_token)])
+def metrics():
+
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DECIMAL, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, DECIMAL, Integer, TIMESTAMP, ForeignKey, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -22,8 +22,21 @@ class CoSpaceFund(Base):
     )
 
     co_space_fund_total_amount = Column(DECIMAL(15, 2), default=0)
+    # Running totals that are never reset at period boundaries; per-month
+    # figures come from the spending-period buckets
     co_space_fund_monthly_expense_total = Column(DECIMAL(15, 2), default=0)
     co_space_fund_yearly_expense_total = Column(DECIMAL(15, 2), default=0)
     co_space_fund_remaining_amount = Column(DECIMAL(15, 2), default=0)
 
     co_space_fund_updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    # Optimistic concurrency: ORM updates check and bump it; bulk UPDATEs
+    # must bump it themselves
+    co_space_fund_version = Column(Integer, nullable=False, server_default=text("1"))
+
+    __table_args__ = (
+        # One fund per member per co-space
+        UniqueConstraint("co_space_id", "user_id", name="uq_co_space_funds_co_space_user"),
+    )
+
+    __mapper_args__ = {"version_id_col": co_space_fund_version}
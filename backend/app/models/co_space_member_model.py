@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -24,3 +24,23 @@ class CoSpaceMember(Base):
     co_space_member_status = Column(String, nullable=False)
     co_space_member_joined_at = Column(TIMESTAMP, server_default=func.now())
     co_space_member_updated_at = Column(TIMESTAMP, onupdate=func.now())
+
+    __table_args__ = (
+        # One membership row per user per co-space (membership checks)
+        UniqueConstraint("co_space_id", "user_id", name="uq_co_space_members_co_space_user"),
+
+        # Accepted members of a co-space
+        Index(
+            "ix_co_space_members_co_space_status",
+            "co_space_id",
+            "co_space_member_status",
+            "user_id"
+        ),
+
+        # Co-spaces of a user
+        Index(
+            "ix_co_space_members_user_status",
+            "user_id",
+            "co_space_member_status"
+        ),
+    )
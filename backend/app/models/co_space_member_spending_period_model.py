@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DECIMAL, Integer, SmallInteger, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class CoSpaceMemberSpendingPeriod(Base):
+    """
+    One member's share of a co-space's approved expenses in one calendar
+    month, bucketed by the expense's created_at.
+    """
+
+    __tablename__ = "co_space_member_spending_periods"
+
+    co_space_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("co_spaces.co_space_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.user_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    period_year = Column(SmallInteger, primary_key=True)
+    period_month = Column(SmallInteger, primary_key=True)
+
+    co_space_member_spending_period_total = Column(DECIMAL(15, 2), nullable=False, default=0)
+    co_space_member_spending_period_expense_count = Column(Integer, nullable=False, default=0)
+
+    co_space_member_spending_period_updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, DECIMAL, Integer, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class CoSpaceRollup(Base):
+    __tablename__ = "co_space_rollups"
+
+    co_space_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("co_spaces.co_space_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    co_space_rollup_total_contribution = Column(DECIMAL(15, 2), nullable=False, default=0)
+    co_space_rollup_total_remaining = Column(DECIMAL(15, 2), nullable=False, default=0)
+    co_space_rollup_total_spent = Column(DECIMAL(15, 2), nullable=False, default=0)
+
+    # Expenses of this co-space still awaiting approval
+    co_space_rollup_pending_count = Column(Integer, nullable=False, default=0)
+
+    # Members holding a CoSpaceFund row in this co-space
+    co_space_rollup_member_count = Column(Integer, nullable=False, default=0)
+
+    co_space_rollup_updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, VARCHAR, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, VARCHAR, TIMESTAMP, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
 
@@ -23,3 +23,26 @@ class ExpenseApproval(Base):
     expense_approval_status = Column(VARCHAR, nullable=False)
 
     expense_approval_responded_at = Column(TIMESTAMP, nullable=True)
+
+    __table_args__ = (
+        # One approval per approver per expense (also serves the
+        # approve/reject lookup by expense_id + user_id)
+        UniqueConstraint("expense_id", "user_id", name="uq_expense_approvals_expense_user"),
+
+        # Pending approvals per approver (dashboard count, pending listing)
+        Index(
+            "ix_expense_approvals_user_pending",
+            "user_id",
+            "expense_id",
+            postgresql_where=text("expense_approval_status = 'pending'"),
+            sqlite_where=text("expense_approval_status = 'pending'")
+        ),
+
+        # Approvals still pending on an expense (finalization check)
+        Index(
+            "ix_expense_approvals_expense_pending",
+            "expense_id",
+            postgresql_where=text("expense_approval_status = 'pending'"),
+            sqlite_where=text("expense_approval_status = 'pending'")
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DECIMAL, TEXT, VARCHAR, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, DECIMAL, TEXT, VARCHAR, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -37,3 +37,43 @@ class Expense(Base):
 
     expense_created_at = Column(TIMESTAMP, server_default=func.now())
     expense_updated_at = Column(TIMESTAMP, onupdate=func.now())
+
+    # History listings (newest first per payer / per co-space). The filter
+    # columns are INCLUDEd so a filtered page is found with an index-only
+    # scan; only the rows of the page are then read from the table.
+    __table_args__ = (
+        Index(
+            "ix_expenses_payer_created",
+            "expense_payer_user_id",
+            "expense_created_at",
+            "expense_id",
+            postgresql_include=[
+                "expense_status",
+                "expense_from_fund_type",
+                "expense_is_for_type",
+                "expense_related_user_id",
+                "expense_amount",
+            ]
+        ),
+        Index(
+            "ix_expenses_co_space_created",
+            "co_space_id",
+            "expense_created_at",
+            "expense_id",
+            postgresql_include=[
+                "expense_status",
+                "expense_from_fund_type",
+                "expense_is_for_type",
+                "expense_related_user_id",
+                "expense_amount",
+            ]
+        ),
+
+        # Pending expenses per co-space (rollup rebuild, pending counts)
+        Index(
+            "ix_expenses_co_space_pending",
+            "co_space_id",
+            postgresql_where=text("expense_status = 'pending'"),
+            sqlite_where=text("expense_status = 'pending'")
+        ),
+    )
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, BigInteger, DECIMAL, Integer, VARCHAR, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class FundBalanceSnapshot(Base):
+    """
+    A fund's balance as of every ledger entry up to through_entry_id. The
+    latest snapshot plus the entries after it give the ledger balance.
+    """
+
+    __tablename__ = "fund_balance_snapshots"
+
+    fund_ledger_fund_type = Column(VARCHAR, primary_key=True)
+    fund_ledger_fund_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    through_entry_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=False
+    )
+
+    fund_balance_snapshot_total_amount = Column(DECIMAL(15, 2), nullable=False)
+    fund_balance_snapshot_remaining_amount = Column(DECIMAL(15, 2), nullable=False)
+
+    fund_balance_snapshot_created_at = Column(TIMESTAMP, server_default=func.now())
@@ -0,0 +1,58 @@
+from sqlalchemy import Column, BigInteger, DECIMAL, Integer, VARCHAR, TIMESTAMP, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class FundLedgerEntry(Base):
+    """
+    One movement of a user fund or co-space fund. Rows are only ever
+    inserted. The ids increase with insertion order, so "everything after
+    a snapshot" is an id range.
+
+    fund_type is "user" (fund_id = user_funds.user_id) or "co_space"
+    (fund_id = co_space_funds.co_space_fund_id). Neither fund_id nor
+    expense_id is a foreign key, so the history outlives the rows it
+    describes.
+    """
+
+    __tablename__ = "fund_ledger_entries"
+
+    # BIGSERIAL on Postgres; SQLite only autoincrements INTEGER keys
+    fund_ledger_entry_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True
+    )
+
+    fund_ledger_fund_type = Column(VARCHAR, nullable=False)
+    fund_ledger_fund_id = Column(UUID(as_uuid=True), nullable=False)
+
+    # opening | deposit | adjustment | expense
+    fund_ledger_entry_type = Column(VARCHAR, nullable=False)
+
+    # Signed changes to the fund's total and remaining amounts
+    fund_ledger_total_delta = Column(DECIMAL(15, 2), nullable=False, default=0)
+    fund_ledger_remaining_delta = Column(DECIMAL(15, 2), nullable=False, default=0)
+
+    expense_id = Column(UUID(as_uuid=True), nullable=True)
+
+    # now(): the transaction's start on Postgres, not the insert. Entries
+    # can commit out of id order, which is why snapshot rounds go by
+    # transaction visibility and never by this column.
+    fund_ledger_created_at = Column(TIMESTAMP, server_default=func.now())
+
+    # Per-fund id ranges (balance tails, snapshot rounds); the deltas are
+    # INCLUDEd so a tail is summed with an index-only scan
+    __table_args__ = (
+        Index(
+            "ix_fund_ledger_entries_fund",
+            "fund_ledger_fund_type",
+            "fund_ledger_fund_id",
+            "fund_ledger_entry_id",
+            postgresql_include=[
+                "fund_ledger_total_delta",
+                "fund_ledger_remaining_delta",
+            ]
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DECIMAL, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, DECIMAL, Integer, TIMESTAMP, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -14,8 +14,16 @@ class UserFund(Base):
     )
 
     user_fund_total_amount = Column(DECIMAL(15, 2), default=0)
+    # Running totals that are never reset at period boundaries; per-month
+    # figures come from the spending-period buckets
     user_fund_monthly_expense_total = Column(DECIMAL(15, 2), default=0)
     user_fund_yearly_expense_total = Column(DECIMAL(15, 2), default=0)
     user_fund_remaining_amount = Column(DECIMAL(15, 2), default=0)
 
     user_fund_updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    # Optimistic concurrency: ORM updates check and bump it; bulk UPDATEs
+    # must bump it themselves
+    user_fund_version = Column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": user_fund_version}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, TIMESTAMP
+from sqlalchemy import Column, String, Integer, Boolean, TIMESTAMP, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -18,3 +18,9 @@ class User(Base):
     user_updated_at = Column(TIMESTAMP, onupdate=func.now())
     user_password = Column(String, nullable=False)
 
+    # Optimistic concurrency, and what the profile ETag is built from
+    # (user_updated_at can repeat within a second)
+    user_version = Column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": user_version}
+
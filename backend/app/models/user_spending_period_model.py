@@ -0,0 +1,28 @@
+from sqlalchemy import Column, DECIMAL, Integer, SmallInteger, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class UserSpendingPeriod(Base):
+    """
+    Personal spending of one user in one calendar month, bucketed by the
+    expense's created_at. Period reports sum buckets instead of scanning
+    expenses.
+    """
+
+    __tablename__ = "user_spending_periods"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.user_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    period_year = Column(SmallInteger, primary_key=True)
+    period_month = Column(SmallInteger, primary_key=True)
+
+    user_spending_period_total = Column(DECIMAL(15, 2), nullable=False, default=0)
+    user_spending_period_expense_count = Column(Integer, nullable=False, default=0)
+
+    user_spending_period_updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
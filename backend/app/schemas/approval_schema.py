@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
+
+from app.core.config import settings
 
 
 # ============================================
@@ -34,3 +36,25 @@ class PendingApprovalResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ============================================
+# Batch Approve / Reject
+# ============================================
+
+class ExpenseBatchRequest(BaseModel):
+    expense_ids: List[UUID] = Field(min_length=1, max_length=settings.APPROVAL_BATCH_MAX_SIZE)
+
+
+class ExpenseBatchItemResult(BaseModel):
+    expense_id: UUID
+    succeeded: bool
+    # The expense's status after the batch (None when it does not exist)
+    expense_status: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ExpenseBatchResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[ExpenseBatchItemResult]
@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from decimal import Decimal
 
+from app.core.config import settings
+
 
 class CoSpaceCreate(BaseModel):
     co_space_name: str
@@ -34,6 +36,24 @@ class CoSpaceMemberResponse(BaseModel):
         from_attributes = True
 
 
+class BulkMembersRequest(BaseModel):
+    user_ids: List[UUID] = Field(min_length=1, max_length=settings.CO_SPACE_BULK_MEMBERS_MAX_SIZE)
+
+
+class BulkMemberItemResult(BaseModel):
+    user_id: UUID
+    succeeded: bool
+    # The membership's status after the request (None when there is none)
+    co_space_member_status: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkMembersResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkMemberItemResult]
+
+
 class CoSpaceFundCreate(BaseModel):
     user_id: UUID
     co_space_fund_total_amount: Decimal
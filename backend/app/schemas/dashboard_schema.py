@@ -28,6 +28,8 @@ class CoSpaceMemberSummary(BaseModel):
     user_id: UUID
     total_contributed: Decimal
     remaining_amount: Decimal
+    monthly_expense_total: Decimal
+    yearly_expense_total: Decimal
 
 
 class CoSpaceDashboardResponse(BaseModel):
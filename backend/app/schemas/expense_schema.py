@@ -1,7 +1,8 @@
 from pydantic import BaseModel
 from uuid import UUID
 from decimal import Decimal
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
 
 class ExpenseCreate(BaseModel):
@@ -22,3 +23,49 @@ class ExpenseResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ExpenseHistoryItem(BaseModel):
+    expense_id: UUID
+    expense_payer_user_id: UUID
+    co_space_id: Optional[UUID]
+    expense_amount: Decimal
+    expense_message: Optional[str]
+    expense_from_fund_type: str
+    expense_is_for_type: str
+    expense_related_user_id: Optional[UUID]
+    expense_status: str
+    expense_created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# History filters, taken from the query string (used with Depends())
+class ExpenseHistoryFilters(BaseModel):
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    expense_status: Optional[str] = None
+    expense_from_fund_type: Optional[str] = None
+    expense_is_for_type: Optional[str] = None
+    expense_related_user_id: Optional[UUID] = None
+    min_amount: Optional[Decimal] = None
+    max_amount: Optional[Decimal] = None
+
+
+# Bulk import: same fields as ExpenseCreate, plus the original date
+class ExpenseImportRow(ExpenseCreate):
+    expense_created_at: Optional[datetime] = None
+
+
+class ExpenseImportError(BaseModel):
+    row: Optional[int]
+    errors: List[str]
+
+
+class ExpenseImportResult(BaseModel):
+    imported: int
+    failed: int
+    batches: int
+    errors: List[ExpenseImportError]
+    errors_truncated: bool
@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+from uuid import UUID
+from decimal import Decimal
+from typing import List
+
+
+# ============================================
+# User Spending (per calendar month)
+# ============================================
+
+class SpendingPeriod(BaseModel):
+    period: str
+    total: Decimal
+    expense_count: int
+
+
+class UserSpendingResponse(BaseModel):
+    from_period: str
+    to_period: str
+    total: Decimal
+    expense_count: int
+    periods: List[SpendingPeriod]
+
+
+# ============================================
+# Co-Space Spending (member shares per calendar month)
+# ============================================
+
+class MemberSpending(BaseModel):
+    user_id: UUID
+    total: Decimal
+    expense_count: int
+
+
+class CoSpaceSpendingPeriod(BaseModel):
+    period: str
+    total: Decimal
+    members: List[MemberSpending]
+
+
+class CoSpaceSpendingResponse(BaseModel):
+    from_period: str
+    to_period: str
+    total: Decimal
+    periods: List[CoSpaceSpendingPeriod]
+    members: List[MemberSpending]
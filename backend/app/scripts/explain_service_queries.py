@@ -0,0 +1,314 @@
+"""
+Print the query plans of the service hot-path queries.
+
+    python -m app.scripts.explain_service_queries             # plans as the schema stands
+    python -m app.scripts.explain_service_queries --compare   # before/after the migration indexes
+    python -m app.scripts.explain_service_queries --analyze   # EXPLAIN ANALYZE (Postgres, runs the queries)
+
+--compare explains every query twice: once with the indexes added by
+migrations 0003/0004 dropped ("before") and once as the schema stands
+("after"). The drops happen inside a transaction that is rolled back,
+but on Postgres DROP INDEX holds an exclusive lock on the table until
+then, so run --compare against a copy or staging database. On SQLite
+unique constraints cannot be dropped, so they stay in place for "before".
+
+Sample ids are taken from existing rows where possible, so point it at a
+database with realistic data.
+"""
+
+import argparse
+import sys
+import uuid
+
+from sqlalchemy import and_, create_engine, event, func, select, text
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.models.co_space_fund_model import CoSpaceFund
+from app.models.co_space_member_model import CoSpaceMember
+from app.models.expense_approval_model import ExpenseApproval
+from app.models.expense_model import Expense
+
+
+# (name, table, is_unique_constraint) added by migrations 0003 / 0004
+MIGRATION_INDEXES = [
+    ("ix_expenses_payer_created", "expenses", False),
+    ("ix_expenses_co_space_created", "expenses", False),
+    ("ix_expenses_co_space_pending", "expenses", False),
+    ("ix_expense_approvals_user_pending", "expense_approvals", False),
+    ("ix_expense_approvals_expense_pending", "expense_approvals", False),
+    ("ix_co_space_members_co_space_status", "co_space_members", False),
+    ("ix_co_space_members_user_status", "co_space_members", False),
+    ("uq_expense_approvals_expense_user", "expense_approvals", True),
+    ("uq_co_space_members_co_space_user", "co_space_members", True),
+    ("uq_co_space_funds_co_space_user", "co_space_funds", True),
+]
+
+
+# ============================================
+# Engine
+# A private engine without the request statement_timeout. For SQLite,
+# pysqlite's implicit transaction handling is replaced by an explicit
+# BEGIN so the DROP INDEX statements of --compare really roll back.
+# ============================================
+
+def _engine():
+
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+
+    if engine.dialect.name == "sqlite":
+
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+# ============================================
+# Service Queries
+# Mirrors of the statements the services issue, built with sample ids
+# ============================================
+
+def _sample_ids(connection) -> dict:
+
+    approval = connection.execute(
+        select(ExpenseApproval.expense_id, ExpenseApproval.user_id).limit(1)
+    ).first()
+    member = connection.execute(
+        select(CoSpaceMember.co_space_id, CoSpaceMember.user_id).limit(1)
+    ).first()
+
+    return {
+        "user_id": approval.user_id if approval else uuid.uuid4(),
+        "expense_id": approval.expense_id if approval else uuid.uuid4(),
+        "co_space_id": member.co_space_id if member else uuid.uuid4(),
+        "member_user_id": member.user_id if member else uuid.uuid4(),
+    }
+
+
+def service_queries(ids: dict) -> list:
+
+    return [
+        (
+            "dashboard_service.get_user_dashboard: pending approval count",
+            select(func.count()).select_from(ExpenseApproval).where(
+                ExpenseApproval.user_id == ids["user_id"],
+                ExpenseApproval.expense_approval_status == "pending"
+            )
+        ),
+        (
+            "dashboard_service.get_user_dashboard: recent expenses",
+            select(Expense).where(
+                Expense.expense_payer_user_id == ids["user_id"]
+            ).order_by(Expense.expense_created_at.desc()).limit(5)
+        ),
+        (
+            "approval_service.get_pending_approvals",
+            select(Expense).join(
+                ExpenseApproval,
+                ExpenseApproval.expense_id == Expense.expense_id
+            ).where(
+                ExpenseApproval.user_id == ids["user_id"],
+                ExpenseApproval.expense_approval_status == "pending",
+                Expense.expense_status == "pending"
+            ).order_by(
+                Expense.expense_created_at.desc(),
+                Expense.expense_id.desc()
+            ).limit(51)
+        ),
+        (
+            "approval_service.approve_expense: approval lookup",
+            select(ExpenseApproval).where(
+                ExpenseApproval.expense_id == ids["expense_id"],
+                ExpenseApproval.user_id == ids["user_id"]
+            ).limit(1)
+        ),
+        (
+            "approval_service.approve_expense: other pending approvals",
+            select(ExpenseApproval).where(
+                ExpenseApproval.expense_id == ids["expense_id"],
+                ExpenseApproval.user_id != ids["user_id"],
+                ExpenseApproval.expense_approval_status == "pending"
+            ).limit(1)
+        ),
+        (
+            "approval_service._deduct_co_space_expense: member funds",
+            select(
+                CoSpaceFund.co_space_fund_id,
+                CoSpaceFund.co_space_fund_remaining_amount
+            ).join(
+                CoSpaceMember,
+                and_(
+                    CoSpaceMember.co_space_id == CoSpaceFund.co_space_id,
+                    CoSpaceMember.user_id == CoSpaceFund.user_id
+                )
+            ).where(
+                CoSpaceFund.co_space_id == ids["co_space_id"],
+                CoSpaceMember.co_space_member_status == "accepted"
+            ).order_by(CoSpaceFund.user_id)
+        ),
+        (
+            "co_space_service.get_accepted_membership",
+            select(CoSpaceMember).where(
+                CoSpaceMember.co_space_id == ids["co_space_id"],
+                CoSpaceMember.user_id == ids["member_user_id"],
+                CoSpaceMember.co_space_member_status == "accepted"
+            ).limit(1)
+        ),
+        (
+            "co_space_service.get_members / expense_service.create_expense: accepted members",
+            select(CoSpaceMember).where(
+                CoSpaceMember.co_space_id == ids["co_space_id"],
+                CoSpaceMember.co_space_member_status == "accepted"
+            )
+        ),
+        (
+            "co_space_service.get_user_co_spaces: memberships",
+            select(CoSpaceMember).where(
+                CoSpaceMember.user_id == ids["member_user_id"],
+                CoSpaceMember.co_space_member_status == "accepted"
+            )
+        ),
+        (
+            "co_space_service.add_co_space_fund: member fund",
+            select(CoSpaceFund).where(
+                CoSpaceFund.co_space_id == ids["co_space_id"],
+                CoSpaceFund.user_id == ids["member_user_id"]
+            ).limit(1)
+        ),
+        (
+            "rollup_service.compute_co_space_rollups: pending expenses",
+            select(Expense.co_space_id, func.count()).where(
+                Expense.co_space_id == ids["co_space_id"],
+                Expense.expense_status == "pending"
+            ).group_by(Expense.co_space_id)
+        ),
+        (
+            "expense_service.get_user_expenses: history page",
+            select(Expense.expense_id, Expense.expense_created_at).where(
+                Expense.expense_payer_user_id == ids["user_id"],
+                Expense.expense_status == "approved"
+            ).order_by(
+                Expense.expense_created_at.desc(),
+                Expense.expense_id.desc()
+            ).limit(51)
+        ),
+        (
+            "expense_service.get_co_space_expenses: history page",
+            select(Expense.expense_id, Expense.expense_created_at).where(
+                Expense.co_space_id == ids["co_space_id"]
+            ).order_by(
+                Expense.expense_created_at.desc(),
+                Expense.expense_id.desc()
+            ).limit(51)
+        ),
+    ]
+
+
+# ============================================
+# EXPLAIN
+# ============================================
+
+def explain(connection, statement, analyze: bool) -> str:
+
+    dialect = connection.dialect
+    sql = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+    if dialect.name == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+        rows = connection.exec_driver_sql(prefix + sql).all()
+        return "\n".join(row[0] for row in rows)
+
+    if dialect.name == "sqlite":
+        rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + sql).all()
+        return "\n".join(row[-1] for row in rows)
+
+    raise NotImplementedError(f"EXPLAIN is not supported on {dialect.name}")
+
+
+def _drop_migration_indexes(connection):
+
+    dropped = []
+    postgres = connection.dialect.name == "postgresql"
+
+    for name, table, is_constraint in MIGRATION_INDEXES:
+
+        exists = connection.execute(
+            text("SELECT 1 FROM pg_indexes WHERE indexname = :name")
+            if postgres else
+            text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"),
+            {"name": name}
+        ).first()
+
+        if not exists:
+            continue
+
+        if is_constraint and postgres:
+            connection.exec_driver_sql(f"ALTER TABLE {table} DROP CONSTRAINT {name}")
+        elif not is_constraint:
+            connection.exec_driver_sql(f"DROP INDEX {name}")
+        else:
+            continue
+
+        dropped.append(name)
+
+    return dropped
+
+
+def _indexes_used(plan: str) -> list:
+    return [name for name, _, _ in MIGRATION_INDEXES if name in plan]
+
+
+def main(argv=None) -> int:
+
+    parser = argparse.ArgumentParser(description="Explain the service hot-path queries")
+    parser.add_argument("--compare", action="store_true", help="also explain without the migration indexes")
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE on Postgres")
+    args = parser.parse_args(argv)
+
+    engine = _engine()
+
+    with engine.connect() as connection:
+
+        ids = _sample_ids(connection)
+        queries = service_queries(ids)
+        connection.rollback()
+
+        before = {}
+
+        if args.compare:
+            with connection.begin() as transaction:
+                dropped = _drop_migration_indexes(connection)
+
+                for name, statement in queries:
+                    before[name] = explain(connection, statement, args.analyze)
+
+                transaction.rollback()
+
+            print(f"'before' plans without: {', '.join(dropped) or 'nothing (indexes not present)'}\n")
+
+        for name, statement in queries:
+            after = explain(connection, statement, args.analyze)
+
+            print(f"== {name}")
+
+            if args.compare:
+                print("-- before")
+                print(before[name])
+                print("-- after")
+
+            print(after)
+            print(f"-- indexes used: {', '.join(_indexes_used(after)) or 'none of the migration indexes'}\n")
+
+        connection.rollback()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+Recompute co_space_rollups from the base tables and verify them.
+
+    python -m app.scripts.rebuild_co_space_rollups          # rewrite drifted rows
+    python -m app.scripts.rebuild_co_space_rollups --check  # verify only
+
+Run it once after migration 0002_co_space_rollups (to backfill existing
+co-spaces) and whenever a check reports drift. Exits with status 1 when --check
+finds a mismatch. Run it while writes are quiet: a rollup changed between
+the recompute and the rewrite would be overwritten with the older value.
+"""
+
+import argparse
+import sys
+
+from app.core.database import SessionLocal
+from app.services.rollup_service import rebuild_co_space_rollups
+
+
+def main(argv=None) -> int:
+
+    parser = argparse.ArgumentParser(description="Rebuild and verify co-space rollups")
+    parser.add_argument("--check", action="store_true", help="only verify, do not write")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+
+    try:
+        mismatches = rebuild_co_space_rollups(db, check_only=args.check)
+    finally:
+        db.close()
+
+    for mismatch in mismatches:
+        print(
+            f"{mismatch['co_space_id']}: stored={mismatch['stored']} "
+            f"expected={mismatch['expected']}"
+        )
+
+    action = "drifted" if args.check else "rewritten"
+    print(f"{len(mismatches)} co-space rollup(s) {action}")
+
+    return 1 if args.check and mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
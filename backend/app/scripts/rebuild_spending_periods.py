@@ -0,0 +1,48 @@
+"""
+Recompute the spending-period buckets from the base tables and verify them.
+
+    python -m app.scripts.rebuild_spending_periods          # rewrite drifted buckets
+    python -m app.scripts.rebuild_spending_periods --check  # verify only
+
+Run it once after migration 0005_spending_periods (to backfill history)
+and whenever a check reports drift. Exits with status 1 when --check
+finds a mismatch. Personal buckets are recomputed exactly; co-space
+member buckets replay each approved expense's split over the co-space's
+current members, so co-spaces whose membership changed report drift that
+a rewrite would only approximate. Run it while writes are quiet.
+"""
+
+import argparse
+import sys
+
+from app.core.database import SessionLocal
+from app.services.spending_period_service import rebuild_spending_periods
+
+
+def main(argv=None) -> int:
+
+    parser = argparse.ArgumentParser(description="Rebuild and verify spending-period buckets")
+    parser.add_argument("--check", action="store_true", help="only verify, do not write")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+
+    try:
+        mismatches = rebuild_spending_periods(db, check_only=args.check)
+    finally:
+        db.close()
+
+    for mismatch in mismatches:
+        print(
+            f"{mismatch['kind']} {mismatch['key']}: stored={mismatch['stored']} "
+            f"expected={mismatch['expected']}"
+        )
+
+    action = "drifted" if args.check else "rewritten"
+    print(f"{len(mismatches)} spending bucket(s) {action}")
+
+    return 1 if args.check and mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
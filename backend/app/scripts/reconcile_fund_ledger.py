@@ -0,0 +1,45 @@
+"""
+Check every stored fund balance against the ledger.
+
+    python -m app.scripts.reconcile_fund_ledger
+
+Compares the total and remaining amounts of each user fund and co-space
+fund with its ledger balance (latest snapshot plus later entries) and
+prints the funds that disagree. Exits with status 1 on any mismatch.
+Read-only; movements committed while it runs may show up as transient
+mismatches, so re-check before acting on one.
+"""
+
+import argparse
+import sys
+
+from app.core.database import SessionLocal
+from app.services.fund_ledger_service import reconcile_fund_balances
+
+
+def main(argv=None) -> int:
+
+    parser = argparse.ArgumentParser(description="Reconcile fund balances with the ledger")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="funds compared per round trip")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+
+    try:
+        mismatches = reconcile_fund_balances(db, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+
+    for mismatch in mismatches:
+        print(
+            f"{mismatch['fund_type']} {mismatch['fund_id']}: "
+            f"stored={mismatch['stored']} ledger={mismatch['ledger']}"
+        )
+
+    print(f"{len(mismatches)} fund(s) out of balance")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
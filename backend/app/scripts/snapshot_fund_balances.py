@@ -0,0 +1,43 @@
+"""
+Take a round of fund balance snapshots from the ledger.
+
+    python -m app.scripts.snapshot_fund_balances
+    python -m app.scripts.snapshot_fund_balances --wait-seconds 10
+
+Schedule it (e.g. every few minutes from cron): each round snapshots
+only the funds that moved since the previous one, and the ledger balance
+of a fund is its latest snapshot plus the entries after it, so the
+interval bounds that tail. A round waits up to --wait-seconds (default
+FUND_SNAPSHOT_WAIT_SECONDS) for transactions that were writing ledger
+entries when it started; if they are still open, it writes nothing and
+leaves their entries to the next round.
+"""
+
+import argparse
+import sys
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.fund_ledger_service import take_balance_snapshots
+
+
+def main(argv=None) -> int:
+
+    parser = argparse.ArgumentParser(description="Snapshot fund balances from the ledger")
+    parser.add_argument("--wait-seconds", type=float, default=settings.FUND_SNAPSHOT_WAIT_SECONDS)
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+
+    try:
+        written, through = take_balance_snapshots(db, args.wait_seconds)
+    finally:
+        db.close()
+
+    print(f"{written} fund snapshot(s) written through ledger entry {through}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,149 @@
+from sqlalchemy import and_, case, func, literal, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from fastapi import HTTPException
 from datetime import datetime
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
 
+from app.core.pagination import paginate
 from app.models.expense_model import Expense
 from app.models.expense_approval_model import ExpenseApproval
 from app.models.user_fund_model import UserFund
 from app.models.co_space_fund_model import CoSpaceFund
 from app.models.co_space_member_model import CoSpaceMember
+from app.services.dashboard_cache import (
+    invalidate_co_space_dashboard,
+    invalidate_user_dashboards
+)
+from app.services.fund_ledger_service import (
+    CO_SPACE_FUND,
+    USER_FUND,
+    fund_movement,
+    record_fund_movements
+)
+from app.services.rollup_service import apply_co_space_rollup_delta
+from app.services.spending_period_service import (
+    add_co_space_member_spending,
+    add_co_space_member_spending_buckets,
+    add_user_spending,
+    equal_split,
+    period_of
+)
+
+
+# ============================================
+# Co-Space Fund Deduction (Set-Based)
+# One locking read of every accepted member's fund, ordered by user_id so
+# concurrent finalizations lock rows in the same order, then one UPDATE
+# applying the equal split (remainder on the first member). Returns each
+# member's share by user_id.
+# ============================================
+
+def _deduct_co_space_expense(db: Session, expense):
+
+    accepted_member_count = select(func.count()).where(
+        CoSpaceMember.co_space_id == expense.co_space_id,
+        CoSpaceMember.co_space_member_status == "accepted"
+    ).correlate(None).scalar_subquery()
+
+    member_funds = db.execute(
+        select(
+            CoSpaceFund.co_space_fund_id,
+            CoSpaceFund.user_id,
+            CoSpaceFund.co_space_fund_remaining_amount,
+            accepted_member_count.label("accepted_member_count")
+        )
+        .join(
+            CoSpaceMember,
+            and_(
+                CoSpaceMember.co_space_id == CoSpaceFund.co_space_id,
+                CoSpaceMember.user_id == CoSpaceFund.user_id
+            )
+        )
+        .where(
+            CoSpaceFund.co_space_id == expense.co_space_id,
+            CoSpaceMember.co_space_member_status == "accepted"
+        )
+        .order_by(CoSpaceFund.user_id)
+        .with_for_update(of=CoSpaceFund)
+    ).all()
+
+    if not member_funds:
+        has_members = db.execute(
+            select(accepted_member_count)
+        ).scalar()
+
+        if not has_members:
+            raise HTTPException(
+                status_code=400,
+                detail="No accepted members in co-space"
+            )
+
+        raise HTTPException(
+            status_code=400,
+            detail="Member fund not initialized"
+        )
+
+    if len(member_funds) < member_funds[0].accepted_member_count:
+        raise HTTPException(
+            status_code=400,
+            detail="Member fund not initialized"
+        )
+
+    total_pool_remaining = sum(
+        (row.co_space_fund_remaining_amount for row in member_funds),
+        Decimal("0.00")
+    )
+
+    # Only block if TOTAL pool insufficient
+    if total_pool_remaining < expense.expense_amount:
+        raise HTTPException(
+            status_code=400,
+            detail="Insufficient total co-space funds"
+        )
+
+    shares = equal_split(expense.expense_amount, len(member_funds))
+
+    # Equal split for everyone (negative allowed), remainder adjusted on
+    # the first member to preserve the exact total
+    amount_type = CoSpaceFund.co_space_fund_remaining_amount.type
+    share = case(
+        (
+            CoSpaceFund.co_space_fund_id == member_funds[0].co_space_fund_id,
+            literal(shares[0], amount_type)
+        ),
+        else_=literal(shares[-1], amount_type)
+    )
+
+    db.execute(
+        update(CoSpaceFund)
+        .where(CoSpaceFund.co_space_fund_id.in_(
+            [row.co_space_fund_id for row in member_funds]
+        ))
+        .values(
+            co_space_fund_remaining_amount=CoSpaceFund.co_space_fund_remaining_amount - share,
+            co_space_fund_monthly_expense_total=CoSpaceFund.co_space_fund_monthly_expense_total + share,
+            co_space_fund_yearly_expense_total=CoSpaceFund.co_space_fund_yearly_expense_total + share,
+            co_space_fund_version=CoSpaceFund.co_space_fund_version + 1
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    record_fund_movements(db, [
+        fund_movement(
+            CO_SPACE_FUND,
+            row.co_space_fund_id,
+            "expense",
+            remaining_delta=-member_share,
+            expense_id=expense.expense_id
+        )
+        for row, member_share in zip(member_funds, shares)
+    ])
+
+    return {
+        row.user_id: member_share
+        for row, member_share in zip(member_funds, shares)
+    }
 
 
 # ============================================
@@ -18,10 +154,12 @@ def approve_expense(db: Session, expense_id, user_id):
 
     try:
 
-        # Ensure expense exists
+        # Ensure expense exists; the row lock serializes concurrent
+        # responses to one expense, so exactly one of them sees no other
+        # approval pending and finalizes it
         expense = db.query(Expense).filter(
             Expense.expense_id == expense_id
-        ).first()
+        ).with_for_update().first()
 
         if not expense:
             raise HTTPException(status_code=404, detail="Expense not found")
@@ -54,9 +192,16 @@ def approve_expense(db: Session, expense_id, user_id):
         approval.expense_approval_status = "approved"
         approval.expense_approval_responded_at = datetime.utcnow()
 
-        # Check if any approvals still pending
+        invalidate_user_dashboards(db, user_id)
+
+        # Written before the check: where FOR UPDATE is a no-op (SQLite) the
+        # write lock is what orders concurrent approvers
+        db.flush()
+
+        # Check if any other approvals still pending
         pending = db.query(ExpenseApproval).filter(
             ExpenseApproval.expense_id == expense_id,
+            ExpenseApproval.expense_approval_id != approval.expense_approval_id,
             ExpenseApproval.expense_approval_status == "pending"
         ).first()
 
@@ -88,71 +233,53 @@ def approve_expense(db: Session, expense_id, user_id):
                 fund.user_fund_monthly_expense_total += expense.expense_amount
                 fund.user_fund_yearly_expense_total += expense.expense_amount
 
+                record_fund_movements(db, [fund_movement(
+                    USER_FUND,
+                    fund.user_id,
+                    "expense",
+                    remaining_delta=-expense.expense_amount,
+                    expense_id=expense.expense_id
+                )])
+
+                add_user_spending(
+                    db,
+                    expense.expense_payer_user_id,
+                    {period_of(expense.expense_created_at): (expense.expense_amount, 1)}
+                )
+
             # ============================================
             # CO-SPACE FUND DEDUCTION
             # ============================================
 
             elif expense.expense_from_fund_type == "co_space":
 
-                members = db.query(CoSpaceMember).filter(
-                    CoSpaceMember.co_space_id == expense.co_space_id,
-                    CoSpaceMember.co_space_member_status == "accepted"
-                ).all()
-
-                if not members:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="No accepted members in co-space"
-                    )
-
-                member_funds = []
-                total_pool_remaining = Decimal("0.00")
-
-                for member in members:
-                    fund = db.query(CoSpaceFund).filter(
-                        CoSpaceFund.co_space_id == expense.co_space_id,
-                        CoSpaceFund.user_id == member.user_id
-                    ).first()
-
-                    if not fund:
-                        raise HTTPException(
-                            status_code=400,
-                            detail="Member fund not initialized"
-                        )
-
-                    total_pool_remaining += fund.co_space_fund_remaining_amount
-                    member_funds.append(fund)
-
-                # Only block if TOTAL pool insufficient
-                if total_pool_remaining < expense.expense_amount:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="Insufficient total co-space funds"
-                    )
+                shares = _deduct_co_space_expense(db, expense)
 
-                total_members = len(member_funds)
-
-                raw_split = expense.expense_amount / Decimal(total_members)
+                add_co_space_member_spending(
+                    db,
+                    expense.co_space_id,
+                    expense.expense_created_at,
+                    shares
+                )
 
-                rounded_split = raw_split.quantize(
-                    Decimal("0.01"),
-                    rounding=ROUND_HALF_UP
+            if expense.co_space_id:
+                pool_spent = (
+                    expense.expense_amount
+                    if expense.expense_from_fund_type == "co_space"
+                    else Decimal("0.00")
                 )
 
-                total_rounded = rounded_split * total_members
-                remainder = expense.expense_amount - total_rounded
+                apply_co_space_rollup_delta(
+                    db,
+                    expense.co_space_id,
+                    total_remaining=-pool_spent,
+                    total_spent=pool_spent,
+                    pending_count=-1
+                )
 
-                # Deduct equal split (negative allowed)
-                for fund in member_funds:
-                    fund.co_space_fund_remaining_amount -= rounded_split
-                    fund.co_space_fund_monthly_expense_total += rounded_split
-                    fund.co_space_fund_yearly_expense_total += rounded_split
+                invalidate_co_space_dashboard(db, expense.co_space_id)
 
-                # Adjust remainder to first member to preserve exact total
-                if remainder != Decimal("0.00"):
-                    member_funds[0].co_space_fund_remaining_amount -= remainder
-                    member_funds[0].co_space_fund_monthly_expense_total += remainder
-                    member_funds[0].co_space_fund_yearly_expense_total += remainder
+            invalidate_user_dashboards(db, expense.expense_payer_user_id)
 
             expense.expense_status = "approved"
 
@@ -161,7 +288,7 @@ def approve_expense(db: Session, expense_id, user_id):
 
         return approval
 
-    except HTTPException:
+    except (HTTPException, StaleDataError):
         db.rollback()
         raise
     except Exception:
@@ -180,9 +307,11 @@ def reject_expense(db: Session, expense_id, user_id):
 
     try:
 
+        # Locked like in approve_expense, so a rejection cannot interleave
+        # with a finalizing approval
         expense = db.query(Expense).filter(
             Expense.expense_id == expense_id
-        ).first()
+        ).with_for_update().first()
 
         if not expense:
             raise HTTPException(status_code=404, detail="Expense not found")
@@ -215,6 +344,12 @@ def reject_expense(db: Session, expense_id, user_id):
 
         expense.expense_status = "rejected"
 
+        invalidate_user_dashboards(db, user_id)
+
+        if expense.co_space_id:
+            apply_co_space_rollup_delta(db, expense.co_space_id, pending_count=-1)
+            invalidate_co_space_dashboard(db, expense.co_space_id)
+
         db.commit()
         db.refresh(approval)
 
@@ -232,25 +367,524 @@ def reject_expense(db: Session, expense_id, user_id):
 
 
 # ============================================
-# Get Pending Approvals (Identity Enforced)
+# Batch Approve / Reject
+# The batch's expenses are locked once (in id order, so overlapping
+# batches lock in the same order) and validated in memory; approvals,
+# expense statuses, fund balances, ledger entries, spending buckets and
+# rollups are then written with one set-based statement each (rollups:
+# one per co-space). Items that fail are reported individually and leave
+# no trace; the rest commit together.
 # ============================================
 
-def get_pending_approvals(db: Session, user_id):
+def _batch_failure(expense_id, error, expense=None):
+    return {
+        "expense_id": expense_id,
+        "succeeded": False,
+        "expense_status": expense.expense_status if expense else None,
+        "error": error,
+    }
+
+
+def _batch_success(expense_id, expense_status):
+    return {
+        "expense_id": expense_id,
+        "succeeded": True,
+        "expense_status": expense_status,
+        "error": None,
+    }
+
+
+def _batch_result(expense_ids, results: dict) -> dict:
+
+    ordered = [results[expense_id] for expense_id in expense_ids]
+    succeeded = sum(1 for item in ordered if item["succeeded"])
+
+    return {
+        "succeeded": succeeded,
+        "failed": len(ordered) - succeeded,
+        "results": ordered,
+    }
+
+
+def _load_batch(db: Session, expense_ids, user_id):
+    """
+    Returns (valid_expenses, failures): the expenses this user can still
+    respond to, oldest first, and a result entry for every other id.
+    """
+
+    expenses = {
+        expense.expense_id: expense
+        for expense in db.execute(
+            select(Expense)
+            .where(Expense.expense_id.in_(expense_ids))
+            .order_by(Expense.expense_id)
+            .with_for_update()
+        ).scalars()
+    }
+
+    approval_status = dict(db.execute(
+        select(
+            ExpenseApproval.expense_id,
+            ExpenseApproval.expense_approval_status
+        ).where(
+            ExpenseApproval.expense_id.in_(expense_ids),
+            ExpenseApproval.user_id == user_id
+        )
+    ).all())
 
-    approvals = db.query(ExpenseApproval).filter(
-        ExpenseApproval.user_id == user_id,
-        ExpenseApproval.expense_approval_status == "pending"
-    ).all()
+    valid = []
+    failures = {}
 
-    pending_expenses = []
+    for expense_id in expense_ids:
 
-    for approval in approvals:
-        expense = db.query(Expense).filter(
-            Expense.expense_id == approval.expense_id,
-            Expense.expense_status == "pending"
-        ).first()
+        expense = expenses.get(expense_id)
+
+        if not expense:
+            failures[expense_id] = _batch_failure(expense_id, "Expense not found")
+        elif expense.expense_status != "pending":
+            failures[expense_id] = _batch_failure(expense_id, "Expense is not pending approval", expense)
+        elif expense_id not in approval_status:
+            failures[expense_id] = _batch_failure(expense_id, "Approval record not found", expense)
+        elif approval_status[expense_id] != "pending":
+            failures[expense_id] = _batch_failure(expense_id, "Approval already processed", expense)
+        else:
+            valid.append(expense)
+
+    valid.sort(key=lambda expense: (expense.expense_created_at, expense.expense_id))
+
+    return valid, failures
+
+
+def _finalize_personal_batch(db: Session, expenses, movements: list) -> dict:
+    """
+    Deducts personal-fund expenses from their payers' funds (one locked
+    read, one UPDATE). Returns {expense_id: error} for those that could
+    not be paid.
+    """
+
+    errors = {}
+
+    if not expenses:
+        return errors
+
+    remaining = dict(db.execute(
+        select(UserFund.user_id, UserFund.user_fund_remaining_amount)
+        .where(UserFund.user_id.in_({expense.expense_payer_user_id for expense in expenses}))
+        .order_by(UserFund.user_id)
+        .with_for_update()
+    ).all())
+
+    debits = {}
+    periods = {}
+
+    for expense in expenses:
+
+        payer = expense.expense_payer_user_id
+
+        if payer not in remaining:
+            errors[expense.expense_id] = "User fund not found"
+            continue
+
+        if remaining[payer] < expense.expense_amount:
+            errors[expense.expense_id] = "Insufficient personal funds"
+            continue
+
+        remaining[payer] -= expense.expense_amount
+        debits[payer] = debits.get(payer, Decimal("0.00")) + expense.expense_amount
+
+        period = periods.setdefault(payer, {})
+        total, count = period.get(period_of(expense.expense_created_at), (Decimal("0.00"), 0))
+        period[period_of(expense.expense_created_at)] = (total + expense.expense_amount, count + 1)
+
+        movements.append(fund_movement(
+            USER_FUND,
+            payer,
+            "expense",
+            remaining_delta=-expense.expense_amount,
+            expense_id=expense.expense_id
+        ))
+
+    if debits:
+        amount_type = UserFund.user_fund_remaining_amount.type
+        debit = case(
+            {payer: literal(amount, amount_type) for payer, amount in debits.items()},
+            value=UserFund.user_id
+        )
+
+        db.execute(
+            update(UserFund)
+            .where(UserFund.user_id.in_(debits))
+            .values(
+                user_fund_remaining_amount=UserFund.user_fund_remaining_amount - debit,
+                user_fund_monthly_expense_total=UserFund.user_fund_monthly_expense_total + debit,
+                user_fund_yearly_expense_total=UserFund.user_fund_yearly_expense_total + debit,
+                user_fund_version=UserFund.user_fund_version + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    for payer, amounts in periods.items():
+        add_user_spending(db, payer, amounts)
+
+    return errors
+
+
+def _finalize_co_space_batch(db: Session, expenses, movements: list) -> dict:
+    """
+    Splits co-space expenses over each co-space's accepted members, like
+    _deduct_co_space_expense: one locked read of every member fund of the
+    batch's co-spaces, then one UPDATE applying each fund's summed shares.
+    Expenses are paid oldest first until a pool runs out. Returns
+    {expense_id: error} for those that could not be paid.
+    """
+
+    errors = {}
+
+    if not expenses:
+        return errors
+
+    co_space_ids = {expense.co_space_id for expense in expenses}
+
+    accepted_counts = dict(db.execute(
+        select(CoSpaceMember.co_space_id, func.count())
+        .where(
+            CoSpaceMember.co_space_id.in_(co_space_ids),
+            CoSpaceMember.co_space_member_status == "accepted"
+        )
+        .group_by(CoSpaceMember.co_space_id)
+    ).all())
+
+    funds_by_space = {}
+
+    for row in db.execute(
+        select(
+            CoSpaceFund.co_space_fund_id,
+            CoSpaceFund.co_space_id,
+            CoSpaceFund.user_id,
+            CoSpaceFund.co_space_fund_remaining_amount
+        )
+        .join(
+            CoSpaceMember,
+            and_(
+                CoSpaceMember.co_space_id == CoSpaceFund.co_space_id,
+                CoSpaceMember.user_id == CoSpaceFund.user_id
+            )
+        )
+        .where(
+            CoSpaceFund.co_space_id.in_(co_space_ids),
+            CoSpaceMember.co_space_member_status == "accepted"
+        )
+        .order_by(CoSpaceFund.co_space_id, CoSpaceFund.user_id)
+        .with_for_update(of=CoSpaceFund)
+    ):
+        funds_by_space.setdefault(row.co_space_id, []).append(row)
+
+    pools = {
+        co_space_id: sum((row.co_space_fund_remaining_amount for row in funds), Decimal("0.00"))
+        for co_space_id, funds in funds_by_space.items()
+    }
+
+    debits = {}
+    buckets = {}
+
+    for expense in expenses:
+
+        co_space_id = expense.co_space_id
+        funds = funds_by_space.get(co_space_id, [])
+
+        if not accepted_counts.get(co_space_id):
+            errors[expense.expense_id] = "No accepted members in co-space"
+            continue
+
+        if len(funds) < accepted_counts[co_space_id]:
+            errors[expense.expense_id] = "Member fund not initialized"
+            continue
+
+        if pools[co_space_id] < expense.expense_amount:
+            errors[expense.expense_id] = "Insufficient total co-space funds"
+            continue
 
-        if expense:
-            pending_expenses.append(expense)
+        pools[co_space_id] -= expense.expense_amount
+        year, month = period_of(expense.expense_created_at)
 
-    return pending_expenses
+        for row, share in zip(funds, equal_split(expense.expense_amount, len(funds))):
+
+            debits[row.co_space_fund_id] = debits.get(row.co_space_fund_id, Decimal("0.00")) + share
+
+            key = (co_space_id, row.user_id, year, month)
+            total, count = buckets.get(key, (Decimal("0.00"), 0))
+            buckets[key] = (total + share, count + 1)
+
+            movements.append(fund_movement(
+                CO_SPACE_FUND,
+                row.co_space_fund_id,
+                "expense",
+                remaining_delta=-share,
+                expense_id=expense.expense_id
+            ))
+
+    if debits:
+        amount_type = CoSpaceFund.co_space_fund_remaining_amount.type
+        debit = case(
+            {fund_id: literal(amount, amount_type) for fund_id, amount in debits.items()},
+            value=CoSpaceFund.co_space_fund_id
+        )
+
+        db.execute(
+            update(CoSpaceFund)
+            .where(CoSpaceFund.co_space_fund_id.in_(debits))
+            .values(
+                co_space_fund_remaining_amount=CoSpaceFund.co_space_fund_remaining_amount - debit,
+                co_space_fund_monthly_expense_total=CoSpaceFund.co_space_fund_monthly_expense_total + debit,
+                co_space_fund_yearly_expense_total=CoSpaceFund.co_space_fund_yearly_expense_total + debit,
+                co_space_fund_version=CoSpaceFund.co_space_fund_version + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    add_co_space_member_spending_buckets(db, buckets)
+
+    return errors
+
+
+def _apply_batch_rollups(db: Session, expenses):
+
+    deltas = {}
+
+    for expense in expenses:
+
+        if not expense.co_space_id:
+            continue
+
+        spent, count = deltas.get(expense.co_space_id, (Decimal("0.00"), 0))
+
+        if expense.expense_from_fund_type == "co_space":
+            spent += expense.expense_amount
+
+        deltas[expense.co_space_id] = (spent, count + 1)
+
+    for co_space_id, (spent, count) in deltas.items():
+        apply_co_space_rollup_delta(
+            db,
+            co_space_id,
+            total_remaining=-spent,
+            total_spent=spent,
+            pending_count=-count
+        )
+        invalidate_co_space_dashboard(db, co_space_id)
+
+
+def approve_expenses(db: Session, expense_ids, user_id):
+
+    try:
+
+        expense_ids = list(dict.fromkeys(expense_ids))
+        candidates, results = _load_batch(db, expense_ids, user_id)
+
+        candidate_ids = [expense.expense_id for expense in candidates]
+
+        # An expense is finalized by this batch when no one else's
+        # approval is still pending
+        awaiting_others = set()
+
+        if candidates:
+            # Written before the check, as in approve_expense: where FOR
+            # UPDATE is a no-op (SQLite) the write lock is what orders this
+            # batch against concurrent approvers of the same expenses
+            db.execute(
+                update(ExpenseApproval)
+                .where(
+                    ExpenseApproval.expense_id.in_(candidate_ids),
+                    ExpenseApproval.user_id == user_id,
+                    ExpenseApproval.expense_approval_status == "pending"
+                )
+                .values(
+                    expense_approval_status="approved",
+                    expense_approval_responded_at=datetime.utcnow()
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+            awaiting_others = set(db.execute(
+                select(ExpenseApproval.expense_id).where(
+                    ExpenseApproval.expense_id.in_(candidate_ids),
+                    ExpenseApproval.user_id != user_id,
+                    ExpenseApproval.expense_approval_status == "pending"
+                ).distinct()
+            ).scalars())
+
+        finalizing = [
+            expense for expense in candidates
+            if expense.expense_id not in awaiting_others
+        ]
+
+        movements = []
+        errors = _finalize_personal_batch(
+            db,
+            [expense for expense in finalizing if expense.expense_from_fund_type == "personal"],
+            movements
+        )
+        errors.update(_finalize_co_space_batch(
+            db,
+            [expense for expense in finalizing if expense.expense_from_fund_type == "co_space"],
+            movements
+        ))
+
+        approved = [expense for expense in candidates if expense.expense_id not in errors]
+        finalized = [expense for expense in finalizing if expense.expense_id not in errors]
+
+        for expense in candidates:
+            if expense.expense_id in errors:
+                results[expense.expense_id] = _batch_failure(
+                    expense.expense_id,
+                    errors[expense.expense_id],
+                    expense
+                )
+
+        if errors:
+            # Failed items leave no trace: their approvals go back to pending
+            db.execute(
+                update(ExpenseApproval)
+                .where(
+                    ExpenseApproval.expense_id.in_(list(errors)),
+                    ExpenseApproval.user_id == user_id
+                )
+                .values(
+                    expense_approval_status="pending",
+                    expense_approval_responded_at=None
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        if approved:
+            invalidate_user_dashboards(db, user_id)
+
+        if finalized:
+            db.execute(
+                update(Expense)
+                .where(Expense.expense_id.in_([expense.expense_id for expense in finalized]))
+                .values(expense_status="approved")
+                .execution_options(synchronize_session=False)
+            )
+
+            record_fund_movements(db, movements)
+            _apply_batch_rollups(db, finalized)
+            invalidate_user_dashboards(db, *{expense.expense_payer_user_id for expense in finalized})
+
+        finalized_ids = {expense.expense_id for expense in finalized}
+
+        for expense in approved:
+            results[expense.expense_id] = _batch_success(
+                expense.expense_id,
+                "approved" if expense.expense_id in finalized_ids else "pending"
+            )
+
+        db.commit()
+
+        return _batch_result(expense_ids, results)
+
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception:
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail="Batch approval processing failed"
+        )
+
+
+def reject_expenses(db: Session, expense_ids, user_id):
+
+    try:
+
+        expense_ids = list(dict.fromkeys(expense_ids))
+        rejected, results = _load_batch(db, expense_ids, user_id)
+
+        if rejected:
+            rejected_ids = [expense.expense_id for expense in rejected]
+
+            db.execute(
+                update(ExpenseApproval)
+                .where(
+                    ExpenseApproval.expense_id.in_(rejected_ids),
+                    ExpenseApproval.user_id == user_id
+                )
+                .values(
+                    expense_approval_status="rejected",
+                    expense_approval_responded_at=datetime.utcnow()
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.execute(
+                update(Expense)
+                .where(Expense.expense_id.in_(rejected_ids))
+                .values(expense_status="rejected")
+                .execution_options(synchronize_session=False)
+            )
+
+            pending_by_space = {}
+
+            for expense in rejected:
+                if expense.co_space_id:
+                    pending_by_space[expense.co_space_id] = pending_by_space.get(expense.co_space_id, 0) + 1
+
+            for co_space_id, count in pending_by_space.items():
+                apply_co_space_rollup_delta(db, co_space_id, pending_count=-count)
+                invalidate_co_space_dashboard(db, co_space_id)
+
+            invalidate_user_dashboards(db, user_id)
+
+        for expense in rejected:
+            results[expense.expense_id] = _batch_success(expense.expense_id, "rejected")
+
+        db.commit()
+
+        return _batch_result(expense_ids, results)
+
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception:
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail="Batch rejection processing failed"
+        )
+
+
+# ============================================
+# Get Pending Approvals (Identity Enforced)
+# ============================================
+
+def get_pending_approvals(
+    db: Session,
+    user_id,
+    co_space_id=None,
+    cursor=None,
+    limit=50
+):
+    """
+    One join over approvals and expenses, newest first, keyset paginated.
+    Returns (expenses, next_cursor).
+    """
+
+    query = db.query(Expense).join(
+        ExpenseApproval,
+        ExpenseApproval.expense_id == Expense.expense_id
+    ).filter(
+        ExpenseApproval.user_id == user_id,
+        ExpenseApproval.expense_approval_status == "pending",
+        Expense.expense_status == "pending"
+    )
+
+    if co_space_id:
+        query = query.filter(Expense.co_space_id == co_space_id)
+
+    return paginate(
+        query,
+        Expense.expense_created_at,
+        Expense.expense_id,
+        cursor,
+        limit
+    )
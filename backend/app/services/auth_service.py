@@ -1,24 +1,30 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
+from app.core.database import run_db, run_db_and_release
+from app.core.password_executor import hash_password_async, verify_password_async
 from app.models.user_model import User
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import create_access_token
 import uuid
 
 
-def signup(db: Session, data):
+# ============================================
+# Session helpers (run through run_db)
+# ============================================
 
-    existing_user = db.query(User).filter(
-        User.user_email == data.user_email
+def _get_user_by_email(db: Session, user_email):
+
+    return db.query(User).filter(
+        User.user_email == user_email
     ).first()
 
-    if existing_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
+
+def _create_user(db: Session, user_name, user_email, hashed_password):
 
     new_user = User(
         user_id=uuid.uuid4(),
-        user_name=data.user_name,
-        user_email=data.user_email,
-        user_password=hash_password(data.user_password),
+        user_name=user_name,
+        user_email=user_email,
+        user_password=hashed_password,
         user_is_active=True
     )
 
@@ -26,6 +32,33 @@ def signup(db: Session, data):
     db.commit()
     db.refresh(new_user)
 
+    return new_user
+
+
+# ============================================
+# Signup / Login
+# bcrypt runs on the bounded password executor, never inside the
+# session call or on the shared request threadpool, and no pooled
+# connection is held while a request waits for it
+# ============================================
+
+async def signup(db, data):
+
+    existing_user = await run_db_and_release(db, _get_user_by_email, data.user_email)
+
+    if existing_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    hashed_password = await hash_password_async(data.user_password)
+
+    new_user = await run_db(
+        db,
+        _create_user,
+        data.user_name,
+        data.user_email,
+        hashed_password
+    )
+
     access_token = create_access_token(
         {"sub": str(new_user.user_id)}
     )
@@ -33,16 +66,19 @@ def signup(db: Session, data):
     return {"access_token": access_token}
 
 
-def login(db: Session, data):
+async def login(db, data):
 
-    user = db.query(User).filter(
-        User.user_email == data.user_email
-    ).first()
+    user = await run_db_and_release(db, _get_user_by_email, data.user_email)
 
     if not user:
         raise HTTPException(status_code=400, detail="Invalid credentials")
 
-    if not verify_password(data.user_password, user.user_password):
+    password_ok = await verify_password_async(
+        data.user_password,
+        user.user_password
+    )
+
+    if not password_ok:
         raise HTTPException(status_code=400, detail="Invalid credentials")
 
     access_token = create_access_token(
@@ -1,12 +1,18 @@
 import uuid
+from sqlalchemy import and_, select, update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from decimal import Decimal
 
+from app.core.co_space_access import CoSpaceAccess, invalidate_co_space_access
+from app.core.database import dialect_insert
 from app.models.co_space_model import CoSpace
 from app.models.co_space_member_model import CoSpaceMember
 from app.models.user_model import User
 from app.models.co_space_fund_model import CoSpaceFund
+from app.services.dashboard_cache import invalidate_co_space_dashboard
+from app.services.fund_ledger_service import CO_SPACE_FUND, fund_movement, record_fund_movements
+from app.services.rollup_service import apply_co_space_rollup_delta
 
 
 # ============================================
@@ -39,6 +45,12 @@ def create_co_space(db: Session, data, creator_user_id):
 
     db.add(new_space)
     db.add(creator_member)
+    db.flush()
+
+    apply_co_space_rollup_delta(db, co_space_id)
+
+    invalidate_co_space_access(db, co_space_id, creator_user_id)
+
     db.commit()
     db.refresh(new_space)
 
@@ -65,6 +77,54 @@ def get_user_co_spaces(db: Session, user_id):
     return spaces
 
 
+# ============================================
+# Lookups Used By Routes (Admin / Membership Checks)
+# ============================================
+
+def get_co_space(db: Session, co_space_id):
+
+    return db.query(CoSpace).filter(
+        CoSpace.co_space_id == co_space_id
+    ).first()
+
+
+def get_accepted_membership(db: Session, co_space_id, user_id):
+
+    return db.query(CoSpaceMember).filter(
+        CoSpaceMember.co_space_id == co_space_id,
+        CoSpaceMember.user_id == user_id,
+        CoSpaceMember.co_space_member_status == "accepted"
+    ).first()
+
+
+def load_co_space_access(db: Session, co_space_id, user_id) -> CoSpaceAccess:
+
+    # Co-space and the user's membership row in one round trip
+    row = db.execute(
+        select(
+            CoSpace.co_space_created_by_user_id,
+            CoSpaceMember.co_space_member_status
+        )
+        .select_from(CoSpace)
+        .outerjoin(
+            CoSpaceMember,
+            and_(
+                CoSpaceMember.co_space_id == CoSpace.co_space_id,
+                CoSpaceMember.user_id == user_id
+            )
+        )
+        .where(CoSpace.co_space_id == co_space_id)
+    ).first()
+
+    return CoSpaceAccess(
+        co_space_id=co_space_id,
+        user_id=user_id,
+        co_space_exists=row is not None,
+        member_status=row.co_space_member_status if row else None,
+        is_admin=row is not None and row.co_space_created_by_user_id == user_id
+    )
+
+
 # ============================================
 # Invite Member (Admin Only - route enforces admin)
 # ============================================
@@ -99,6 +159,9 @@ def invite_member(db: Session, co_space_id, invited_user_id):
     )
 
     db.add(member)
+
+    invalidate_co_space_access(db, co_space_id, invited_user_id)
+
     db.commit()
     db.refresh(member)
 
@@ -127,12 +190,158 @@ def accept_invite(db: Session, co_space_id, user_id):
 
     member.co_space_member_status = "accepted"
 
+    invalidate_co_space_access(db, co_space_id, user_id)
+
     db.commit()
     db.refresh(member)
 
     return member
 
 
+# ============================================
+# Bulk Invite / Accept (Admin Only - route enforces admin)
+# Users and existing memberships are checked with one IN query each and
+# the new rows are written with one statement, whatever the list size.
+# Each user gets a result; the valid ones commit together.
+# ============================================
+
+def _bulk_item(user_id, status=None, error=None):
+    return {
+        "user_id": user_id,
+        "succeeded": error is None,
+        "co_space_member_status": status,
+        "error": error,
+    }
+
+
+def _bulk_result(user_ids, results: dict) -> dict:
+
+    ordered = [results[user_id] for user_id in user_ids]
+    succeeded = sum(1 for item in ordered if item["succeeded"])
+
+    return {
+        "succeeded": succeeded,
+        "failed": len(ordered) - succeeded,
+        "results": ordered,
+    }
+
+
+def bulk_invite_members(db: Session, co_space_id, user_ids):
+
+    user_ids = list(dict.fromkeys(user_ids))
+    results = {}
+
+    known_users = set(db.execute(
+        select(User.user_id).where(User.user_id.in_(user_ids))
+    ).scalars())
+
+    memberships = dict(db.execute(
+        select(CoSpaceMember.user_id, CoSpaceMember.co_space_member_status).where(
+            CoSpaceMember.co_space_id == co_space_id,
+            CoSpaceMember.user_id.in_(user_ids)
+        )
+    ).all())
+
+    to_invite = []
+
+    for user_id in user_ids:
+        if user_id not in known_users:
+            results[user_id] = _bulk_item(user_id, error="User not found")
+        elif user_id in memberships:
+            results[user_id] = _bulk_item(
+                user_id,
+                memberships[user_id],
+                "User already invited or member"
+            )
+        else:
+            to_invite.append(user_id)
+
+    if to_invite:
+        # A concurrent invite for the same user is reported as a duplicate
+        # instead of failing the whole request on the unique constraint
+        invited = set(db.execute(
+            dialect_insert(db, CoSpaceMember)
+            .values([
+                {
+                    "co_space_member_id": uuid.uuid4(),
+                    "co_space_id": co_space_id,
+                    "user_id": user_id,
+                    "co_space_member_status": "pending",
+                }
+                for user_id in to_invite
+            ])
+            .on_conflict_do_nothing(
+                index_elements=[CoSpaceMember.co_space_id, CoSpaceMember.user_id]
+            )
+            .returning(CoSpaceMember.user_id)
+        ).scalars())
+
+        invalidate_co_space_access(db, co_space_id, *invited)
+
+        for user_id in to_invite:
+            if user_id in invited:
+                results[user_id] = _bulk_item(user_id, "pending")
+            else:
+                results[user_id] = _bulk_item(user_id, error="User already invited or member")
+
+    db.commit()
+
+    return _bulk_result(user_ids, results)
+
+
+def bulk_accept_members(db: Session, co_space_id, user_ids):
+
+    user_ids = list(dict.fromkeys(user_ids))
+    results = {}
+
+    memberships = dict(db.execute(
+        select(CoSpaceMember.user_id, CoSpaceMember.co_space_member_status).where(
+            CoSpaceMember.co_space_id == co_space_id,
+            CoSpaceMember.user_id.in_(user_ids)
+        )
+    ).all())
+
+    to_accept = []
+
+    for user_id in user_ids:
+        if user_id not in memberships:
+            results[user_id] = _bulk_item(user_id, error="Invitation not found")
+        elif memberships[user_id] != "pending":
+            results[user_id] = _bulk_item(
+                user_id,
+                memberships[user_id],
+                "Invitation already accepted"
+            )
+        else:
+            to_accept.append(user_id)
+
+    if to_accept:
+        # Guarded on "pending" so a concurrent accept is not counted twice
+        accepted = set(db.execute(
+            update(CoSpaceMember)
+            .where(
+                CoSpaceMember.co_space_id == co_space_id,
+                CoSpaceMember.user_id.in_(to_accept),
+                CoSpaceMember.co_space_member_status == "pending"
+            )
+            .values(co_space_member_status="accepted")
+            .returning(CoSpaceMember.user_id)
+            .execution_options(synchronize_session=False)
+        ).scalars())
+
+        invalidate_co_space_access(db, co_space_id, *accepted)
+
+        for user_id in to_accept:
+            if user_id in accepted:
+                results[user_id] = _bulk_item(user_id, "accepted")
+            else:
+                results[user_id] = _bulk_item(user_id, "accepted", "Invitation already accepted")
+
+    db.commit()
+
+    return _bulk_result(user_ids, results)
+
+
 # ============================================
 # Get Members (Accepted Only)
 # ============================================
@@ -151,7 +360,7 @@ def get_members(db: Session, co_space_id):
 # Add Co-Space Fund (Identity Enforced)
 # ============================================
 
-def add_co_space_fund(db: Session, co_space_id, user_id, amount):
+def add_co_space_fund(db: Session, co_space_id, user_id, amount, access: CoSpaceAccess = None):
 
     if amount <= Decimal("0"):
         raise HTTPException(
@@ -159,24 +368,17 @@ def add_co_space_fund(db: Session, co_space_id, user_id, amount):
             detail="Contribution amount must be positive"
         )
 
-    # Ensure membership
-    membership = db.query(CoSpaceMember).filter(
-        CoSpaceMember.co_space_id == co_space_id,
-        CoSpaceMember.user_id == user_id,
-        CoSpaceMember.co_space_member_status == "accepted"
-    ).first()
-
-    if not membership:
-        raise HTTPException(
-            status_code=403,
-            detail="You are not an accepted member of this co-space"
-        )
+    # Ensure membership (already resolved when called from a route)
+    access = access or load_co_space_access(db, co_space_id, user_id)
+    access.ensure_member("You are not an accepted member of this co-space")
 
     fund = db.query(CoSpaceFund).filter(
         CoSpaceFund.co_space_id == co_space_id,
         CoSpaceFund.user_id == user_id
     ).first()
 
+    new_member_fund = fund is None
+
     if fund:
         fund.co_space_fund_total_amount += amount
         fund.co_space_fund_remaining_amount += amount
@@ -192,6 +394,24 @@ def add_co_space_fund(db: Session, co_space_id, user_id, amount):
         )
         db.add(fund)
 
+    record_fund_movements(db, [fund_movement(
+        CO_SPACE_FUND,
+        fund.co_space_fund_id,
+        "deposit",
+        total_delta=amount,
+        remaining_delta=amount
+    )])
+
+    apply_co_space_rollup_delta(
+        db,
+        co_space_id,
+        total_contribution=amount,
+        total_remaining=amount,
+        member_count=1 if new_member_fund else 0
+    )
+
+    invalidate_co_space_dashboard(db, co_space_id)
+
     db.commit()
     db.refresh(fund)
 
@@ -202,19 +422,10 @@ def add_co_space_fund(db: Session, co_space_id, user_id, amount):
 # Get All Co-Space Funds (Members Only)
 # ============================================
 
-def get_co_space_funds(db: Session, co_space_id, user_id):
+def get_co_space_funds(db: Session, co_space_id, user_id, access: CoSpaceAccess = None):
 
-    membership = db.query(CoSpaceMember).filter(
-        CoSpaceMember.co_space_id == co_space_id,
-        CoSpaceMember.user_id == user_id,
-        CoSpaceMember.co_space_member_status == "accepted"
-    ).first()
-
-    if not membership:
-        raise HTTPException(
-            status_code=403,
-            detail="You are not authorized to view this co-space"
-        )
+    access = access or load_co_space_access(db, co_space_id, user_id)
+    access.ensure_member("You are not authorized to view this co-space")
 
     funds = db.query(CoSpaceFund).filter(
         CoSpaceFund.co_space_id == co_space_id
@@ -0,0 +1,82 @@
+from sqlalchemy.orm import Session
+
+from app.core.cache import invalidate_on_commit
+from app.core.conditional import EncodedResponse
+from app.core.config import settings
+from app.core.database import run_in_new_session
+from app.core.response_cache import ResponseCache
+from app.schemas.dashboard_schema import UserDashboardResponse, CoSpaceDashboardResponse
+from app.services import dashboard_service
+
+
+dashboard_cache = ResponseCache(
+    "dashboards",
+    maxsize=settings.DASHBOARD_CACHE_MAX_SIZE,
+    ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+    stale_ttl=settings.DASHBOARD_CACHE_STALE_SECONDS
+)
+
+
+def _user_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def _co_space_key(co_space_id) -> str:
+    return f"co_space:{co_space_id}"
+
+
+# ============================================
+# Loaders
+# Run on a session of their own (a stale refresh outlives the request)
+# and return the validated response model encoded as JSON with its ETag,
+# so no ORM state is cached and cache hits skip serialization.
+# ============================================
+
+def _load_user_dashboard(db: Session, user_id):
+
+    dashboard = dashboard_service.get_user_dashboard(db, user_id)
+
+    if dashboard is None:
+        return None
+
+    return EncodedResponse.from_model(UserDashboardResponse.model_validate(dashboard))
+
+
+def _load_co_space_dashboard(db: Session, co_space_id):
+
+    dashboard = dashboard_service.get_co_space_dashboard(db, co_space_id)
+
+    if dashboard is None:
+        return None
+
+    return EncodedResponse.from_model(CoSpaceDashboardResponse.model_validate(dashboard))
+
+
+async def get_user_dashboard(user_id):
+
+    async def load():
+        return await run_in_new_session(_load_user_dashboard, user_id)
+
+    return await dashboard_cache.get_or_load(_user_key(user_id), load)
+
+
+async def get_co_space_dashboard(co_space_id):
+
+    async def load():
+        return await run_in_new_session(_load_co_space_dashboard, co_space_id)
+
+    return await dashboard_cache.get_or_load(_co_space_key(co_space_id), load)
+
+
+# ============================================
+# Invalidation (queued on the session, applied after commit)
+# ============================================
+
+def invalidate_user_dashboards(db: Session, *user_ids):
+
+    for user_id in set(user_ids):
+        invalidate_on_commit(db, dashboard_cache, _user_key(user_id))
+
+
+def invalidate_co_space_dashboard(db: Session, co_space_id):
+    invalidate_on_commit(db, dashboard_cache, _co_space_key(co_space_id))
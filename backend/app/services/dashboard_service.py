@@ -1,10 +1,17 @@
+from datetime import datetime
+from decimal import Decimal
+
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from app.models.user_fund_model import UserFund
 from app.models.expense_model import Expense
 from app.models.expense_approval_model import ExpenseApproval
 from app.models.co_space_fund_model import CoSpaceFund
-from decimal import Decimal
+from app.models.co_space_rollup_model import CoSpaceRollup
+from app.services.rollup_service import compute_co_space_rollups, rollup_as_dict
+from app.services.spending_period_service import (
+    get_co_space_member_period_totals,
+    get_user_period_totals
+)
 
 
 # ============================================
@@ -29,11 +36,15 @@ def get_user_dashboard(db: Session, user_id):
         ExpenseApproval.expense_approval_status == "pending"
     ).count()
 
+    # This month / this year from the spending buckets (the UserFund
+    # counters are never reset at period boundaries)
+    monthly_total, yearly_total = get_user_period_totals(db, user_id, datetime.utcnow())
+
     return {
         "total_fund": fund.user_fund_total_amount,
         "remaining_fund": fund.user_fund_remaining_amount,
-        "monthly_expense_total": fund.user_fund_monthly_expense_total,
-        "yearly_expense_total": fund.user_fund_yearly_expense_total,
+        "monthly_expense_total": monthly_total,
+        "yearly_expense_total": yearly_total,
         "pending_approvals": pending_count,
         "recent_expenses": recent_expenses
     }
@@ -45,39 +56,42 @@ def get_user_dashboard(db: Session, user_id):
 
 def get_co_space_dashboard(db: Session, co_space_id):
 
-    funds = db.query(CoSpaceFund).filter(
-        CoSpaceFund.co_space_id == co_space_id
-    ).all()
-
-    if not funds:
-        return None
-
-    total_contribution = Decimal("0.00")
-    total_remaining = Decimal("0.00")
-    total_spent = Decimal("0.00")
+    # Pool totals and pending count come from the rollup row (primary-key
+    # read); co-spaces that predate the rollups fall back to base tables
+    rollup = db.get(CoSpaceRollup, co_space_id)
 
-    members_summary = []
+    if rollup is not None:
+        totals = rollup_as_dict(rollup)
+    else:
+        totals = compute_co_space_rollups(db, [co_space_id]).get(co_space_id)
 
-    for fund in funds:
-        total_contribution += fund.co_space_fund_total_amount
-        total_remaining += fund.co_space_fund_remaining_amount
-        total_spent += fund.co_space_fund_yearly_expense_total
+    if not totals or not totals["member_count"]:
+        return None
 
-        members_summary.append({
-            "user_id": fund.user_id,
-            "total_contributed": fund.co_space_fund_total_amount,
-            "remaining_amount": fund.co_space_fund_remaining_amount
-        })
+    members = db.query(
+        CoSpaceFund.user_id,
+        CoSpaceFund.co_space_fund_total_amount,
+        CoSpaceFund.co_space_fund_remaining_amount
+    ).filter(
+        CoSpaceFund.co_space_id == co_space_id
+    ).all()
 
-    pending_count = db.query(Expense).filter(
-        Expense.co_space_id == co_space_id,
-        Expense.expense_status == "pending"
-    ).count()
+    period_totals = get_co_space_member_period_totals(db, co_space_id, datetime.utcnow())
+    no_spending = (Decimal("0.00"), Decimal("0.00"))
 
     return {
-        "total_pool_contribution": total_contribution,
-        "total_pool_remaining": total_remaining,
-        "total_expense_spent": total_spent,
-        "pending_approvals": pending_count,
-        "members": members_summary
+        "total_pool_contribution": totals["total_contribution"],
+        "total_pool_remaining": totals["total_remaining"],
+        "total_expense_spent": totals["total_spent"],
+        "pending_approvals": totals["pending_count"],
+        "members": [
+            {
+                "user_id": member.user_id,
+                "total_contributed": member.co_space_fund_total_amount,
+                "remaining_amount": member.co_space_fund_remaining_amount,
+                "monthly_expense_total": period_totals.get(member.user_id, no_spending)[0],
+                "yearly_expense_total": period_totals.get(member.user_id, no_spending)[1]
+            }
+            for member in members
+        ]
     }
@@ -0,0 +1,135 @@
+import csv
+import io
+import json
+import zlib
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import stream_partitions
+from app.models.expense_model import Expense
+from app.services.expense_service import apply_history_filters
+
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+EXPORT_COLUMNS = [
+    Expense.expense_id,
+    Expense.expense_created_at,
+    Expense.expense_payer_user_id,
+    Expense.co_space_id,
+    Expense.expense_amount,
+    Expense.expense_message,
+    Expense.expense_from_fund_type,
+    Expense.expense_is_for_type,
+    Expense.expense_related_user_id,
+    Expense.expense_status,
+]
+
+_FIELD_NAMES = [column.key for column in EXPORT_COLUMNS]
+
+
+# ============================================
+# Encoding (one chunk per cursor partition)
+# ============================================
+
+def _text(value):
+
+    if value is None:
+        return None
+
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+
+    return str(value)
+
+
+def _encode_csv(rows, header: bool) -> bytes:
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    if header:
+        writer.writerow(_FIELD_NAMES)
+
+    writer.writerows(
+        ["" if value is None else _text(value) for value in row]
+        for row in rows
+    )
+
+    return buffer.getvalue().encode()
+
+
+def _encode_ndjson(rows) -> bytes:
+
+    return "".join(
+        json.dumps(dict(zip(_FIELD_NAMES, map(_text, row)))) + "\n"
+        for row in rows
+    ).encode()
+
+
+# ============================================
+# Export Stream
+# Rows come through a server-side cursor, oldest first, and are encoded
+# and (optionally) gzip-compressed partition by partition, so memory
+# stays bounded by EXPENSE_EXPORT_BATCH_SIZE whatever the export size.
+# ============================================
+
+def export_statement(scope, filters):
+
+    statement = select(*EXPORT_COLUMNS).where(scope)
+
+    return apply_history_filters(statement, filters).order_by(
+        Expense.expense_created_at,
+        Expense.expense_id
+    )
+
+
+async def stream_export(statement, export_format: str, compress: bool = False):
+
+    compressor = zlib.compressobj(wbits=31) if compress else None
+
+    if export_format == "csv":
+        # Header goes out even when nothing matches
+        header = _encode_csv([], header=True)
+        yield compressor.compress(header) if compressor else header
+
+    async for rows in stream_partitions(statement, settings.EXPENSE_EXPORT_BATCH_SIZE):
+
+        if export_format == "csv":
+            chunk = _encode_csv(rows, header=False)
+        else:
+            chunk = _encode_ndjson(rows)
+
+        if compressor:
+            chunk = compressor.compress(chunk)
+
+        if chunk:
+            yield chunk
+
+    if compressor:
+        yield compressor.flush()
+
+
+def export_response(statement, export_format: str, compress: bool, filename: str):
+
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="format must be 'csv' or 'ndjson'")
+
+    filename = f"{filename}.{export_format}"
+    media_type = EXPORT_FORMATS[export_format]
+
+    if compress:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream_export(statement, export_format, compress),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
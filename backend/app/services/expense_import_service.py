@@ -0,0 +1,361 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import run_db_and_release
+from app.models.co_space_member_model import CoSpaceMember
+from app.models.expense_approval_model import ExpenseApproval
+from app.models.expense_model import Expense
+from app.models.user_fund_model import UserFund
+from app.models.user_model import User
+from app.schemas.expense_schema import ExpenseImportRow
+from app.services.dashboard_cache import (
+    invalidate_co_space_dashboard,
+    invalidate_user_dashboards
+)
+from app.services.fund_ledger_service import USER_FUND, fund_movement, record_fund_movements
+from app.services.rollup_service import apply_co_space_rollup_delta
+from app.services.spending_period_service import add_user_spending, period_of
+
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+# ============================================
+# Parsing
+# The upload is read lazily, one batch at a time, so memory stays
+# bounded by the batch size whatever the file size. Rows are numbered by
+# their line in the upload.
+# ============================================
+
+def _validation_messages(error: ValidationError) -> list:
+    return [
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    ]
+
+
+def _iter_csv_records(text):
+
+    reader = csv.DictReader(text)
+
+    for record in reader:
+        # Empty cells are missing values; extra cells (key None) are ignored
+        yield reader.line_num, {
+            key: value if value != "" else None
+            for key, value in record.items()
+            if key is not None
+        }, None
+
+
+def _iter_ndjson_records(text):
+
+    for line_number, line in enumerate(text, start=1):
+
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line, parse_float=Decimal)
+        except ValueError as e:
+            yield line_number, None, [f"Invalid JSON: {e}"]
+            continue
+
+        if not isinstance(record, dict):
+            yield line_number, None, ["Each line must be a JSON object"]
+            continue
+
+        yield line_number, record, None
+
+
+def iter_import_batches(upload, import_format: str, batch_size: int):
+    """
+    Yields (rows, errors) per batch, where rows are
+    (line_number, ExpenseImportRow) pairs and errors are report entries
+    for lines that did not validate. An unreadable upload ends the
+    iteration with a single error entry.
+    """
+
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+
+    if import_format == "csv":
+        records = _iter_csv_records(text)
+    else:
+        records = _iter_ndjson_records(text)
+
+    rows, errors = [], []
+
+    try:
+        for line_number, record, messages in records:
+
+            if messages is None:
+                try:
+                    rows.append((line_number, ExpenseImportRow.model_validate(record)))
+                except ValidationError as e:
+                    messages = _validation_messages(e)
+
+            if messages is not None:
+                errors.append({"row": line_number, "errors": messages})
+
+            if len(rows) + len(errors) >= batch_size:
+                yield rows, errors
+                rows, errors = [], []
+
+    except (UnicodeDecodeError, csv.Error) as e:
+        errors.append({"row": None, "errors": [f"Upload could not be read: {e}"]})
+
+    finally:
+        text.detach()
+
+    if rows or errors:
+        yield rows, errors
+
+
+# ============================================
+# Apply One Batch
+# Same rules as expense_service.create_expense, resolved once per batch:
+# one membership query, one related-user query, one locked read of the
+# payer's fund, executemany inserts (expenses, approvals, ledger entries),
+# one aggregated fund UPDATE and one spending-period upsert covering every
+# month the batch touches. Returns (imported_count, errors).
+# ============================================
+
+def _naive_utc(value: datetime) -> datetime:
+
+    if value.tzinfo is None:
+        return value
+
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def import_expense_batch(db: Session, rows, payer_user_id):
+
+    try:
+
+        co_space_ids = {
+            row.co_space_id for _, row in rows
+            if row.expense_from_fund_type == "co_space" and row.co_space_id
+        }
+        related_user_ids = {
+            row.expense_related_user_id for _, row in rows
+            if row.expense_related_user_id
+        }
+
+        members_by_space = {}
+
+        if co_space_ids:
+            for co_space_id, user_id in db.execute(
+                select(CoSpaceMember.co_space_id, CoSpaceMember.user_id).where(
+                    CoSpaceMember.co_space_id.in_(co_space_ids),
+                    CoSpaceMember.co_space_member_status == "accepted"
+                )
+            ):
+                members_by_space.setdefault(co_space_id, set()).add(user_id)
+
+        known_users = set()
+
+        if related_user_ids:
+            known_users = set(db.execute(
+                select(User.user_id).where(User.user_id.in_(related_user_ids))
+            ).scalars())
+
+        remaining = None
+
+        if any(row.expense_from_fund_type == "personal" for _, row in rows):
+            remaining = db.execute(
+                select(UserFund.user_fund_remaining_amount)
+                .where(UserFund.user_id == payer_user_id)
+                .with_for_update()
+            ).scalar()
+
+        now = datetime.utcnow()
+        expenses = []
+        approvals = []
+        errors = []
+        personal_total = Decimal("0.00")
+        personal_by_period = {}
+        movements = []
+        pending_by_space = {}
+
+        for line_number, row in rows:
+
+            error = None
+
+            if row.expense_related_user_id and row.expense_related_user_id not in known_users:
+                error = "Related user not found"
+
+            elif row.expense_from_fund_type == "personal":
+
+                if remaining is None:
+                    error = "User fund not found"
+                elif remaining < row.expense_amount:
+                    error = "Insufficient personal funds"
+                else:
+                    remaining -= row.expense_amount
+                    personal_total += row.expense_amount
+                    status = "approved"
+
+            elif row.expense_from_fund_type == "co_space":
+
+                if not row.co_space_id:
+                    error = "Co-space ID required"
+                elif payer_user_id not in members_by_space.get(row.co_space_id, ()):
+                    error = "You are not a member of this co-space"
+                else:
+                    status = "pending"
+
+            else:
+                error = "Invalid fund type"
+
+            if error:
+                errors.append({"row": line_number, "errors": [error]})
+                continue
+
+            expense_id = uuid.uuid4()
+            created_at = _naive_utc(row.expense_created_at or now)
+
+            if status == "approved":
+                total, count = personal_by_period.get(period_of(created_at), (Decimal("0.00"), 0))
+                personal_by_period[period_of(created_at)] = (total + row.expense_amount, count + 1)
+
+                movements.append(fund_movement(
+                    USER_FUND,
+                    payer_user_id,
+                    "expense",
+                    remaining_delta=-row.expense_amount,
+                    expense_id=expense_id
+                ))
+
+            expenses.append({
+                "expense_id": expense_id,
+                "expense_payer_user_id": payer_user_id,
+                "co_space_id": row.co_space_id,
+                "expense_amount": row.expense_amount,
+                "expense_message": row.expense_message,
+                "expense_from_fund_type": row.expense_from_fund_type,
+                "expense_is_for_type": row.expense_is_for_type,
+                "expense_related_user_id": row.expense_related_user_id,
+                "expense_status": status,
+                "expense_created_at": created_at,
+            })
+
+            if status == "pending":
+                pending_by_space[row.co_space_id] = pending_by_space.get(row.co_space_id, 0) + 1
+
+                approvals.extend(
+                    {
+                        "expense_approval_id": uuid.uuid4(),
+                        "expense_id": expense_id,
+                        "user_id": member_id,
+                        "expense_approval_status": "pending",
+                    }
+                    for member_id in members_by_space[row.co_space_id]
+                    if member_id != payer_user_id
+                )
+
+        if expenses:
+            db.execute(insert(Expense), expenses)
+            invalidate_user_dashboards(db, payer_user_id)
+
+        if approvals:
+            db.execute(insert(ExpenseApproval), approvals)
+
+        if personal_total:
+            db.execute(
+                update(UserFund)
+                .where(UserFund.user_id == payer_user_id)
+                .values(
+                    user_fund_remaining_amount=UserFund.user_fund_remaining_amount - personal_total,
+                    user_fund_monthly_expense_total=UserFund.user_fund_monthly_expense_total + personal_total,
+                    user_fund_yearly_expense_total=UserFund.user_fund_yearly_expense_total + personal_total,
+                    user_fund_version=UserFund.user_fund_version + 1
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+            add_user_spending(db, payer_user_id, personal_by_period)
+            record_fund_movements(db, movements)
+
+        for co_space_id, pending_count in pending_by_space.items():
+            apply_co_space_rollup_delta(db, co_space_id, pending_count=pending_count)
+            invalidate_co_space_dashboard(db, co_space_id)
+            invalidate_user_dashboards(db, *members_by_space[co_space_id])
+
+        db.commit()
+
+        return len(expenses), errors
+
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Expense import batch failed")
+
+
+# ============================================
+# Import (whole upload)
+# Each batch commits on its own; a failed batch is reported row by row
+# and the import carries on with the next one.
+# ============================================
+
+async def import_expenses(db, upload, import_format: str, payer_user_id):
+
+    max_errors = settings.EXPENSE_IMPORT_MAX_REPORTED_ERRORS
+
+    imported = 0
+    failed = 0
+    batch_count = 0
+    reported = []
+
+    def report(errors):
+        nonlocal failed
+        failed += len(errors)
+        reported.extend(errors[:max(0, max_errors - len(reported))])
+
+    batches = iter_import_batches(upload, import_format, settings.EXPENSE_IMPORT_BATCH_SIZE)
+
+    while True:
+        batch = await run_in_threadpool(next, batches, None)
+
+        if batch is None:
+            break
+
+        rows, errors = batch
+        batch_count += 1
+        report(errors)
+
+        if not rows:
+            continue
+
+        try:
+            batch_imported, batch_errors = await run_db_and_release(
+                db,
+                import_expense_batch,
+                rows,
+                payer_user_id
+            )
+        except HTTPException as e:
+            batch_imported = 0
+            batch_errors = [{"row": line_number, "errors": [e.detail]} for line_number, _ in rows]
+
+        imported += batch_imported
+        report(batch_errors)
+
+    return {
+        "imported": imported,
+        "failed": failed,
+        "batches": batch_count,
+        "errors": reported,
+        "errors_truncated": failed > len(reported),
+    }
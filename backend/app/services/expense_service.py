@@ -1,11 +1,22 @@
 import uuid
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from fastapi import HTTPException
 
+from app.core.co_space_access import CoSpaceAccess
+from app.core.pagination import paginate
 from app.models.expense_model import Expense
 from app.models.expense_approval_model import ExpenseApproval
 from app.models.co_space_member_model import CoSpaceMember
 from app.models.user_fund_model import UserFund
+from app.services.co_space_service import load_co_space_access
+from app.services.dashboard_cache import (
+    invalidate_co_space_dashboard,
+    invalidate_user_dashboards
+)
+from app.services.fund_ledger_service import USER_FUND, fund_movement, record_fund_movements
+from app.services.rollup_service import apply_co_space_rollup_delta
+from app.services.spending_period_service import add_user_spending_for_expense
 from decimal import Decimal
 
 
@@ -13,7 +24,7 @@ from decimal import Decimal
 # Create Expense (Identity Enforced Version)
 # ============================================
 
-def create_expense(db: Session, data, payer_user_id):
+def create_expense(db: Session, data, payer_user_id, access: CoSpaceAccess = None):
 
     try:
 
@@ -51,18 +62,9 @@ def create_expense(db: Session, data, payer_user_id):
             if not data.co_space_id:
                 raise HTTPException(status_code=400, detail="Co-space ID required")
 
-            # 🔐 Enforce Membership
-            membership = db.query(CoSpaceMember).filter(
-                CoSpaceMember.co_space_id == data.co_space_id,
-                CoSpaceMember.user_id == payer_user_id,
-                CoSpaceMember.co_space_member_status == "accepted"
-            ).first()
-
-            if not membership:
-                raise HTTPException(
-                    status_code=403,
-                    detail="You are not a member of this co-space"
-                )
+            # 🔐 Enforce Membership (already resolved when called from a route)
+            access = access or load_co_space_access(db, data.co_space_id, payer_user_id)
+            access.ensure_member()
 
             status = "pending"
 
@@ -87,6 +89,21 @@ def create_expense(db: Session, data, payer_user_id):
 
         db.add(expense)
 
+        if data.expense_from_fund_type == "personal":
+            # Bucketed by the created_at the database assigns
+            db.flush()
+            add_user_spending_for_expense(db, expense_id)
+
+            record_fund_movements(db, [fund_movement(
+                USER_FUND,
+                payer_user_id,
+                "expense",
+                remaining_delta=-data.expense_amount,
+                expense_id=expense_id
+            )])
+
+        invalidate_user_dashboards(db, payer_user_id)
+
         # ============================================
         # Create Approval Records (Co-space Only)
         # ============================================
@@ -108,14 +125,111 @@ def create_expense(db: Session, data, payer_user_id):
                     )
                     db.add(approval)
 
+            db.flush()
+            apply_co_space_rollup_delta(db, data.co_space_id, pending_count=1)
+
+            invalidate_user_dashboards(db, *(member.user_id for member in members))
+            invalidate_co_space_dashboard(db, data.co_space_id)
+
         db.commit()
         db.refresh(expense)
 
         return expense
 
-    except HTTPException:
+    except (HTTPException, StaleDataError):
         db.rollback()
         raise
     except Exception:
         db.rollback()
         raise HTTPException(status_code=500, detail="Expense creation failed")
+
+
+# ============================================
+# Expense History (keyset paginated, newest first)
+# The page is picked on (scope, created_at, id) plus the filter columns,
+# all of which the history indexes cover, then only those rows are
+# loaded by primary key. Returns (expenses, next_cursor).
+# ============================================
+
+def apply_history_filters(query, filters):
+
+    if (
+        filters.min_amount is not None
+        and filters.max_amount is not None
+        and filters.min_amount > filters.max_amount
+    ):
+        raise HTTPException(status_code=400, detail="min_amount cannot exceed max_amount")
+
+    if filters.created_from is not None:
+        query = query.filter(Expense.expense_created_at >= filters.created_from)
+
+    if filters.created_to is not None:
+        query = query.filter(Expense.expense_created_at < filters.created_to)
+
+    if filters.expense_status:
+        query = query.filter(Expense.expense_status == filters.expense_status)
+
+    if filters.expense_from_fund_type:
+        query = query.filter(Expense.expense_from_fund_type == filters.expense_from_fund_type)
+
+    if filters.expense_is_for_type:
+        query = query.filter(Expense.expense_is_for_type == filters.expense_is_for_type)
+
+    if filters.expense_related_user_id:
+        query = query.filter(Expense.expense_related_user_id == filters.expense_related_user_id)
+
+    if filters.min_amount is not None:
+        query = query.filter(Expense.expense_amount >= filters.min_amount)
+
+    if filters.max_amount is not None:
+        query = query.filter(Expense.expense_amount <= filters.max_amount)
+
+    return query
+
+
+def _expense_history(db: Session, scope, filters, cursor, limit):
+
+    page = apply_history_filters(
+        db.query(Expense.expense_id, Expense.expense_created_at).filter(scope),
+        filters
+    )
+
+    keys, next_cursor = paginate(
+        page,
+        Expense.expense_created_at,
+        Expense.expense_id,
+        cursor,
+        limit
+    )
+
+    if not keys:
+        return [], next_cursor
+
+    expenses = db.query(Expense).filter(
+        Expense.expense_id.in_([key.expense_id for key in keys])
+    ).order_by(
+        Expense.expense_created_at.desc(),
+        Expense.expense_id.desc()
+    ).all()
+
+    return expenses, next_cursor
+
+
+def get_user_expenses(db: Session, user_id, filters, cursor=None, limit=50):
+    return _expense_history(
+        db,
+        Expense.expense_payer_user_id == user_id,
+        filters,
+        cursor,
+        limit
+    )
+
+
+def get_co_space_expenses(db: Session, co_space_id, filters, cursor=None, limit=50):
+    return _expense_history(
+        db,
+        Expense.co_space_id == co_space_id,
+        filters,
+        cursor,
+        limit
+    )
@@ -0,0 +1,320 @@
+import time
+from decimal import Decimal
+
+from sqlalchemy import VARCHAR, and_, cast, func, insert, literal, select, text
+from sqlalchemy.orm import Session, aliased
+
+from app.models.co_space_fund_model import CoSpaceFund
+from app.models.fund_balance_snapshot_model import FundBalanceSnapshot
+from app.models.fund_ledger_entry_model import FundLedgerEntry
+from app.models.user_fund_model import UserFund
+
+
+USER_FUND = "user"
+CO_SPACE_FUND = "co_space"
+
+ZERO = Decimal("0.00")
+
+
+# ============================================
+# Record Movements (same transaction as the balance change)
+# ============================================
+
+def fund_movement(
+    fund_type: str,
+    fund_id,
+    entry_type: str,
+    total_delta=ZERO,
+    remaining_delta=ZERO,
+    expense_id=None
+) -> dict:
+
+    return {
+        FundLedgerEntry.fund_ledger_fund_type.key: fund_type,
+        FundLedgerEntry.fund_ledger_fund_id.key: fund_id,
+        FundLedgerEntry.fund_ledger_entry_type.key: entry_type,
+        FundLedgerEntry.fund_ledger_total_delta.key: total_delta,
+        FundLedgerEntry.fund_ledger_remaining_delta.key: remaining_delta,
+        FundLedgerEntry.expense_id.key: expense_id,
+    }
+
+
+def record_fund_movements(db: Session, movements: list):
+
+    if movements:
+        if db.get_bind().dialect.name == "postgresql":
+            # A transaction id before any ledger id (see Snapshot Round)
+            db.execute(select(func.pg_current_xact_id()))
+
+        db.execute(insert(FundLedgerEntry), movements)
+
+
+# ============================================
+# Ledger Balance
+# Latest snapshot (primary-key seek) plus the entries after it (index
+# range on the fund), so the cost depends on the snapshot interval and
+# not on the ledger's size.
+# ============================================
+
+def ledger_balance(db: Session, fund_type: str, fund_id) -> dict:
+
+    snapshot = db.execute(
+        select(FundBalanceSnapshot).where(
+            FundBalanceSnapshot.fund_ledger_fund_type == fund_type,
+            FundBalanceSnapshot.fund_ledger_fund_id == fund_id
+        ).order_by(FundBalanceSnapshot.through_entry_id.desc()).limit(1)
+    ).scalar_one_or_none()
+
+    through_entry_id = snapshot.through_entry_id if snapshot else 0
+
+    tail_total, tail_remaining, tail_entries = db.execute(
+        select(
+            func.coalesce(func.sum(FundLedgerEntry.fund_ledger_total_delta), 0),
+            func.coalesce(func.sum(FundLedgerEntry.fund_ledger_remaining_delta), 0),
+            func.count()
+        ).where(
+            FundLedgerEntry.fund_ledger_fund_type == fund_type,
+            FundLedgerEntry.fund_ledger_fund_id == fund_id,
+            FundLedgerEntry.fund_ledger_entry_id > through_entry_id
+        )
+    ).one()
+
+    return {
+        "total_amount": (snapshot.fund_balance_snapshot_total_amount if snapshot else ZERO) + Decimal(tail_total),
+        "remaining_amount": (snapshot.fund_balance_snapshot_remaining_amount if snapshot else ZERO) + Decimal(tail_remaining),
+        "through_entry_id": through_entry_id,
+        "tail_entries": tail_entries,
+    }
+
+
+# ============================================
+# Snapshot Round
+# One INSERT ... SELECT: every fund with entries since the previous round
+# gets a new snapshot = its latest snapshot + those entries. Rounds share
+# one watermark (through_entry_id), so no entry at or below it may still
+# be uncommitted: ids are drawn before commit, and a committed entry can
+# have a higher id than one whose transaction is still open.
+#
+# Postgres: the highest visible id and the transaction snapshot are read
+# in one statement. Writers take their transaction id before drawing
+# ledger ids (record_fund_movements), so any writer that holds a lower id
+# was already running then and is in the snapshot's in-progress list. The
+# round waits up to wait_seconds for those transactions to end, or
+# writes nothing and leaves the entries to the next round. SQLite has one
+# writer at a time, so ids are in commit order and the highest is safe.
+#
+# Returns (snapshots_written, through_entry_id).
+# ============================================
+
+_OPEN_WRITERS = text(
+    "SELECT count(*) FROM pg_snapshot_xip(CAST(:snapshot AS pg_snapshot)) AS xip(xid)"
+    " WHERE pg_xact_status(xid) = 'in progress'"
+)
+
+_WRITER_POLL_SECONDS = 0.1
+
+
+def _settled_watermark(db: Session, previous: int, wait_seconds: float):
+    """The highest ledger id with no uncommitted entry below it, or None."""
+
+    highest = select(func.max(FundLedgerEntry.fund_ledger_entry_id)).where(
+        FundLedgerEntry.fund_ledger_entry_id > previous
+    )
+
+    if db.get_bind().dialect.name != "postgresql":
+        return db.execute(highest).scalar()
+
+    through, snapshot = db.execute(
+        highest.add_columns(cast(func.pg_current_snapshot(), VARCHAR))
+    ).one()
+
+    deadline = time.monotonic() + wait_seconds
+
+    while through is not None:
+
+        open_writers = db.execute(_OPEN_WRITERS, {"snapshot": snapshot}).scalar()
+        db.rollback()
+
+        if not open_writers:
+            break
+
+        if time.monotonic() >= deadline:
+            return None
+
+        time.sleep(_WRITER_POLL_SECONDS)
+
+    return through
+
+
+def take_balance_snapshots(db: Session, wait_seconds: float):
+
+    previous = db.execute(
+        select(func.max(FundBalanceSnapshot.through_entry_id))
+    ).scalar() or 0
+
+    through = _settled_watermark(db, previous, wait_seconds)
+
+    # A new transaction (and snapshot) from here: it sees the entries of
+    # the writers waited for
+    db.rollback()
+
+    if through is None:
+        return 0, previous
+
+    deltas = select(
+        FundLedgerEntry.fund_ledger_fund_type.label("fund_type"),
+        FundLedgerEntry.fund_ledger_fund_id.label("fund_id"),
+        func.sum(FundLedgerEntry.fund_ledger_total_delta).label("total_delta"),
+        func.sum(FundLedgerEntry.fund_ledger_remaining_delta).label("remaining_delta")
+    ).where(
+        FundLedgerEntry.fund_ledger_entry_id > previous,
+        FundLedgerEntry.fund_ledger_entry_id <= through
+    ).group_by(
+        FundLedgerEntry.fund_ledger_fund_type,
+        FundLedgerEntry.fund_ledger_fund_id
+    ).subquery()
+
+    prior = aliased(FundBalanceSnapshot)
+    latest = aliased(FundBalanceSnapshot)
+
+    latest_through = select(func.max(latest.through_entry_id)).where(
+        latest.fund_ledger_fund_type == deltas.c.fund_type,
+        latest.fund_ledger_fund_id == deltas.c.fund_id
+    ).correlate(deltas).scalar_subquery()
+
+    amount_type = FundBalanceSnapshot.fund_balance_snapshot_total_amount.type
+
+    source = select(
+        deltas.c.fund_type,
+        deltas.c.fund_id,
+        literal(through, FundBalanceSnapshot.through_entry_id.type),
+        func.coalesce(prior.fund_balance_snapshot_total_amount, literal(ZERO, amount_type)) + deltas.c.total_delta,
+        func.coalesce(prior.fund_balance_snapshot_remaining_amount, literal(ZERO, amount_type)) + deltas.c.remaining_delta
+    ).select_from(
+        deltas.outerjoin(
+            prior,
+            and_(
+                prior.fund_ledger_fund_type == deltas.c.fund_type,
+                prior.fund_ledger_fund_id == deltas.c.fund_id,
+                prior.through_entry_id == latest_through
+            )
+        )
+    )
+
+    written = db.execute(
+        insert(FundBalanceSnapshot).from_select(
+            [
+                FundBalanceSnapshot.fund_ledger_fund_type,
+                FundBalanceSnapshot.fund_ledger_fund_id,
+                FundBalanceSnapshot.through_entry_id,
+                FundBalanceSnapshot.fund_balance_snapshot_total_amount,
+                FundBalanceSnapshot.fund_balance_snapshot_remaining_amount,
+            ],
+            source
+        )
+    ).rowcount
+
+    db.commit()
+
+    return written, through
+
+
+# ============================================
+# Reconciliation
+# Stored balances are streamed in chunks and compared with snapshot +
+# tail for the same funds (the tail starts at the last round's watermark,
+# a short primary-key range). Returns the funds that disagree.
+# ============================================
+
+_STORED_BALANCES = {
+    USER_FUND: (
+        UserFund.user_id,
+        UserFund.user_fund_total_amount,
+        UserFund.user_fund_remaining_amount
+    ),
+    CO_SPACE_FUND: (
+        CoSpaceFund.co_space_fund_id,
+        CoSpaceFund.co_space_fund_total_amount,
+        CoSpaceFund.co_space_fund_remaining_amount
+    ),
+}
+
+
+def _ledger_balances(db: Session, fund_type: str, fund_ids: list, watermark: int) -> dict:
+
+    latest = aliased(FundBalanceSnapshot)
+
+    latest_through = select(func.max(latest.through_entry_id)).where(
+        latest.fund_ledger_fund_type == FundBalanceSnapshot.fund_ledger_fund_type,
+        latest.fund_ledger_fund_id == FundBalanceSnapshot.fund_ledger_fund_id
+    ).scalar_subquery()
+
+    balances = {
+        fund_id: [Decimal(total), Decimal(remaining)]
+        for fund_id, total, remaining in db.execute(
+            select(
+                FundBalanceSnapshot.fund_ledger_fund_id,
+                FundBalanceSnapshot.fund_balance_snapshot_total_amount,
+                FundBalanceSnapshot.fund_balance_snapshot_remaining_amount
+            ).where(
+                FundBalanceSnapshot.fund_ledger_fund_type == fund_type,
+                FundBalanceSnapshot.fund_ledger_fund_id.in_(fund_ids),
+                FundBalanceSnapshot.through_entry_id == latest_through
+            )
+        )
+    }
+
+    for fund_id, total, remaining in db.execute(
+        select(
+            FundLedgerEntry.fund_ledger_fund_id,
+            func.sum(FundLedgerEntry.fund_ledger_total_delta),
+            func.sum(FundLedgerEntry.fund_ledger_remaining_delta)
+        ).where(
+            FundLedgerEntry.fund_ledger_fund_type == fund_type,
+            FundLedgerEntry.fund_ledger_fund_id.in_(fund_ids),
+            FundLedgerEntry.fund_ledger_entry_id > watermark
+        ).group_by(FundLedgerEntry.fund_ledger_fund_id)
+    ):
+        balance = balances.setdefault(fund_id, [ZERO, ZERO])
+        balance[0] += Decimal(total)
+        balance[1] += Decimal(remaining)
+
+    return balances
+
+
+def reconcile_fund_balances(db: Session, chunk_size: int = 1000) -> list:
+
+    watermark = db.execute(
+        select(func.max(FundBalanceSnapshot.through_entry_id))
+    ).scalar() or 0
+
+    mismatches = []
+
+    for fund_type, (id_column, total_column, remaining_column) in _STORED_BALANCES.items():
+
+        stored_rows = db.execute(
+            select(id_column, total_column, remaining_column)
+            .order_by(id_column)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        for chunk in stored_rows.partitions():
+
+            ledger = _ledger_balances(db, fund_type, [row[0] for row in chunk], watermark)
+
+            for fund_id, total, remaining in chunk:
+
+                stored = (Decimal(total or 0), Decimal(remaining or 0))
+                expected = tuple(ledger.get(fund_id, (ZERO, ZERO)))
+
+                if stored != expected:
+                    mismatches.append({
+                        "fund_type": fund_type,
+                        "fund_id": fund_id,
+                        "stored": stored,
+                        "ledger": expected,
+                    })
+
+    db.rollback()
+
+    return mismatches
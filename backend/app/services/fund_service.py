@@ -5,6 +5,8 @@ from decimal import Decimal
 from app.models.user_model import User
 from app.models.user_fund_model import UserFund
 from app.schemas.fund_schema import UserFundCreate, UserFundUpdate
+from app.services.dashboard_cache import invalidate_user_dashboards
+from app.services.fund_ledger_service import USER_FUND, fund_movement, record_fund_movements
 
 
 # ============================================
@@ -21,6 +23,15 @@ def get_user_fund(db: Session, user_id):
     return fund
 
 
+def get_user_fund_version(db: Session, user_id):
+    """Version columns only (ETag checks); None when there is no fund."""
+
+    return db.query(
+        UserFund.user_fund_version,
+        UserFund.user_fund_updated_at
+    ).filter(UserFund.user_id == user_id).first()
+
+
 # ============================================
 # POST Initialize or Add Fund
 # ============================================
@@ -35,9 +46,19 @@ def initialize_user_fund(db: Session, user_id, fund_data: UserFundCreate):
     if fund.user_fund_total_amount > 0:
         raise HTTPException(status_code=400, detail="User fund already initialized")
 
+    record_fund_movements(db, [fund_movement(
+        USER_FUND,
+        user_id,
+        "deposit",
+        total_delta=fund_data.user_fund_total_amount - fund.user_fund_total_amount,
+        remaining_delta=fund_data.user_fund_total_amount - fund.user_fund_remaining_amount
+    )])
+
     fund.user_fund_total_amount = fund_data.user_fund_total_amount
     fund.user_fund_remaining_amount = fund_data.user_fund_total_amount
 
+    invalidate_user_dashboards(db, user_id)
+
     db.commit()
     db.refresh(fund)
 
@@ -63,6 +84,16 @@ def update_user_fund(db: Session, user_id, fund_data: UserFundUpdate):
     if fund.user_fund_remaining_amount < 0:
         raise HTTPException(status_code=400, detail="Updated fund causes negative remaining amount")
 
+    record_fund_movements(db, [fund_movement(
+        USER_FUND,
+        user_id,
+        "adjustment",
+        total_delta=difference,
+        remaining_delta=difference
+    )])
+
+    invalidate_user_dashboards(db, user_id)
+
     db.commit()
     db.refresh(fund)
 
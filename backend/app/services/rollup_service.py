@@ -0,0 +1,170 @@
+from decimal import Decimal
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.database import dialect_insert
+from app.models.co_space_fund_model import CoSpaceFund
+from app.models.co_space_model import CoSpace
+from app.models.co_space_rollup_model import CoSpaceRollup
+from app.models.expense_model import Expense
+
+
+ROLLUP_FIELDS = {
+    "total_contribution": CoSpaceRollup.co_space_rollup_total_contribution,
+    "total_remaining": CoSpaceRollup.co_space_rollup_total_remaining,
+    "total_spent": CoSpaceRollup.co_space_rollup_total_spent,
+    "pending_count": CoSpaceRollup.co_space_rollup_pending_count,
+    "member_count": CoSpaceRollup.co_space_rollup_member_count,
+}
+
+
+# ============================================
+# Apply Delta (same transaction as the base-table change)
+# One INSERT ... ON CONFLICT DO UPDATE, so the row is created on first use
+# ============================================
+
+def apply_co_space_rollup_delta(
+    db: Session,
+    co_space_id,
+    total_contribution=Decimal("0.00"),
+    total_remaining=Decimal("0.00"),
+    total_spent=Decimal("0.00"),
+    pending_count=0,
+    member_count=0
+):
+
+    deltas = {
+        "total_contribution": total_contribution,
+        "total_remaining": total_remaining,
+        "total_spent": total_spent,
+        "pending_count": pending_count,
+        "member_count": member_count,
+    }
+
+    stmt = dialect_insert(db, CoSpaceRollup).values(
+        co_space_id=co_space_id,
+        **{column.key: deltas[name] for name, column in ROLLUP_FIELDS.items()}
+    )
+
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CoSpaceRollup.co_space_id],
+        set_={
+            column.key: column + stmt.excluded[column.key]
+            for column in ROLLUP_FIELDS.values()
+        } | {
+            CoSpaceRollup.co_space_rollup_updated_at.key: func.now()
+        }
+    )
+
+    db.execute(stmt)
+
+
+# ============================================
+# Compute From Base Tables (rebuild / fallback)
+# ============================================
+
+def compute_co_space_rollups(db: Session, co_space_ids=None) -> dict:
+
+    rollups = {}
+
+    space_query = select(CoSpace.co_space_id)
+    fund_query = select(
+        CoSpaceFund.co_space_id,
+        func.coalesce(func.sum(CoSpaceFund.co_space_fund_total_amount), 0),
+        func.coalesce(func.sum(CoSpaceFund.co_space_fund_remaining_amount), 0),
+        func.coalesce(func.sum(CoSpaceFund.co_space_fund_yearly_expense_total), 0),
+        func.count()
+    ).group_by(CoSpaceFund.co_space_id)
+    pending_query = select(
+        Expense.co_space_id,
+        func.count()
+    ).where(
+        Expense.co_space_id.is_not(None),
+        Expense.expense_status == "pending"
+    ).group_by(Expense.co_space_id)
+
+    if co_space_ids is not None:
+        space_query = space_query.where(CoSpace.co_space_id.in_(co_space_ids))
+        fund_query = fund_query.where(CoSpaceFund.co_space_id.in_(co_space_ids))
+        pending_query = pending_query.where(Expense.co_space_id.in_(co_space_ids))
+
+    for co_space_id in db.execute(space_query).scalars():
+        rollups[co_space_id] = {
+            "total_contribution": Decimal("0.00"),
+            "total_remaining": Decimal("0.00"),
+            "total_spent": Decimal("0.00"),
+            "pending_count": 0,
+            "member_count": 0,
+        }
+
+    for co_space_id, contribution, remaining, spent, members in db.execute(fund_query):
+        if co_space_id in rollups:
+            rollups[co_space_id].update(
+                total_contribution=Decimal(contribution),
+                total_remaining=Decimal(remaining),
+                total_spent=Decimal(spent),
+                member_count=members
+            )
+
+    for co_space_id, pending in db.execute(pending_query):
+        if co_space_id in rollups:
+            rollups[co_space_id]["pending_count"] = pending
+
+    return rollups
+
+
+def rollup_as_dict(rollup: CoSpaceRollup) -> dict:
+    return {name: getattr(rollup, column.key) for name, column in ROLLUP_FIELDS.items()}
+
+
+# ============================================
+# Rebuild + Verify
+# Returns the co-spaces whose stored rollup disagreed with the base
+# tables; unless check_only, those rows are rewritten in place.
+# ============================================
+
+def rebuild_co_space_rollups(db: Session, check_only: bool = False) -> list:
+
+    expected = compute_co_space_rollups(db)
+
+    stored = {
+        rollup.co_space_id: rollup_as_dict(rollup)
+        for rollup in db.query(CoSpaceRollup).all()
+    }
+
+    mismatches = []
+
+    for co_space_id, values in expected.items():
+        current = stored.get(co_space_id)
+
+        if current is not None and all(
+            Decimal(current[name]) == Decimal(values[name]) for name in values
+        ):
+            continue
+
+        mismatches.append({
+            "co_space_id": co_space_id,
+            "stored": current,
+            "expected": values,
+        })
+
+        if not check_only:
+            stmt = dialect_insert(db, CoSpaceRollup).values(
+                co_space_id=co_space_id,
+                **{ROLLUP_FIELDS[name].key: value for name, value in values.items()}
+            )
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[CoSpaceRollup.co_space_id],
+                set_={
+                    ROLLUP_FIELDS[name].key: stmt.excluded[ROLLUP_FIELDS[name].key]
+                    for name in values
+                } | {
+                    CoSpaceRollup.co_space_rollup_updated_at.key: func.now()
+                }
+            ))
+
+    if not check_only:
+        db.commit()
+
+    return mismatches
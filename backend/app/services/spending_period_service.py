@@ -0,0 +1,493 @@
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+
+from fastapi import HTTPException
+from sqlalchemy import Integer, and_, case, cast, delete, extract, func, literal, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.database import dialect_insert
+from app.models.co_space_fund_model import CoSpaceFund
+from app.models.co_space_member_model import CoSpaceMember
+from app.models.co_space_member_spending_period_model import CoSpaceMemberSpendingPeriod
+from app.models.expense_model import Expense
+from app.models.user_spending_period_model import UserSpendingPeriod
+
+
+# ============================================
+# Periods
+# A period is a calendar month, (year, month), of the expense's
+# created_at. Ranges are inclusive on both ends.
+# ============================================
+
+def period_of(moment: datetime):
+    return moment.year, moment.month
+
+
+def parse_period(value: str):
+
+    try:
+        year, month = (int(part) for part in value.split("-"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid period '{value}', expected YYYY-MM")
+
+    if not 1 <= month <= 12 or not 1 <= year <= 9999:
+        raise HTTPException(status_code=400, detail=f"Invalid period '{value}', expected YYYY-MM")
+
+    return year, month
+
+
+def format_period(period) -> str:
+    return f"{period[0]:04d}-{period[1]:02d}"
+
+
+def resolve_period_range(start: str = None, end: str = None):
+    """
+    Defaults to the current year up to the current month.
+    """
+
+    end_period = parse_period(end) if end else period_of(datetime.utcnow())
+    start_period = parse_period(start) if start else (end_period[0], 1)
+
+    if start_period > end_period:
+        raise HTTPException(status_code=400, detail="from cannot be after to")
+
+    return start_period, end_period
+
+
+def equal_split(amount: Decimal, count: int) -> list:
+    """
+    The co-space split approval_service applies: an equal share per
+    member rounded to cents, the remainder on the first member (members
+    ordered by user_id).
+    """
+
+    rounded_split = (amount / Decimal(count)).quantize(
+        Decimal("0.01"),
+        rounding=ROUND_HALF_UP
+    )
+
+    remainder = amount - rounded_split * count
+
+    return [rounded_split + remainder] + [rounded_split] * (count - 1)
+
+
+# ============================================
+# Apply Deltas (same transaction as the expense change)
+# Multi-row INSERT ... ON CONFLICT DO UPDATE, so buckets are created on
+# first use and concurrent writers add to the same row.
+# ============================================
+
+def _upsert_user_buckets(db: Session, stmt):
+
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[
+            UserSpendingPeriod.user_id,
+            UserSpendingPeriod.period_year,
+            UserSpendingPeriod.period_month
+        ],
+        set_={
+            UserSpendingPeriod.user_spending_period_total.key:
+                UserSpendingPeriod.user_spending_period_total
+                + stmt.excluded.user_spending_period_total,
+            UserSpendingPeriod.user_spending_period_expense_count.key:
+                UserSpendingPeriod.user_spending_period_expense_count
+                + stmt.excluded.user_spending_period_expense_count,
+            UserSpendingPeriod.user_spending_period_updated_at.key: func.now()
+        }
+    ))
+
+
+def add_user_spending(db: Session, user_id, amounts: dict):
+    """
+    amounts maps (year, month) to (total, expense_count).
+    """
+
+    if not amounts:
+        return
+
+    _upsert_user_buckets(db, dialect_insert(db, UserSpendingPeriod).values([
+        {
+            "user_id": user_id,
+            "period_year": year,
+            "period_month": month,
+            "user_spending_period_total": total,
+            "user_spending_period_expense_count": count,
+        }
+        for (year, month), (total, count) in amounts.items()
+    ]))
+
+
+def add_user_spending_for_expense(db: Session, expense_id):
+    """
+    Buckets a flushed expense whose created_at the database assigned,
+    reading the period from the row itself (INSERT ... SELECT).
+    """
+
+    _upsert_user_buckets(db, dialect_insert(db, UserSpendingPeriod).from_select(
+        [
+            UserSpendingPeriod.user_id,
+            UserSpendingPeriod.period_year,
+            UserSpendingPeriod.period_month,
+            UserSpendingPeriod.user_spending_period_total,
+            UserSpendingPeriod.user_spending_period_expense_count,
+        ],
+        select(
+            Expense.expense_payer_user_id,
+            cast(extract("year", Expense.expense_created_at), Integer),
+            cast(extract("month", Expense.expense_created_at), Integer),
+            Expense.expense_amount,
+            literal(1)
+        ).where(Expense.expense_id == expense_id)
+    ))
+
+
+def add_co_space_member_spending(db: Session, co_space_id, spent_at: datetime, shares: dict):
+    """
+    shares maps member user_id to that member's part of one expense.
+    """
+
+    year, month = period_of(spent_at)
+
+    add_co_space_member_spending_buckets(db, {
+        (co_space_id, user_id, year, month): (share, 1)
+        for user_id, share in shares.items()
+    })
+
+
+def add_co_space_member_spending_buckets(db: Session, buckets: dict):
+    """
+    buckets maps (co_space_id, user_id, year, month) to
+    (total, expense_count), for writers covering many expenses at once.
+    """
+
+    if not buckets:
+        return
+
+    stmt = dialect_insert(db, CoSpaceMemberSpendingPeriod).values([
+        {
+            "co_space_id": co_space_id,
+            "user_id": user_id,
+            "period_year": year,
+            "period_month": month,
+            "co_space_member_spending_period_total": total,
+            "co_space_member_spending_period_expense_count": count,
+        }
+        for (co_space_id, user_id, year, month), (total, count) in buckets.items()
+    ])
+
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[
+            CoSpaceMemberSpendingPeriod.co_space_id,
+            CoSpaceMemberSpendingPeriod.user_id,
+            CoSpaceMemberSpendingPeriod.period_year,
+            CoSpaceMemberSpendingPeriod.period_month
+        ],
+        set_={
+            CoSpaceMemberSpendingPeriod.co_space_member_spending_period_total.key:
+                CoSpaceMemberSpendingPeriod.co_space_member_spending_period_total
+                + stmt.excluded.co_space_member_spending_period_total,
+            CoSpaceMemberSpendingPeriod.co_space_member_spending_period_expense_count.key:
+                CoSpaceMemberSpendingPeriod.co_space_member_spending_period_expense_count
+                + stmt.excluded.co_space_member_spending_period_expense_count,
+            CoSpaceMemberSpendingPeriod.co_space_member_spending_period_updated_at.key: func.now()
+        }
+    ))
+
+
+# ============================================
+# Period Reports (primary-key range reads, O(buckets))
+# ============================================
+
+def _in_range(model, start, end):
+
+    bucket = tuple_(model.period_year, model.period_month)
+
+    return and_(bucket >= tuple_(*start), bucket <= tuple_(*end))
+
+
+def get_user_spending(db: Session, user_id, start, end) -> dict:
+
+    buckets = db.execute(
+        select(
+            UserSpendingPeriod.period_year,
+            UserSpendingPeriod.period_month,
+            UserSpendingPeriod.user_spending_period_total,
+            UserSpendingPeriod.user_spending_period_expense_count
+        ).where(
+            UserSpendingPeriod.user_id == user_id,
+            _in_range(UserSpendingPeriod, start, end)
+        ).order_by(
+            UserSpendingPeriod.period_year,
+            UserSpendingPeriod.period_month
+        )
+    ).all()
+
+    periods = [
+        {
+            "period": format_period((year, month)),
+            "total": total,
+            "expense_count": count,
+        }
+        for year, month, total, count in buckets
+    ]
+
+    return {
+        "from_period": format_period(start),
+        "to_period": format_period(end),
+        "total": sum((period["total"] for period in periods), Decimal("0.00")),
+        "expense_count": sum(period["expense_count"] for period in periods),
+        "periods": periods,
+    }
+
+
+def get_co_space_spending(db: Session, co_space_id, start, end) -> dict:
+
+    buckets = db.execute(
+        select(
+            CoSpaceMemberSpendingPeriod.period_year,
+            CoSpaceMemberSpendingPeriod.period_month,
+            CoSpaceMemberSpendingPeriod.user_id,
+            CoSpaceMemberSpendingPeriod.co_space_member_spending_period_total,
+            CoSpaceMemberSpendingPeriod.co_space_member_spending_period_expense_count
+        ).where(
+            CoSpaceMemberSpendingPeriod.co_space_id == co_space_id,
+            _in_range(CoSpaceMemberSpendingPeriod, start, end)
+        ).order_by(
+            CoSpaceMemberSpendingPeriod.period_year,
+            CoSpaceMemberSpendingPeriod.period_month,
+            CoSpaceMemberSpendingPeriod.user_id
+        )
+    ).all()
+
+    periods = {}
+    members = {}
+
+    for year, month, user_id, total, count in buckets:
+
+        period = periods.setdefault((year, month), {
+            "period": format_period((year, month)),
+            "total": Decimal("0.00"),
+            "members": [],
+        })
+        period["total"] += total
+        period["members"].append({"user_id": user_id, "total": total, "expense_count": count})
+
+        member = members.setdefault(user_id, {"user_id": user_id, "total": Decimal("0.00"), "expense_count": 0})
+        member["total"] += total
+        member["expense_count"] += count
+
+    return {
+        "from_period": format_period(start),
+        "to_period": format_period(end),
+        "total": sum((period["total"] for period in periods.values()), Decimal("0.00")),
+        "periods": list(periods.values()),
+        "members": sorted(members.values(), key=lambda member: member["user_id"]),
+    }
+
+
+# ============================================
+# Dashboard Totals (one bucket read per year)
+# ============================================
+
+def get_user_period_totals(db: Session, user_id, now: datetime):
+
+    year, month = period_of(now)
+    zero = literal(Decimal("0.00"), UserSpendingPeriod.user_spending_period_total.type)
+
+    monthly, yearly = db.execute(
+        select(
+            func.coalesce(func.sum(case(
+                (UserSpendingPeriod.period_month == month, UserSpendingPeriod.user_spending_period_total),
+                else_=zero
+            )), zero),
+            func.coalesce(func.sum(UserSpendingPeriod.user_spending_period_total), zero)
+        ).where(
+            UserSpendingPeriod.user_id == user_id,
+            UserSpendingPeriod.period_year == year
+        )
+    ).one()
+
+    return Decimal(monthly), Decimal(yearly)
+
+
+def get_co_space_member_period_totals(db: Session, co_space_id, now: datetime) -> dict:
+    """
+    {user_id: (monthly_total, yearly_total)} for members with spending
+    this year.
+    """
+
+    year, month = period_of(now)
+    zero = literal(Decimal("0.00"), CoSpaceMemberSpendingPeriod.co_space_member_spending_period_total.type)
+
+    rows = db.execute(
+        select(
+            CoSpaceMemberSpendingPeriod.user_id,
+            func.sum(case(
+                (
+                    CoSpaceMemberSpendingPeriod.period_month == month,
+                    CoSpaceMemberSpendingPeriod.co_space_member_spending_period_total
+                ),
+                else_=zero
+            )),
+            func.sum(CoSpaceMemberSpendingPeriod.co_space_member_spending_period_total)
+        ).where(
+            CoSpaceMemberSpendingPeriod.co_space_id == co_space_id,
+            CoSpaceMemberSpendingPeriod.period_year == year
+        ).group_by(CoSpaceMemberSpendingPeriod.user_id)
+    ).all()
+
+    return {
+        user_id: (Decimal(monthly), Decimal(yearly))
+        for user_id, monthly, yearly in rows
+    }
+
+
+# ============================================
+# Compute From Base Tables (rebuild)
+# Personal buckets are exact: approved personal expenses grouped by
+# payer and month. Member shares are not stored per expense, so member
+# buckets replay the split over the co-space's *current* accepted fund
+# holders; co-spaces whose membership changed since an approval come out
+# approximate.
+# ============================================
+
+def compute_user_buckets(db: Session) -> dict:
+
+    year = cast(extract("year", Expense.expense_created_at), Integer)
+    month = cast(extract("month", Expense.expense_created_at), Integer)
+
+    return {
+        (user_id, bucket_year, bucket_month): (Decimal(total), count)
+        for user_id, bucket_year, bucket_month, total, count in db.execute(
+            select(
+                Expense.expense_payer_user_id,
+                year,
+                month,
+                func.sum(Expense.expense_amount),
+                func.count()
+            ).where(
+                Expense.expense_from_fund_type == "personal",
+                Expense.expense_status == "approved"
+            ).group_by(Expense.expense_payer_user_id, year, month)
+        )
+    }
+
+
+def compute_co_space_member_buckets(db: Session) -> dict:
+
+    members_by_space = {}
+
+    for co_space_id, user_id in db.execute(
+        select(CoSpaceFund.co_space_id, CoSpaceFund.user_id)
+        .join(
+            CoSpaceMember,
+            (CoSpaceMember.co_space_id == CoSpaceFund.co_space_id)
+            & (CoSpaceMember.user_id == CoSpaceFund.user_id)
+        )
+        .where(CoSpaceMember.co_space_member_status == "accepted")
+        .order_by(CoSpaceFund.co_space_id, CoSpaceFund.user_id)
+    ):
+        members_by_space.setdefault(co_space_id, []).append(user_id)
+
+    buckets = {}
+
+    for co_space_id, amount, created_at in db.execute(
+        select(Expense.co_space_id, Expense.expense_amount, Expense.expense_created_at)
+        .where(
+            Expense.expense_from_fund_type == "co_space",
+            Expense.expense_status == "approved"
+        )
+        .execution_options(yield_per=5000)
+    ):
+        members = members_by_space.get(co_space_id)
+
+        if not members:
+            continue
+
+        year, month = period_of(created_at)
+
+        for user_id, share in zip(members, equal_split(amount, len(members))):
+            total, count = buckets.get((co_space_id, user_id, year, month), (Decimal("0.00"), 0))
+            buckets[(co_space_id, user_id, year, month)] = (total + share, count + 1)
+
+    return buckets
+
+
+# ============================================
+# Rebuild + Verify
+# Returns the buckets that disagreed with the base tables; unless
+# check_only, drifted buckets are rewritten and orphaned ones deleted.
+# ============================================
+
+_BUCKET_TABLES = {
+    "user": (
+        UserSpendingPeriod,
+        [UserSpendingPeriod.user_id],
+        UserSpendingPeriod.user_spending_period_total,
+        UserSpendingPeriod.user_spending_period_expense_count,
+        compute_user_buckets
+    ),
+    "co_space_member": (
+        CoSpaceMemberSpendingPeriod,
+        [CoSpaceMemberSpendingPeriod.co_space_id, CoSpaceMemberSpendingPeriod.user_id],
+        CoSpaceMemberSpendingPeriod.co_space_member_spending_period_total,
+        CoSpaceMemberSpendingPeriod.co_space_member_spending_period_expense_count,
+        compute_co_space_member_buckets
+    ),
+}
+
+
+def rebuild_spending_periods(db: Session, check_only: bool = False) -> list:
+
+    mismatches = []
+
+    for kind, (model, entity_columns, total_column, count_column, compute) in _BUCKET_TABLES.items():
+
+        key_columns = entity_columns + [model.period_year, model.period_month]
+        expected = compute(db)
+
+        stored = {
+            tuple(row[:-2]): (Decimal(row[-2]), row[-1])
+            for row in db.execute(select(*key_columns, total_column, count_column))
+        }
+
+        for key in expected.keys() | stored.keys():
+
+            if expected.get(key) == stored.get(key):
+                continue
+
+            mismatches.append({
+                "kind": kind,
+                "key": key,
+                "stored": stored.get(key),
+                "expected": expected.get(key),
+            })
+
+            if check_only:
+                continue
+
+            key_values = {column.key: value for column, value in zip(key_columns, key)}
+
+            if key not in expected:
+                db.execute(delete(model).where(*(
+                    column == value for column, value in zip(key_columns, key)
+                )))
+                continue
+
+            total, count = expected[key]
+            stmt = dialect_insert(db, model).values(
+                **key_values,
+                **{total_column.key: total, count_column.key: count}
+            )
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=key_columns,
+                set_={
+                    total_column.key: stmt.excluded[total_column.key],
+                    count_column.key: stmt.excluded[count_column.key],
+                }
+            ))
+
+    if not check_only:
+        db.commit()
+
+    return mismatches
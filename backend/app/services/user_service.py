@@ -1,6 +1,7 @@
 import uuid
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
+from app.core.principal_cache import invalidate_principal
 from app.models.user_model import User
 from app.models.user_fund_model import UserFund
 from app.schemas.user_schema import UserCreate, UserUpdate
@@ -71,6 +72,14 @@ def get_user_by_id(db: Session, user_id: uuid.UUID):
     return user
 
 
+def get_user_version(db: Session, user_id: uuid.UUID):
+    """The version only (ETag checks); None when there is no such user."""
+
+    return db.query(
+        User.user_version
+    ).filter(User.user_id == user_id).first()
+
+
 # ============================================
 # Update User
 # ============================================
@@ -85,6 +94,7 @@ def update_user(db: Session, user_id: uuid.UUID, user_data: UserUpdate):
     for field, value in user_data.model_dump(exclude_unset=True).items():
         setattr(user, field, value)
 
+    invalidate_principal(db, user_id)
     db.commit()
     db.refresh(user)
 
@@ -104,6 +114,7 @@ def deactivate_user(db: Session, user_id: uuid.UUID):
 
     user.user_is_active = False
 
+    invalidate_principal(db, user_id)
     db.commit()
     db.refresh(user)
 
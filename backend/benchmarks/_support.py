@@ -0,0 +1,95 @@
+"""
+Shared setup for the benchmark scripts.
+
+Benchmarks run against DATABASE_URL when it is set (point it at a local
+Postgres for numbers that matter) and otherwise against a throwaway
+SQLite file, so they can be run without any infrastructure.
+"""
+
+import importlib
+import json
+import math
+import os
+import pkgutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def configure_environment(name: str):
+    """Must run before anything under app/ is imported."""
+
+    if not os.getenv("DATABASE_URL"):
+        path = os.path.join(tempfile.gettempdir(), f"expense-tracker-{name}.db")
+
+        if os.path.exists(path):
+            os.remove(path)
+
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+        os.environ.setdefault("ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("JWT_ALGORITHM", "HS256")
+    os.environ.setdefault("DB_ECHO", "false")
+
+
+def create_schema():
+
+    from app.core.database import Base, engine
+    import app.models
+
+    for module in pkgutil.iter_modules(app.models.__path__):
+        importlib.import_module(f"app.models.{module.name}")
+
+    Base.metadata.create_all(engine)
+
+
+def percentile(values, pct: float) -> float:
+
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def latency_summary(values) -> dict:
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(max(values) * 1000, 3) if values else 0.0,
+    }
+
+
+@contextmanager
+def count_statements(engine):
+    """Counts SQL statements sent through `engine` inside the block."""
+
+    from sqlalchemy import event
+
+    counter = {"statements": 0}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter["statements"] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    started = time.perf_counter()
+
+    try:
+        yield counter
+    finally:
+        counter["seconds"] = time.perf_counter() - started
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def emit(report: dict):
+    print(json.dumps(report, indent=2, default=str))
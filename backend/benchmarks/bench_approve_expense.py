@@ -0,0 +1,159 @@
+"""
+Final-approval benchmark for co-space expenses.
+
+For each co-space size, seeds one pending co-space expense where every
+member but one has already approved, then times the last
+approval_service.approve_expense call and counts the SQL statements it
+issues. Fund finalization is set-based, so the statement count should
+stay flat as the co-space grows.
+
+    python benchmarks/bench_approve_expense.py --sizes 10 50 200 1000
+"""
+
+import argparse
+import time
+import uuid
+from decimal import Decimal
+
+import _support
+
+_support.configure_environment("approve-expense")
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.models.co_space_fund_model import CoSpaceFund  # noqa: E402
+from app.models.co_space_member_model import CoSpaceMember  # noqa: E402
+from app.models.co_space_model import CoSpace  # noqa: E402
+from app.models.expense_approval_model import ExpenseApproval  # noqa: E402
+from app.models.expense_model import Expense  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+from app.services import approval_service  # noqa: E402
+
+
+def seed_co_space(db, size: int):
+    """Returns (expense_id, last_approver_user_id)."""
+
+    user_ids = [uuid.uuid4() for _ in range(size)]
+    co_space_id = uuid.uuid4()
+    expense_id = uuid.uuid4()
+
+    db.execute(insert(User), [
+        {
+            "user_id": user_id,
+            "user_name": f"member-{i}",
+            "user_email": f"{user_id}@example.com",
+            "user_password": "x",
+            "user_is_active": True,
+        }
+        for i, user_id in enumerate(user_ids)
+    ])
+    db.execute(insert(CoSpace), [{
+        "co_space_id": co_space_id,
+        "co_space_name": f"bench-{size}",
+        "co_space_created_by_user_id": user_ids[0],
+    }])
+    db.execute(insert(CoSpaceMember), [
+        {
+            "co_space_member_id": uuid.uuid4(),
+            "co_space_id": co_space_id,
+            "user_id": user_id,
+            "co_space_member_status": "accepted",
+        }
+        for user_id in user_ids
+    ])
+    db.execute(insert(CoSpaceFund), [
+        {
+            "co_space_fund_id": uuid.uuid4(),
+            "co_space_id": co_space_id,
+            "user_id": user_id,
+            "co_space_fund_total_amount": Decimal("1000000.00"),
+            "co_space_fund_monthly_expense_total": Decimal("0.00"),
+            "co_space_fund_yearly_expense_total": Decimal("0.00"),
+            "co_space_fund_remaining_amount": Decimal("1000000.00"),
+        }
+        for user_id in user_ids
+    ])
+    db.execute(insert(Expense), [{
+        "expense_id": expense_id,
+        "expense_payer_user_id": user_ids[0],
+        "co_space_id": co_space_id,
+        "expense_amount": Decimal("1000.00"),
+        "expense_from_fund_type": "co_space",
+        "expense_is_for_type": "group",
+        "expense_status": "pending",
+    }])
+
+    approvers = user_ids[1:]
+    db.execute(insert(ExpenseApproval), [
+        {
+            "expense_approval_id": uuid.uuid4(),
+            "expense_id": expense_id,
+            "user_id": user_id,
+            "expense_approval_status": "approved" if i < len(approvers) - 1 else "pending",
+        }
+        for i, user_id in enumerate(approvers)
+    ])
+    db.commit()
+
+    return expense_id, approvers[-1]
+
+
+def run(args):
+
+    _support.create_schema()
+    results = []
+
+    for size in args.sizes:
+        db = SessionLocal()
+
+        try:
+            expense_id, last_approver = seed_co_space(db, size)
+        finally:
+            db.close()
+
+        timings = []
+        statements = None
+
+        for _ in range(args.repeat):
+            db = SessionLocal()
+
+            try:
+                with _support.count_statements(engine) as counter:
+                    started = time.perf_counter()
+                    approval_service.approve_expense(db, expense_id, last_approver)
+                    timings.append(time.perf_counter() - started)
+
+                statements = counter["statements"]
+            finally:
+                db.close()
+
+            # Re-open the final approval for the next repetition
+            db = SessionLocal()
+
+            try:
+                db.query(ExpenseApproval).filter(
+                    ExpenseApproval.expense_id == expense_id,
+                    ExpenseApproval.user_id == last_approver
+                ).update({"expense_approval_status": "pending"})
+                db.query(Expense).filter(
+                    Expense.expense_id == expense_id
+                ).update({"expense_status": "pending"})
+                db.commit()
+            finally:
+                db.close()
+
+        results.append({
+            "co_space_size": size,
+            "statements": statements,
+            "latency": _support.latency_summary(timings),
+        })
+
+    _support.emit({"benchmark": "approve_expense_finalization", "results": results})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    run(parser.parse_args())
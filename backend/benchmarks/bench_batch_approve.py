@@ -0,0 +1,407 @@
+"""
+Batch approval benchmark.
+
+Seeds two identical sets of --batch pending expenses spread over
+--co-spaces co-spaces (each with --members members), where one
+approver's response is the last one outstanding. One set is approved
+with a single approval_service.approve_expenses call, the other with the
+same number of approve_expense calls. Reports wall time and SQL
+statements for both; the batch's statement count should depend on the
+number of co-spaces, not on the batch size.
+
+Every seventh expense is paid from the payer's personal fund, amounts and
+months vary, and the last co-space's pool and the first payer's personal
+fund run out partway, so both paths also have to agree on which
+approvals fail. Afterwards the two sets' fund balances, ledger entries,
+spending buckets, rollups and expense/approval statuses are compared
+row for row; any difference fails the run.
+
+    python benchmarks/bench_batch_approve.py --batch 500 --co-spaces 5
+"""
+
+import argparse
+import itertools
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import _support
+
+_support.configure_environment("batch-approve")
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.models.co_space_fund_model import CoSpaceFund  # noqa: E402
+from app.models.co_space_member_model import CoSpaceMember  # noqa: E402
+from app.models.co_space_member_spending_period_model import CoSpaceMemberSpendingPeriod  # noqa: E402
+from app.models.co_space_model import CoSpace  # noqa: E402
+from app.models.co_space_rollup_model import CoSpaceRollup  # noqa: E402
+from app.models.expense_approval_model import ExpenseApproval  # noqa: E402
+from app.models.expense_model import Expense  # noqa: E402
+from app.models.fund_ledger_entry_model import FundLedgerEntry  # noqa: E402
+from app.models.user_fund_model import UserFund  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+from app.models.user_spending_period_model import UserSpendingPeriod  # noqa: E402
+from app.services import approval_service  # noqa: E402
+from app.services.rollup_service import rebuild_co_space_rollups  # noqa: E402
+from app.services.spending_period_service import rebuild_spending_periods  # noqa: E402
+
+
+# ============================================
+# Seeding
+# Ids are sequential instead of random: the co-space split puts the
+# remainder cent on the lowest user_id, so both sets need their rows in
+# the same order, and the sequence number is what rows are matched on
+# when the sets are compared. The fixed prefix keeps the hex from being
+# all digits, which SQLite would store as a number.
+# ============================================
+
+ID_PREFIX = 0xbe << 120
+SEQUENCE_BITS = 64
+SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+
+CREATED_FROM = datetime(2025, 1, 15, 12, 0)
+
+
+class IdSequence:
+
+    def __init__(self, world: int):
+        self.world = world
+        self.counter = itertools.count(1)
+
+    def __call__(self) -> uuid.UUID:
+        return uuid.UUID(int=ID_PREFIX | (self.world << SEQUENCE_BITS) | next(self.counter))
+
+
+def seed_users(db, new_id, count: int):
+
+    user_ids = [new_id() for _ in range(count)]
+
+    db.execute(insert(User), [
+        {
+            "user_id": user_id,
+            "user_name": f"member-{i}",
+            "user_email": f"{user_id}@example.com",
+            "user_password": "x",
+            "user_is_active": True,
+        }
+        for i, user_id in enumerate(user_ids)
+    ])
+
+    return user_ids
+
+
+def seed_co_spaces(db, new_id, approver, co_spaces: int, members: int):
+    """[(co_space_id, payer)]; the last co-space's pool is too small."""
+
+    co_space_ids = []
+
+    for index in range(co_spaces):
+
+        co_space_id = new_id()
+        member_ids = [approver] + seed_users(db, new_id, members - 1)
+        contribution = Decimal("5.00") if index == co_spaces - 1 else Decimal("1000000.00")
+
+        db.execute(insert(CoSpace), [{
+            "co_space_id": co_space_id,
+            "co_space_name": f"bench-{index}",
+            "co_space_created_by_user_id": member_ids[0],
+        }])
+        db.execute(insert(CoSpaceMember), [
+            {
+                "co_space_member_id": new_id(),
+                "co_space_id": co_space_id,
+                "user_id": user_id,
+                "co_space_member_status": "accepted",
+            }
+            for user_id in member_ids
+        ])
+        db.execute(insert(CoSpaceFund), [
+            {
+                "co_space_fund_id": new_id(),
+                "co_space_id": co_space_id,
+                "user_id": user_id,
+                "co_space_fund_total_amount": contribution,
+                "co_space_fund_monthly_expense_total": Decimal("0.00"),
+                "co_space_fund_yearly_expense_total": Decimal("0.00"),
+                "co_space_fund_remaining_amount": contribution,
+            }
+            for user_id in member_ids
+        ])
+
+        co_space_ids.append((co_space_id, member_ids[1]))
+
+    return co_space_ids
+
+
+def seed_user_funds(db, payers):
+    """The first payer's personal fund is too small."""
+
+    db.execute(insert(UserFund), [
+        {
+            "user_id": payer,
+            "user_fund_total_amount": amount,
+            "user_fund_monthly_expense_total": Decimal("0.00"),
+            "user_fund_yearly_expense_total": Decimal("0.00"),
+            "user_fund_remaining_amount": amount,
+        }
+        for index, payer in enumerate(payers)
+        for amount in [Decimal("50.00") if index == 0 else Decimal("1000000.00")]
+    ])
+
+
+def seed_expenses(db, new_id, approver, co_space_ids, count: int):
+    """
+    Pending expenses whose only outstanding approval is approver's,
+    returned oldest first: the order approve_expenses finalizes them in,
+    and so the order the one-by-one run must follow to spend the short
+    funds the same way.
+    """
+
+    expenses = []
+    approvals = []
+
+    for i in range(count):
+
+        co_space_id, payer = co_space_ids[i % len(co_space_ids)]
+        expense_id = new_id()
+
+        expenses.append({
+            "expense_id": expense_id,
+            "expense_payer_user_id": payer,
+            "co_space_id": co_space_id,
+            "expense_amount": Decimal(f"{1 + i % 23}.{i * 37 % 100:02d}"),
+            "expense_from_fund_type": "personal" if i % 7 == 3 else "co_space",
+            "expense_is_for_type": "group",
+            "expense_status": "pending",
+            "expense_created_at": CREATED_FROM + timedelta(days=i * 13 % 420),
+        })
+        approvals.append({
+            "expense_approval_id": new_id(),
+            "expense_id": expense_id,
+            "user_id": approver,
+            "expense_approval_status": "pending",
+        })
+
+    db.execute(insert(Expense), expenses)
+    db.execute(insert(ExpenseApproval), approvals)
+
+    expenses.sort(key=lambda expense: (expense["expense_created_at"], expense["expense_id"]))
+
+    return [expense["expense_id"] for expense in expenses]
+
+
+def seed_world(db, world: int, args) -> dict:
+
+    new_id = IdSequence(world)
+
+    approver = seed_users(db, new_id, 1)[0]
+    co_space_ids = seed_co_spaces(db, new_id, approver, args.co_spaces, args.members)
+    payers = [payer for _, payer in co_space_ids]
+    seed_user_funds(db, payers)
+
+    return {
+        "approver": approver,
+        "co_space_ids": [co_space_id for co_space_id, _ in co_space_ids],
+        "payers": payers,
+        "expense_ids": seed_expenses(db, new_id, approver, co_space_ids, args.batch),
+    }
+
+
+# ============================================
+# Resulting State
+# Every row a finalized expense touches, with ids reduced to their
+# sequence numbers and versions/timestamps left out
+# ============================================
+
+def _comparable(value):
+
+    if isinstance(value, uuid.UUID):
+        return value.int & SEQUENCE_MASK
+
+    return value
+
+
+def resulting_state(db, world: dict) -> dict:
+
+    co_space_ids = world["co_space_ids"]
+    payers = world["payers"]
+    expense_ids = world["expense_ids"]
+
+    queries = {
+        "co_space_funds": select(
+            CoSpaceFund.co_space_fund_id,
+            CoSpaceFund.co_space_fund_total_amount,
+            CoSpaceFund.co_space_fund_remaining_amount,
+            CoSpaceFund.co_space_fund_monthly_expense_total,
+            CoSpaceFund.co_space_fund_yearly_expense_total
+        ).where(CoSpaceFund.co_space_id.in_(co_space_ids)),
+        "user_funds": select(
+            UserFund.user_id,
+            UserFund.user_fund_total_amount,
+            UserFund.user_fund_remaining_amount,
+            UserFund.user_fund_monthly_expense_total,
+            UserFund.user_fund_yearly_expense_total
+        ).where(UserFund.user_id.in_(payers)),
+        "ledger_entries": select(
+            FundLedgerEntry.fund_ledger_fund_type,
+            FundLedgerEntry.fund_ledger_fund_id,
+            FundLedgerEntry.fund_ledger_entry_type,
+            FundLedgerEntry.fund_ledger_total_delta,
+            FundLedgerEntry.fund_ledger_remaining_delta,
+            FundLedgerEntry.expense_id
+        ).where(FundLedgerEntry.expense_id.in_(expense_ids)),
+        "co_space_member_spending": select(
+            CoSpaceMemberSpendingPeriod.co_space_id,
+            CoSpaceMemberSpendingPeriod.user_id,
+            CoSpaceMemberSpendingPeriod.period_year,
+            CoSpaceMemberSpendingPeriod.period_month,
+            CoSpaceMemberSpendingPeriod.co_space_member_spending_period_total,
+            CoSpaceMemberSpendingPeriod.co_space_member_spending_period_expense_count
+        ).where(CoSpaceMemberSpendingPeriod.co_space_id.in_(co_space_ids)),
+        "user_spending": select(
+            UserSpendingPeriod.user_id,
+            UserSpendingPeriod.period_year,
+            UserSpendingPeriod.period_month,
+            UserSpendingPeriod.user_spending_period_total,
+            UserSpendingPeriod.user_spending_period_expense_count
+        ).where(UserSpendingPeriod.user_id.in_(payers)),
+        "co_space_rollups": select(
+            CoSpaceRollup.co_space_id,
+            CoSpaceRollup.co_space_rollup_total_contribution,
+            CoSpaceRollup.co_space_rollup_total_remaining,
+            CoSpaceRollup.co_space_rollup_total_spent,
+            CoSpaceRollup.co_space_rollup_pending_count,
+            CoSpaceRollup.co_space_rollup_member_count
+        ).where(CoSpaceRollup.co_space_id.in_(co_space_ids)),
+        "expenses": select(
+            Expense.expense_id,
+            Expense.expense_status
+        ).where(Expense.expense_id.in_(expense_ids)),
+        "approvals": select(
+            ExpenseApproval.expense_approval_id,
+            ExpenseApproval.expense_approval_status
+        ).where(ExpenseApproval.expense_id.in_(expense_ids)),
+    }
+
+    return {
+        name: sorted(
+            tuple(_comparable(value) for value in row)
+            for row in db.execute(query)
+        )
+        for name, query in queries.items()
+    }
+
+
+def state_differences(expected: dict, actual: dict) -> dict:
+    """{table: rows present on only one side}"""
+
+    differences = {}
+
+    for name, rows in expected.items():
+        mismatched = set(rows).symmetric_difference(actual[name])
+
+        if mismatched or len(rows) != len(actual[name]):
+            differences[name] = len(mismatched)
+
+    return differences
+
+
+# ============================================
+# Run
+# ============================================
+
+def timed(fn):
+
+    db = SessionLocal()
+
+    try:
+        with _support.count_statements(engine) as counter:
+            started = time.perf_counter()
+            fn(db)
+            elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    return {"seconds": round(elapsed, 4), "statements": counter["statements"]}
+
+
+def run(args):
+
+    _support.create_schema()
+
+    db = SessionLocal()
+
+    try:
+        batch_world = seed_world(db, 1, args)
+        single_world = seed_world(db, 2, args)
+        db.commit()
+
+        # Derived tables the services keep up to date
+        rebuild_co_space_rollups(db)
+        rebuild_spending_periods(db)
+    finally:
+        db.close()
+
+    outcome = {}
+    single_failed = []
+
+    def approve_batch(db):
+        outcome.update(approval_service.approve_expenses(
+            db,
+            batch_world["expense_ids"],
+            batch_world["approver"]
+        ))
+
+    def approve_one_by_one(db):
+        for expense_id in single_world["expense_ids"]:
+            try:
+                approval_service.approve_expense(db, expense_id, single_world["approver"])
+            except HTTPException:
+                single_failed.append(expense_id)
+
+    batch = timed(approve_batch)
+    one_by_one = timed(approve_one_by_one)
+
+    db = SessionLocal()
+
+    try:
+        differences = state_differences(
+            resulting_state(db, single_world),
+            resulting_state(db, batch_world)
+        )
+    finally:
+        db.close()
+
+    if outcome["failed"] != len(single_failed):
+        differences["failed"] = abs(outcome["failed"] - len(single_failed))
+
+    _support.emit({
+        "benchmark": "batch_approve",
+        "batch_size": args.batch,
+        "co_spaces": args.co_spaces,
+        "members_per_co_space": args.members,
+        "succeeded": outcome["succeeded"],
+        "failed": outcome["failed"],
+        "batch": batch,
+        "one_by_one": one_by_one,
+        "state_matches": not differences,
+        "differences": differences,
+    })
+
+    if differences:
+        raise AssertionError(
+            "batch and one-by-one approvals left different state: "
+            + ", ".join(sorted(differences))
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--co-spaces", type=int, default=5)
+    parser.add_argument("--members", type=int, default=10)
+    run(parser.parse_args())
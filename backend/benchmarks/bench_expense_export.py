@@ -0,0 +1,161 @@
+"""
+Expense export throughput benchmark.
+
+Seeds --rows expenses for one user, then streams GET /expenses/export
+for each format (with and without gzip) and reports rows per second,
+bytes sent and the process's peak RSS growth. RSS should stay flat as
+--rows grows, since rows are read through a server-side cursor and sent
+partition by partition.
+
+    python benchmarks/bench_expense_export.py --rows 1000000
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from urllib.parse import urlencode
+
+import _support
+
+_support.configure_environment("expense-export")
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.expense_model import Expense  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+
+SEED_CHUNK = 10000
+
+
+def seed(rows: int):
+
+    user_id = uuid.uuid4()
+    started_at = datetime(2024, 1, 1)
+    db = SessionLocal()
+
+    try:
+        db.add(User(
+            user_id=user_id,
+            user_name="exporter",
+            user_email="exporter@example.com",
+            user_password="x",
+            user_is_active=True
+        ))
+        db.commit()
+
+        for offset in range(0, rows, SEED_CHUNK):
+            db.execute(insert(Expense), [
+                {
+                    "expense_id": uuid.uuid4(),
+                    "expense_payer_user_id": user_id,
+                    "expense_amount": Decimal("12.34"),
+                    "expense_message": f"expense {i}",
+                    "expense_from_fund_type": "personal",
+                    "expense_is_for_type": "self",
+                    "expense_status": "approved",
+                    "expense_created_at": started_at + timedelta(seconds=i),
+                }
+                for i in range(offset, min(rows, offset + SEED_CHUNK))
+            ])
+            db.commit()
+    finally:
+        db.close()
+
+    return user_id
+
+
+async def export_once(token: str, fmt: str, compress: bool):
+    """
+    Drives the ASGI app directly and only counts the body bytes (httpx's
+    ASGITransport buffers whole responses, which would hide the server's
+    own memory profile).
+    """
+
+    outcome = {"status": None, "sent": 0}
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/expenses/export",
+        "raw_path": b"/expenses/export",
+        "query_string": urlencode({"format": fmt, "gzip": str(compress).lower()}).encode(),
+        "root_path": "",
+        "headers": [(b"authorization", f"Bearer {token}".encode()), (b"host", b"bench")],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+
+    request_sent = asyncio.Event()
+    finished = asyncio.Event()
+
+    async def receive():
+        # The request body once, then block like a server would until
+        # the client goes away (here: once the response is complete)
+        if not request_sent.is_set():
+            request_sent.set()
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            outcome["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            outcome["sent"] += len(message.get("body", b""))
+
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    finished.set()
+
+    return outcome["status"], outcome["sent"], time.perf_counter() - started
+
+
+async def run(args):
+
+    _support.create_schema()
+    user_id = seed(args.rows)
+    token = create_access_token({"sub": str(user_id)})
+
+    results = []
+
+    for fmt in ("csv", "ndjson"):
+        for compress in (False, True):
+            rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            status, sent, elapsed = await export_once(token, fmt, compress)
+            rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+            results.append({
+                "format": fmt,
+                "gzip": compress,
+                "status": status,
+                "seconds": round(elapsed, 3),
+                "rows_per_second": round(args.rows / elapsed, 1),
+                "megabytes_sent": round(sent / 1024 / 1024, 2),
+                "peak_rss_growth_mb": round((rss_after - rss_before) / 1024, 1),
+            })
+
+    _support.emit({
+        "benchmark": "expense_export",
+        "rows": args.rows,
+        "batch_size": settings.EXPENSE_EXPORT_BATCH_SIZE,
+        "engine_mode": settings.DB_ENGINE_MODE,
+        "results": results,
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200000)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,143 @@
+"""
+Bulk expense import benchmark.
+
+Writes an NDJSON (or CSV) file of personal expenses to disk, streams it
+to POST /expenses/import and reports rows per second, statements per
+batch and the process's peak RSS growth. Memory should stay flat as
+--rows grows, since the upload is spooled to disk and applied one batch
+at a time.
+
+    python benchmarks/bench_expense_import.py --rows 1000000 --format ndjson
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import tempfile
+import time
+import uuid
+from decimal import Decimal
+
+import _support
+
+_support.configure_environment("expense-import")
+
+import httpx  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user_fund_model import UserFund  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+
+
+def seed_user(rows: int):
+
+    user_id = uuid.uuid4()
+    db = SessionLocal()
+
+    try:
+        db.add(User(
+            user_id=user_id,
+            user_name="importer",
+            user_email="importer@example.com",
+            user_password="x",
+            user_is_active=True
+        ))
+        db.flush()
+        db.add(UserFund(
+            user_id=user_id,
+            user_fund_total_amount=Decimal(rows),
+            user_fund_monthly_expense_total=Decimal("0.00"),
+            user_fund_yearly_expense_total=Decimal("0.00"),
+            user_fund_remaining_amount=Decimal(rows)
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+    return user_id
+
+
+def write_upload(path: str, rows: int, fmt: str):
+
+    with open(path, "w", encoding="utf-8") as f:
+
+        if fmt == "csv":
+            f.write("expense_amount,expense_from_fund_type,expense_is_for_type,expense_message,expense_created_at\n")
+
+        for i in range(rows):
+            created_at = f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T12:00:00"
+
+            if fmt == "csv":
+                f.write(f"0.50,personal,self,row {i},{created_at}\n")
+            else:
+                f.write(json.dumps({
+                    "expense_amount": "0.50",
+                    "expense_from_fund_type": "personal",
+                    "expense_is_for_type": "self",
+                    "expense_message": f"row {i}",
+                    "expense_created_at": created_at,
+                }) + "\n")
+
+
+async def stream_file(path: str, chunk_size: int = 64 * 1024):
+
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def run(args):
+
+    _support.create_schema()
+    user_id = seed_user(args.rows)
+    token = create_access_token({"sub": str(user_id)})
+
+    path = os.path.join(tempfile.gettempdir(), f"expense-import.{args.format}")
+    write_upload(path, args.rows, args.format)
+
+    content_type = "text/csv" if args.format == "csv" else "application/x-ndjson"
+    transport = httpx.ASGITransport(app=app)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        with _support.count_statements(engine) as counter:
+            started = time.perf_counter()
+            response = await client.post(
+                "/expenses/import",
+                content=stream_file(path),
+                headers={"Authorization": f"Bearer {token}", "Content-Type": content_type}
+            )
+            elapsed = time.perf_counter() - started
+
+    report = response.json()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    os.remove(path)
+
+    _support.emit({
+        "benchmark": "expense_import",
+        "format": args.format,
+        "rows": args.rows,
+        "batch_size": settings.EXPENSE_IMPORT_BATCH_SIZE,
+        "status": response.status_code,
+        "imported": report.get("imported"),
+        "failed": report.get("failed"),
+        "batches": report.get("batches"),
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(args.rows / elapsed, 1),
+        "statements": counter["statements"],
+        "statements_per_batch": round(counter["statements"] / max(1, report.get("batches", 1)), 2),
+        "peak_rss_growth_mb": round((rss_after - rss_before) / 1024, 1),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    asyncio.run(run(parser.parse_args()))
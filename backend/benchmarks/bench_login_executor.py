@@ -0,0 +1,125 @@
+"""
+Login storm benchmark for the bounded password executor.
+
+Measures login throughput while a set of probe clients keep hitting an
+unrelated endpoint (GET /users/{id}), and compares the probe latency with
+an idle baseline. With bcrypt on its own pool the probe p99 should stay
+close to the baseline even while logins saturate the password workers.
+
+    python benchmarks/bench_login_executor.py --duration 10 --login-concurrency 64
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import _support
+
+_support.configure_environment("login-executor")
+
+import httpx  # noqa: E402
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.core.password_executor import password_executor  # noqa: E402
+from app.core.security import hash_password  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+
+PASSWORD = "benchmark-password"
+
+
+def seed_users(count: int):
+
+    hashed = hash_password(PASSWORD)
+    db = SessionLocal()
+
+    try:
+        users = [
+            User(
+                user_id=uuid.uuid4(),
+                user_name=f"bench-{i}",
+                user_email=f"bench-{i}@example.com",
+                user_password=hashed,
+                user_is_active=True
+            )
+            for i in range(count)
+        ]
+        db.add_all(users)
+        db.commit()
+        return [(u.user_id, u.user_email) for u in users]
+    finally:
+        db.close()
+
+
+async def probe(client, user_ids, stop_at, latencies):
+
+    i = 0
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        await client.get(f"/users/{user_ids[i % len(user_ids)]}")
+        latencies.append(time.perf_counter() - started)
+        i += 1
+
+
+async def login_worker(client, emails, stop_at, outcome):
+
+    i = 0
+    while time.perf_counter() < stop_at:
+        response = await client.post("/auth/login", json={
+            "user_email": emails[i % len(emails)],
+            "user_password": PASSWORD
+        })
+        outcome[response.status_code] = outcome.get(response.status_code, 0) + 1
+        i += 1
+
+
+async def run(args):
+
+    _support.create_schema()
+    users = seed_users(args.users)
+    user_ids = [u for u, _ in users]
+    emails = [e for _, e in users]
+
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        # Idle baseline for the unrelated endpoint
+        baseline = []
+        stop_at = time.perf_counter() + args.duration / 2
+        await asyncio.gather(*[
+            probe(client, user_ids, stop_at, baseline)
+            for _ in range(args.probe_concurrency)
+        ])
+
+        # Same probes while a login storm is running
+        under_load = []
+        outcome = {}
+        started = time.perf_counter()
+        stop_at = started + args.duration
+        await asyncio.gather(
+            *[probe(client, user_ids, stop_at, under_load) for _ in range(args.probe_concurrency)],
+            *[login_worker(client, emails, stop_at, outcome) for _ in range(args.login_concurrency)]
+        )
+        elapsed = time.perf_counter() - started
+
+    _support.emit({
+        "benchmark": "login_executor",
+        "duration_seconds": args.duration,
+        "login_concurrency": args.login_concurrency,
+        "logins_ok_per_second": round(outcome.get(200, 0) / elapsed, 2),
+        "login_status_counts": outcome,
+        "probe_idle": _support.latency_summary(baseline),
+        "probe_during_logins": _support.latency_summary(under_load),
+        "password_executor": password_executor.stats(),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--login-concurrency", type=int, default=64)
+    parser.add_argument("--probe-concurrency", type=int, default=4)
+    asyncio.run(run(parser.parse_args()))
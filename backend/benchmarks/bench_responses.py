@@ -0,0 +1,199 @@
+"""
+Response serialization benchmark.
+
+Encodes large listing and dashboard payloads (Decimal/UUID-heavy, built
+as the services build them: ORM rows for listings, dicts for dashboards)
+through each response path and reports wall time per path:
+
+- response_model: validation, then Pydantic straight to JSON bytes (what
+  FastAPI does for a route with a response_model and the default class)
+- json_response: validation, then the stdlib encoder (JSONResponse)
+- orjson_validated: validation, then FastJSONResponse
+- trusted: app.core.responses.trusted_response (no validation, orjson)
+
+Every path's body is checked against the response_model one. The
+*_cached case is the dashboard as the dashboard cache serves it (an
+already validated model), where the response_model path stays ahead.
+
+    python benchmarks/bench_responses.py --rows 5000 --members 2000
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import _support
+
+_support.configure_environment("responses")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.core.responses import FastJSONResponse, trusted_response  # noqa: E402
+from app.models.expense_model import Expense  # noqa: E402
+from app.schemas.approval_schema import PendingApprovalResponse  # noqa: E402
+from app.schemas.dashboard_schema import (  # noqa: E402
+    CoSpaceDashboardResponse,
+    UserDashboardResponse
+)
+from app.schemas.expense_schema import ExpenseHistoryItem  # noqa: E402
+
+
+# ============================================
+# Payloads
+# ============================================
+
+def expense_rows(count: int) -> list:
+
+    started_at = datetime.utcnow() - timedelta(days=30)
+    co_space_id = uuid.uuid4()
+
+    return [
+        Expense(
+            expense_id=uuid.uuid4(),
+            expense_payer_user_id=uuid.uuid4(),
+            co_space_id=co_space_id if i % 2 else None,
+            expense_amount=Decimal(f"{i % 997}.{i % 100:02d}"),
+            expense_message=f"expense {i}" if i % 3 else None,
+            expense_from_fund_type="co_space" if i % 2 else "personal",
+            expense_is_for_type="group" if i % 2 else "self",
+            expense_related_user_id=None,
+            expense_status="approved",
+            expense_created_at=started_at + timedelta(seconds=i)
+        )
+        for i in range(count)
+    ]
+
+
+def co_space_dashboard(members: int) -> dict:
+
+    return {
+        "total_pool_contribution": Decimal("1000000.00"),
+        "total_pool_remaining": Decimal("987654.32"),
+        "total_expense_spent": Decimal("12345.68"),
+        "pending_approvals": 17,
+        "members": [
+            {
+                "user_id": uuid.uuid4(),
+                "total_contributed": Decimal("500.00"),
+                "remaining_amount": Decimal(f"{i % 500}.{i % 100:02d}"),
+                "monthly_expense_total": Decimal("12.34"),
+                "yearly_expense_total": Decimal("123.40"),
+            }
+            for i in range(members)
+        ],
+    }
+
+
+def user_dashboard() -> dict:
+
+    return {
+        "total_fund": Decimal("5000.00"),
+        "remaining_fund": Decimal("4321.09"),
+        "monthly_expense_total": Decimal("210.55"),
+        "yearly_expense_total": Decimal("678.91"),
+        "pending_approvals": 3,
+        "recent_expenses": expense_rows(5),
+    }
+
+
+# ============================================
+# Response Paths
+# ============================================
+
+def response_model_path(adapter, content) -> bytes:
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def json_response_path(adapter, content) -> bytes:
+    validated = adapter.validate_python(content, from_attributes=True)
+    return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+
+def orjson_validated_path(adapter, content) -> bytes:
+    validated = adapter.validate_python(content, from_attributes=True)
+    return FastJSONResponse(adapter.dump_python(validated, mode="json")).body
+
+
+def trusted_path(response_model, content) -> bytes:
+    return trusted_response(response_model, content).body
+
+
+def measure(fn, repeat: int):
+
+    body = fn()
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+
+    return body, _support.latency_summary(timings)
+
+
+def run_case(response_model, content, repeat: int) -> dict:
+
+    adapter = TypeAdapter(response_model)
+    paths = {
+        "response_model": lambda: response_model_path(adapter, content),
+        "json_response": lambda: json_response_path(adapter, content),
+        "orjson_validated": lambda: orjson_validated_path(adapter, content),
+        "trusted": lambda: trusted_path(response_model, content),
+    }
+
+    results = {}
+    expected = None
+
+    for name, fn in paths.items():
+        body, latency = measure(fn, repeat)
+
+        if expected is None:
+            expected = json.loads(body)
+        elif json.loads(body) != expected:
+            raise AssertionError(f"{name} body differs from the response_model body")
+
+        results[name] = {"bytes": len(body), "latency": latency}
+
+    return results
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000, help="rows per listing")
+    parser.add_argument("--members", type=int, default=2000, help="co-space dashboard members")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    rows = expense_rows(args.rows)
+    dashboard = co_space_dashboard(args.members)
+
+    cases = {
+        "expense_history": (list[ExpenseHistoryItem], rows),
+        "pending_approvals": (list[PendingApprovalResponse], rows),
+        "co_space_dashboard": (CoSpaceDashboardResponse, dashboard),
+        "co_space_dashboard_cached": (
+            CoSpaceDashboardResponse,
+            CoSpaceDashboardResponse.model_validate(dashboard)
+        ),
+        "user_dashboard": (UserDashboardResponse, user_dashboard()),
+    }
+
+    _support.emit({
+        "benchmark": "responses",
+        "rows": args.rows,
+        "members": args.members,
+        "repeat": args.repeat,
+        "results": {
+            name: run_case(response_model, content, args.repeat)
+            for name, (response_model, content) in cases.items()
+        },
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,434 @@
+"""
+Service-level microbenchmarks with regression thresholds.
+
+Calls the hot service functions directly against a seeded database, at
+several co-space sizes (--co-space-sizes) and per-user backlog sizes
+(--backlog-sizes), and records the SQL statement count next to wall
+time for each. The run fails (exit status 1) when a case exceeds its
+entry in service_thresholds.json:
+
+- max_statements applies at every size, so an N+1 pattern (statements
+  growing with the co-space or the backlog) fails even on small data;
+- max_p95_ms is a coarse wall-time guard, calibrated on the SQLite
+  stand-in; pass --statements-only on noisy machines.
+
+    python benchmarks/bench_services.py
+    python benchmarks/bench_services.py --co-space-sizes 10 100 1000 --repeat 50
+    python benchmarks/bench_services.py --write-thresholds   # after an intended change
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import _support
+
+_support.configure_environment("services")
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.models.co_space_fund_model import CoSpaceFund  # noqa: E402
+from app.models.co_space_member_model import CoSpaceMember  # noqa: E402
+from app.models.co_space_model import CoSpace  # noqa: E402
+from app.models.expense_approval_model import ExpenseApproval  # noqa: E402
+from app.models.expense_model import Expense  # noqa: E402
+from app.models.user_fund_model import UserFund  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+from app.schemas.expense_schema import ExpenseCreate  # noqa: E402
+from app.services import (  # noqa: E402
+    approval_service,
+    co_space_service,
+    dashboard_service,
+    expense_service,
+)
+from app.services.rollup_service import rebuild_co_space_rollups  # noqa: E402
+from app.services.spending_period_service import rebuild_spending_periods  # noqa: E402
+
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "service_thresholds.json")
+
+FUND_AMOUNT = Decimal("1000000.00")
+
+
+# ============================================
+# Seeding
+# ============================================
+
+def seed_users(db, count: int) -> list:
+
+    user_ids = [uuid.uuid4() for _ in range(count)]
+
+    db.execute(insert(User), [
+        {
+            "user_id": user_id,
+            "user_name": f"user-{i}",
+            "user_email": f"{user_id}@example.com",
+            "user_password": "x",
+            "user_is_active": True,
+        }
+        for i, user_id in enumerate(user_ids)
+    ])
+    db.execute(insert(UserFund), [
+        {
+            "user_id": user_id,
+            "user_fund_total_amount": FUND_AMOUNT,
+            "user_fund_monthly_expense_total": Decimal("0.00"),
+            "user_fund_yearly_expense_total": Decimal("0.00"),
+            "user_fund_remaining_amount": FUND_AMOUNT,
+        }
+        for user_id in user_ids
+    ])
+
+    return user_ids
+
+
+def seed_co_space(db, member_ids: list):
+
+    co_space_id = uuid.uuid4()
+
+    db.execute(insert(CoSpace), [{
+        "co_space_id": co_space_id,
+        "co_space_name": f"bench-{len(member_ids)}",
+        "co_space_created_by_user_id": member_ids[0],
+    }])
+    db.execute(insert(CoSpaceMember), [
+        {
+            "co_space_member_id": uuid.uuid4(),
+            "co_space_id": co_space_id,
+            "user_id": user_id,
+            "co_space_member_status": "accepted",
+        }
+        for user_id in member_ids
+    ])
+    db.execute(insert(CoSpaceFund), [
+        {
+            "co_space_fund_id": uuid.uuid4(),
+            "co_space_id": co_space_id,
+            "user_id": user_id,
+            "co_space_fund_total_amount": FUND_AMOUNT,
+            "co_space_fund_monthly_expense_total": Decimal("0.00"),
+            "co_space_fund_yearly_expense_total": Decimal("0.00"),
+            "co_space_fund_remaining_amount": FUND_AMOUNT,
+        }
+        for user_id in member_ids
+    ])
+
+    return co_space_id
+
+
+def seed_final_approval(db, co_space_id, member_ids: list):
+    """A co-space expense where only the last member's approval is pending."""
+
+    expense_id = uuid.uuid4()
+    approvers = member_ids[1:]
+
+    db.execute(insert(Expense), [{
+        "expense_id": expense_id,
+        "expense_payer_user_id": member_ids[0],
+        "co_space_id": co_space_id,
+        "expense_amount": Decimal("100.00"),
+        "expense_from_fund_type": "co_space",
+        "expense_is_for_type": "group",
+        "expense_status": "pending",
+    }])
+    db.execute(insert(ExpenseApproval), [
+        {
+            "expense_approval_id": uuid.uuid4(),
+            "expense_id": expense_id,
+            "user_id": user_id,
+            "expense_approval_status": "approved" if i < len(approvers) - 1 else "pending",
+        }
+        for i, user_id in enumerate(approvers)
+    ])
+
+    return expense_id, approvers[-1]
+
+
+def seed_backlog(db, size: int):
+    """
+    A user who belongs to `size` co-spaces, has `size` approvals waiting on
+    them and `size` personal expenses of history.
+    """
+
+    user_id, payer = seed_users(db, 2)
+    co_space_ids = [seed_co_space(db, [payer, user_id]) for _ in range(size)]
+    started_at = datetime.utcnow() - timedelta(days=300)
+
+    pending = [
+        {
+            "expense_id": uuid.uuid4(),
+            "expense_payer_user_id": payer,
+            "co_space_id": co_space_ids[i],
+            "expense_amount": Decimal("10.00"),
+            "expense_from_fund_type": "co_space",
+            "expense_is_for_type": "group",
+            "expense_status": "pending",
+            "expense_created_at": started_at + timedelta(hours=i),
+        }
+        for i in range(size)
+    ]
+    history = [
+        {
+            "expense_id": uuid.uuid4(),
+            "expense_payer_user_id": user_id,
+            "expense_amount": Decimal("5.00"),
+            "expense_from_fund_type": "personal",
+            "expense_is_for_type": "self",
+            "expense_status": "approved",
+            "expense_created_at": started_at + timedelta(hours=i),
+        }
+        for i in range(size)
+    ]
+
+    db.execute(insert(Expense), pending + history)
+    db.execute(insert(ExpenseApproval), [
+        {
+            "expense_approval_id": uuid.uuid4(),
+            "expense_id": expense["expense_id"],
+            "user_id": user_id,
+            "expense_approval_status": "pending",
+        }
+        for expense in pending
+    ])
+
+    return user_id
+
+
+# ============================================
+# Cases
+# Each setup seeds what one size needs and returns (call, reset): call
+# runs the service once against a fresh session, reset (or None) puts
+# the data back for the next repetition.
+# ============================================
+
+def approve_expense_case(db, size: int):
+
+    member_ids = seed_users(db, size)
+    co_space_id = seed_co_space(db, member_ids)
+    expense_id, last_approver = seed_final_approval(db, co_space_id, member_ids)
+
+    def call(session):
+        approval_service.approve_expense(session, expense_id, last_approver)
+
+    def reset(session):
+        session.query(ExpenseApproval).filter(
+            ExpenseApproval.expense_id == expense_id,
+            ExpenseApproval.user_id == last_approver
+        ).update({"expense_approval_status": "pending"})
+        session.query(Expense).filter(
+            Expense.expense_id == expense_id
+        ).update({"expense_status": "pending"})
+        session.commit()
+
+    return call, reset
+
+
+def create_expense_case(db, size: int):
+
+    member_ids = seed_users(db, size)
+    co_space_id = seed_co_space(db, member_ids)
+
+    data = ExpenseCreate(
+        co_space_id=co_space_id,
+        expense_amount=Decimal("12.00"),
+        expense_from_fund_type="co_space",
+        expense_is_for_type="group"
+    )
+
+    def call(session):
+        expense_service.create_expense(session, data, member_ids[0])
+
+    return call, None
+
+
+def co_space_dashboard_case(db, size: int):
+
+    co_space_id = seed_co_space(db, seed_users(db, size))
+
+    def call(session):
+        dashboard_service.get_co_space_dashboard(session, co_space_id)
+
+    return call, None
+
+
+def pending_approvals_case(db, size: int):
+
+    user_id = seed_backlog(db, size)
+
+    def call(session):
+        approval_service.get_pending_approvals(session, user_id)
+
+    return call, None
+
+
+def user_dashboard_case(db, size: int):
+
+    user_id = seed_backlog(db, size)
+
+    def call(session):
+        dashboard_service.get_user_dashboard(session, user_id)
+
+    return call, None
+
+
+def user_co_spaces_case(db, size: int):
+
+    user_id = seed_backlog(db, size)
+
+    def call(session):
+        co_space_service.get_user_co_spaces(session, user_id)
+
+    return call, None
+
+
+# name -> (setup, which size list it is measured over)
+CASES = {
+    "approval_service.approve_expense": (approve_expense_case, "co_space"),
+    "expense_service.create_expense": (create_expense_case, "co_space"),
+    "dashboard_service.get_co_space_dashboard": (co_space_dashboard_case, "co_space"),
+    "approval_service.get_pending_approvals": (pending_approvals_case, "backlog"),
+    "dashboard_service.get_user_dashboard": (user_dashboard_case, "backlog"),
+    "co_space_service.get_user_co_spaces": (user_co_spaces_case, "backlog"),
+}
+
+
+# ============================================
+# Measurement + Thresholds
+# ============================================
+
+def measure(call, reset, repeat: int) -> dict:
+
+    timings = []
+    statements = []
+
+    for _ in range(repeat):
+        db = SessionLocal()
+
+        try:
+            with _support.count_statements(engine) as counter:
+                started = time.perf_counter()
+                call(db)
+                timings.append(time.perf_counter() - started)
+
+            statements.append(counter["statements"])
+
+            if reset:
+                reset(db)
+        finally:
+            db.close()
+
+    return {
+        "statements": max(statements),
+        "latency": _support.latency_summary(timings),
+    }
+
+
+def check(results: dict, thresholds: dict, statements_only: bool) -> list:
+
+    failures = []
+
+    for name, sizes in results.items():
+
+        limits = thresholds.get(name)
+
+        if limits is None:
+            failures.append(f"{name}: no threshold configured")
+            continue
+
+        for size, result in sizes.items():
+
+            if result["statements"] > limits["max_statements"]:
+                failures.append(
+                    f"{name}[{size}]: {result['statements']} statements "
+                    f"> {limits['max_statements']}"
+                )
+
+            if not statements_only and result["latency"]["p95_ms"] > limits["max_p95_ms"]:
+                failures.append(
+                    f"{name}[{size}]: p95 {result['latency']['p95_ms']}ms "
+                    f"> {limits['max_p95_ms']}ms"
+                )
+
+    return failures
+
+
+TIME_HEADROOM = 5
+MIN_P95_BUDGET_MS = 50.0
+
+
+def observed_thresholds(results: dict) -> dict:
+    """Current statement counts exactly, wall time with generous headroom."""
+
+    return {
+        name: {
+            "max_statements": max(result["statements"] for result in sizes.values()),
+            "max_p95_ms": max(
+                MIN_P95_BUDGET_MS,
+                round(max(result["latency"]["p95_ms"] for result in sizes.values()) * TIME_HEADROOM, 1)
+            ),
+        }
+        for name, sizes in results.items()
+    }
+
+
+def run(args) -> int:
+
+    _support.create_schema()
+
+    sizes = {"co_space": args.co_space_sizes, "backlog": args.backlog_sizes}
+    prepared = {}
+
+    db = SessionLocal()
+
+    try:
+        for name, (setup, size_kind) in CASES.items():
+            for size in sizes[size_kind]:
+                prepared[(name, size)] = setup(db, size)
+
+        db.commit()
+
+        # Derived tables the services read (rollups, spending buckets)
+        rebuild_co_space_rollups(db)
+        rebuild_spending_periods(db)
+    finally:
+        db.close()
+
+    results = {}
+
+    for (name, size), (call, reset) in prepared.items():
+        results.setdefault(name, {})[size] = measure(call, reset, args.repeat)
+
+    if args.write_thresholds:
+        with open(THRESHOLDS_PATH, "w") as handle:
+            json.dump(observed_thresholds(results), handle, indent=2)
+            handle.write("\n")
+
+    with open(THRESHOLDS_PATH) as handle:
+        thresholds = json.load(handle)
+
+    failures = check(results, thresholds, args.statements_only)
+
+    _support.emit({
+        "benchmark": "services",
+        "database": engine.url.get_backend_name(),
+        "repeat": args.repeat,
+        "results": results,
+        "failures": failures,
+    })
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--co-space-sizes", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--backlog-sizes", type=int, nargs="+", default=[10, 500])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--statements-only", action="store_true", help="ignore the wall-time thresholds")
+    parser.add_argument("--write-thresholds", action="store_true", help="record the current results as the thresholds")
+    sys.exit(run(parser.parse_args()))
@@ -0,0 +1,147 @@
+"""
+Concurrent writers against one personal fund.
+
+--writers clients each send --ops POST /expenses (personal, 1.00) for the
+same user at once, then the fund is checked: every expense that
+succeeded must be deducted exactly once (no lost updates), and the fund
+ledger must reconcile. Reports throughput, status counts and how many
+version conflicts were retried.
+
+    python benchmarks/stress_fund_concurrency.py --writers 32 --ops 50
+
+Exits with status 1 if an update was lost. Use Postgres (DATABASE_URL)
+for meaningful throughput; SQLite serializes writers.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from collections import Counter
+from decimal import Decimal
+
+import _support
+
+_support.configure_environment("fund-concurrency")
+
+import httpx  # noqa: E402
+
+from app.core.concurrency import retry_stats  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.expense_model import Expense  # noqa: E402
+from app.models.user_fund_model import UserFund  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+from app.services.fund_ledger_service import reconcile_fund_balances  # noqa: E402
+
+AMOUNT = Decimal("1.00")
+
+
+def seed_user(initial: Decimal):
+
+    user_id = uuid.uuid4()
+    db = SessionLocal()
+
+    try:
+        db.add(User(
+            user_id=user_id,
+            user_name="writer",
+            user_email="writer@example.com",
+            user_password="x",
+            user_is_active=True
+        ))
+        db.flush()
+        db.add(UserFund(
+            user_id=user_id,
+            user_fund_total_amount=Decimal("0.00"),
+            user_fund_monthly_expense_total=Decimal("0.00"),
+            user_fund_yearly_expense_total=Decimal("0.00"),
+            user_fund_remaining_amount=Decimal("0.00")
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+    return user_id
+
+
+def check(user_id, initial: Decimal) -> dict:
+
+    db = SessionLocal()
+
+    try:
+        fund = db.get(UserFund, user_id)
+        remaining, version = fund.user_fund_remaining_amount, fund.user_fund_version
+        recorded = db.query(Expense).filter(Expense.expense_payer_user_id == user_id).count()
+        drift = reconcile_fund_balances(db)
+    finally:
+        db.close()
+
+    expected_remaining = initial - AMOUNT * recorded
+
+    return {
+        "expenses_recorded": recorded,
+        "remaining": remaining,
+        "expected_remaining": expected_remaining,
+        "lost_updates": int((remaining - expected_remaining) / AMOUNT),
+        "fund_version": version,
+        "ledger_mismatches": len(drift),
+    }
+
+
+async def run(args):
+
+    _support.create_schema()
+
+    initial = AMOUNT * args.writers * args.ops
+    user_id = seed_user(initial)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+    transport = httpx.ASGITransport(app=app)
+    statuses = Counter()
+    latencies = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://stress", timeout=None) as client:
+
+        response = await client.post("/users/me/fund", json={"user_fund_total_amount": str(initial)}, headers=headers)
+        response.raise_for_status()
+
+        async def writer():
+            for _ in range(args.ops):
+                started = time.perf_counter()
+                response = await client.post("/expenses", json={
+                    "expense_amount": str(AMOUNT),
+                    "expense_from_fund_type": "personal",
+                    "expense_is_for_type": "self",
+                }, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(writer() for _ in range(args.writers)))
+        elapsed = time.perf_counter() - started
+
+    outcome = check(user_id, initial)
+
+    _support.emit({
+        "benchmark": "fund_concurrency",
+        "writers": args.writers,
+        "ops_per_writer": args.ops,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(sum(statuses.values()) / elapsed, 1),
+        "statuses": dict(statuses),
+        "latency": _support.latency_summary(latencies),
+        "retry": retry_stats(),
+        **outcome,
+    })
+
+    return 1 if outcome["lost_updates"] or outcome["ledger_mismatches"] else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=25)
+    sys.exit(asyncio.run(run(parser.parse_args())))
@@ -0,0 +1,115 @@
+"""
+Compare two load-test reports route by route.
+
+    python -m loadtest.compare baseline.json candidate.json
+    python -m loadtest.compare baseline.json candidate.json --max-p95-regression 20
+
+Prints, for every scenario/route present in both reports, throughput,
+p50/p95/p99 latency and error rate side by side with the relative change
+(JSON). With --max-p95-regression PCT, exits with status 1 if any route's
+p95 grew by more than PCT percent or its error rate went up.
+"""
+
+import argparse
+import json
+import sys
+
+METRICS = {
+    "requests_per_second": lambda route: route["requests_per_second"],
+    "p50_ms": lambda route: route["latency"]["p50_ms"],
+    "p95_ms": lambda route: route["latency"]["p95_ms"],
+    "p99_ms": lambda route: route["latency"]["p99_ms"],
+    "error_rate": lambda route: route["error_rate"],
+}
+
+
+def _change_pct(base, candidate):
+
+    if not base:
+        return None
+
+    return round((candidate - base) / base * 100, 1)
+
+
+def compare(baseline: dict, candidate: dict) -> dict:
+
+    result = {}
+
+    for scenario, base_report in baseline["scenarios"].items():
+
+        candidate_report = candidate["scenarios"].get(scenario)
+
+        if candidate_report is None:
+            continue
+
+        for route, base_route in base_report["routes"].items():
+
+            candidate_route = candidate_report["routes"].get(route)
+
+            if candidate_route is None:
+                continue
+
+            result.setdefault(scenario, {})[route] = {
+                name: {
+                    "baseline": metric(base_route),
+                    "candidate": metric(candidate_route),
+                    "change_pct": _change_pct(metric(base_route), metric(candidate_route)),
+                }
+                for name, metric in METRICS.items()
+            }
+
+    return result
+
+
+def regressions(comparison: dict, max_p95_regression: float) -> list:
+
+    found = []
+
+    for scenario, routes in comparison.items():
+        for route, metrics in routes.items():
+
+            p95 = metrics["p95_ms"]["change_pct"]
+            errors = metrics["error_rate"]
+
+            if p95 is not None and p95 > max_p95_regression:
+                found.append(f"{scenario} {route}: p95 +{p95}%")
+
+            if errors["candidate"] > errors["baseline"]:
+                found.append(
+                    f"{scenario} {route}: error rate "
+                    f"{errors['baseline']} -> {errors['candidate']}"
+                )
+
+    return found
+
+
+def main(argv=None) -> int:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--max-p95-regression", type=float, help="percent; exit 1 when exceeded")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+
+    with open(args.candidate) as handle:
+        candidate = json.load(handle)
+
+    comparison = compare(baseline, candidate)
+    print(json.dumps(comparison, indent=2))
+
+    if args.max_p95_regression is None:
+        return 0
+
+    found = regressions(comparison, args.max_p95_regression)
+
+    for line in found:
+        print(line, file=sys.stderr)
+
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
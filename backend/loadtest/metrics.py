@@ -0,0 +1,79 @@
+"""
+Per-route request metrics for the load tests.
+
+Requests are recorded under a route label ("POST /expenses/{id}/approve"),
+not the concrete URL, so runs with different data aggregate the same way.
+A request counts as an error when it raised (timeout, connection reset)
+or returned a status the scenario did not expect.
+"""
+
+import time
+from collections import Counter, defaultdict
+
+from benchmarks._support import latency_summary
+
+
+class RouteStats:
+
+    def __init__(self):
+        self.latencies = []
+        self.statuses = Counter()
+        self.errors = 0
+
+    def report(self, seconds: float) -> dict:
+
+        count = len(self.latencies)
+
+        return {
+            "requests": count,
+            "requests_per_second": round(count / seconds, 2) if seconds else 0.0,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "latency": latency_summary(self.latencies),
+        }
+
+
+class Recorder:
+
+    def __init__(self):
+        self.routes = defaultdict(RouteStats)
+
+    async def request(self, client, route: str, method: str, url: str, expect=(200,), **kwargs):
+        """Sends one request and records it under `route`; returns the response or None."""
+
+        stats = self.routes[route]
+        started = time.perf_counter()
+
+        try:
+            response = await client.request(method, url, **kwargs)
+        except Exception as exc:
+            stats.latencies.append(time.perf_counter() - started)
+            stats.statuses[type(exc).__name__] += 1
+            stats.errors += 1
+            return None
+
+        stats.latencies.append(time.perf_counter() - started)
+        stats.statuses[response.status_code] += 1
+
+        if response.status_code not in expect:
+            stats.errors += 1
+
+        return response
+
+    def report(self, seconds: float) -> dict:
+
+        requests = sum(len(stats.latencies) for stats in self.routes.values())
+        errors = sum(stats.errors for stats in self.routes.values())
+
+        return {
+            "seconds": round(seconds, 3),
+            "requests": requests,
+            "requests_per_second": round(requests / seconds, 2) if seconds else 0.0,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "routes": {
+                route: stats.report(seconds)
+                for route, stats in sorted(self.routes.items())
+            },
+        }
@@ -0,0 +1,180 @@
+"""
+Load-test scenarios.
+
+Each scenario is one virtual user's iteration: an async function taking a
+Context and issuing one or more requests through ctx.recorder. The runner
+runs --concurrency of them in a loop for the scenario's duration.
+Scenarios may also define a verify(dataset) hook that checks the database
+once the load has stopped.
+"""
+
+import asyncio
+import itertools
+import random
+from decimal import Decimal
+
+from sqlalchemy import and_, exists, func, select
+
+from app.core.database import SessionLocal
+from app.models.expense_approval_model import ExpenseApproval
+from app.models.expense_model import Expense
+from loadtest.seed import SEED_PASSWORD
+
+
+class Context:
+
+    def __init__(self, client, dataset, recorder, random_seed: int, sequence=None):
+        self.client = client
+        self.dataset = dataset
+        self.recorder = recorder
+        self.rng = random.Random(random_seed)
+        # Shared between the virtual users of a run (unique signup emails)
+        self._sequence = sequence if sequence is not None else itertools.count()
+
+    def next_id(self) -> int:
+        return next(self._sequence)
+
+    def request(self, route: str, method: str, url: str, **kwargs):
+        return self.recorder.request(self.client, route, method, url, **kwargs)
+
+
+def _amount(rng) -> str:
+    return str(Decimal(rng.randint(100, 5000)) / 100)
+
+
+# ============================================
+# Signup / Login Storm
+# New accounts signing up and logging in, plus existing users logging
+# in; dominated by bcrypt on the password executor
+# ============================================
+
+async def auth_storm(ctx: Context):
+
+    email = f"storm-{ctx.dataset.run_tag}-{ctx.next_id()}@example.com"
+
+    await ctx.request("POST /auth/signup", "POST", "/auth/signup", json={
+        "user_name": "storm",
+        "user_email": email,
+        "user_password": SEED_PASSWORD,
+    })
+    await ctx.request("POST /auth/login", "POST", "/auth/login", json={
+        "user_email": email,
+        "user_password": SEED_PASSWORD,
+    })
+
+    seeded = ctx.rng.randrange(len(ctx.dataset.user_ids))
+
+    await ctx.request("POST /auth/login", "POST", "/auth/login", json={
+        "user_email": f"load-{ctx.dataset.run_tag}-{seeded}@example.com",
+        "user_password": SEED_PASSWORD,
+    })
+
+
+# ============================================
+# Co-Space Expense Creation
+# Members of the regular co-spaces logging shared expenses (each one
+# fans out an approval row to every other member)
+# ============================================
+
+async def co_space_expenses(ctx: Context):
+
+    co_space_id, member_ids = ctx.rng.choice(ctx.dataset.co_spaces)
+    payer = ctx.rng.choice(member_ids)
+
+    await ctx.request("POST /expenses", "POST", "/expenses", json={
+        "co_space_id": str(co_space_id),
+        "expense_amount": _amount(ctx.rng),
+        "expense_message": "load",
+        "expense_from_fund_type": "co_space",
+        "expense_is_for_type": "group",
+    }, headers=ctx.dataset.headers(payer))
+
+
+# ============================================
+# Approval Fan-In
+# One expense in the large co-space, then every other member approves it
+# at once; the last approval finalizes it against all member funds
+# ============================================
+
+async def approval_fan_in(ctx: Context):
+
+    co_space_id, member_ids = ctx.dataset.fan_in
+
+    response = await ctx.request("POST /expenses (fan-in)", "POST", "/expenses", json={
+        "co_space_id": str(co_space_id),
+        "expense_amount": _amount(ctx.rng),
+        "expense_message": "fan-in",
+        "expense_from_fund_type": "co_space",
+        "expense_is_for_type": "group",
+    }, headers=ctx.dataset.headers(member_ids[0]))
+
+    if response is None or response.status_code != 200:
+        return
+
+    expense_id = response.json()["expense_id"]
+
+    await asyncio.gather(*(
+        ctx.request(
+            "POST /expenses/{id}/approve",
+            "POST",
+            f"/expenses/{expense_id}/approve",
+            headers=ctx.dataset.headers(user_id)
+        )
+        for user_id in member_ids[1:]
+    ))
+
+
+def verify_approval_fan_in(dataset) -> dict:
+    """Fan-in expenses left pending although nobody's approval is pending."""
+
+    co_space_id, _ = dataset.fan_in
+    db = SessionLocal()
+
+    try:
+        stuck = db.execute(
+            select(func.count()).select_from(Expense).where(
+                Expense.co_space_id == co_space_id,
+                Expense.expense_status == "pending",
+                ~exists().where(and_(
+                    ExpenseApproval.expense_id == Expense.expense_id,
+                    ExpenseApproval.expense_approval_status == "pending"
+                ))
+            )
+        ).scalar()
+    finally:
+        db.close()
+
+    return {"stuck_pending_expenses": stuck}
+
+
+# ============================================
+# Dashboard Polling
+# Users refreshing their own dashboard and one of their co-spaces'
+# ============================================
+
+async def dashboard_polling(ctx: Context):
+
+    user_id = ctx.rng.choice(ctx.dataset.user_ids)
+    headers = ctx.dataset.headers(user_id)
+
+    await ctx.request("GET /users/me/dashboard", "GET", "/users/me/dashboard", headers=headers)
+
+    co_space_ids = ctx.dataset.memberships.get(user_id)
+
+    if co_space_ids:
+        co_space_id = ctx.rng.choice(co_space_ids)
+
+        await ctx.request(
+            "GET /co-spaces/{id}/dashboard",
+            "GET",
+            f"/co-spaces/{co_space_id}/dashboard",
+            headers=headers
+        )
+
+
+SCENARIOS = {
+    "auth_storm": (auth_storm, None),
+    "co_space_expenses": (co_space_expenses, None),
+    "approval_fan_in": (approval_fan_in, verify_approval_fan_in),
+    "dashboard_polling": (dashboard_polling, None),
+}
@@ -0,0 +1,213 @@
+"""
+Synthetic data for the load tests.
+
+Users (each with a personal fund and a year of approved personal
+expenses), co-spaces of --co-space-size accepted members with funded
+member pools, and one large co-space for approval fan-in. Base tables are
+written through SQLAlchemy Core in chunks; the derived tables (co-space
+rollups, monthly spending buckets) are then rebuilt with the same
+functions the maintenance scripts use, so the data looks like something
+the app produced itself.
+
+Seeded users share one password (SEED_PASSWORD, hashed once); emails
+carry a per-run tag so repeated runs against the same database do not
+collide.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import insert
+
+from app.core.database import SessionLocal
+from app.core.security import create_access_token, hash_password
+from app.models.co_space_fund_model import CoSpaceFund
+from app.models.co_space_member_model import CoSpaceMember
+from app.models.co_space_model import CoSpace
+from app.models.expense_model import Expense
+from app.models.user_fund_model import UserFund
+from app.models.user_model import User
+from app.services.rollup_service import rebuild_co_space_rollups
+from app.services.spending_period_service import rebuild_spending_periods
+
+SEED_PASSWORD = "loadtest-password"
+CHUNK = 5000
+
+USER_FUND_AMOUNT = Decimal("100000.00")
+MEMBER_FUND_AMOUNT = Decimal("1000000.00")
+
+
+@dataclass
+class Dataset:
+    run_tag: str
+    user_ids: list
+    # [(co_space_id, [member user ids])], the first member is the admin
+    co_spaces: list
+    fan_in: tuple
+    memberships: dict = field(default_factory=dict)
+    _headers: dict = field(default_factory=dict)
+
+    def headers(self, user_id) -> dict:
+
+        if user_id not in self._headers:
+            token = create_access_token({"sub": str(user_id)})
+            self._headers[user_id] = {"Authorization": f"Bearer {token}"}
+
+        return self._headers[user_id]
+
+
+def _chunked_insert(db, model, rows: list):
+
+    for offset in range(0, len(rows), CHUNK):
+        db.execute(insert(model), rows[offset:offset + CHUNK])
+
+
+def _member_rows(co_space_id, member_ids):
+
+    members = [
+        {
+            "co_space_member_id": uuid.uuid4(),
+            "co_space_id": co_space_id,
+            "user_id": user_id,
+            "co_space_member_status": "accepted",
+        }
+        for user_id in member_ids
+    ]
+    funds = [
+        {
+            "co_space_fund_id": uuid.uuid4(),
+            "co_space_id": co_space_id,
+            "user_id": user_id,
+            "co_space_fund_total_amount": MEMBER_FUND_AMOUNT,
+            "co_space_fund_monthly_expense_total": Decimal("0.00"),
+            "co_space_fund_yearly_expense_total": Decimal("0.00"),
+            "co_space_fund_remaining_amount": MEMBER_FUND_AMOUNT,
+        }
+        for user_id in member_ids
+    ]
+
+    return members, funds
+
+
+def seed(
+    users: int,
+    co_spaces: int,
+    co_space_size: int,
+    fan_in_members: int,
+    history: int,
+    random_seed: int = 0
+) -> Dataset:
+
+    if users < max(co_space_size, fan_in_members):
+        raise ValueError("--users must be at least --co-space-size and --fan-in-members")
+
+    rng = random.Random(random_seed)
+    run_tag = uuid.uuid4().hex[:8]
+    now = datetime.utcnow()
+    password = hash_password(SEED_PASSWORD)
+
+    user_ids = [uuid.uuid4() for _ in range(users)]
+
+    user_rows = [
+        {
+            "user_id": user_id,
+            "user_name": f"load-{i}",
+            "user_email": f"load-{run_tag}-{i}@example.com",
+            "user_password": password,
+            "user_is_active": True,
+        }
+        for i, user_id in enumerate(user_ids)
+    ]
+
+    expense_rows = []
+    fund_rows = []
+
+    for user_id in user_ids:
+
+        spent = monthly = yearly = Decimal("0.00")
+
+        for _ in range(history):
+            amount = Decimal(rng.randint(100, 20000)) / 100
+            created_at = now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+
+            expense_rows.append({
+                "expense_id": uuid.uuid4(),
+                "expense_payer_user_id": user_id,
+                "expense_amount": amount,
+                "expense_message": "seeded",
+                "expense_from_fund_type": "personal",
+                "expense_is_for_type": "self",
+                "expense_status": "approved",
+                "expense_created_at": created_at,
+            })
+
+            spent += amount
+
+            if created_at.year == now.year:
+                yearly += amount
+
+                if created_at.month == now.month:
+                    monthly += amount
+
+        fund_rows.append({
+            "user_id": user_id,
+            "user_fund_total_amount": USER_FUND_AMOUNT,
+            "user_fund_monthly_expense_total": monthly,
+            "user_fund_yearly_expense_total": yearly,
+            "user_fund_remaining_amount": USER_FUND_AMOUNT - spent,
+        })
+
+    space_rows = []
+    member_rows = []
+    member_fund_rows = []
+    spaces = []
+    memberships = {}
+
+    groups = [rng.sample(user_ids, co_space_size) for _ in range(co_spaces)]
+    groups.append(user_ids[:fan_in_members])
+
+    for index, member_ids in enumerate(groups):
+
+        co_space_id = uuid.uuid4()
+
+        space_rows.append({
+            "co_space_id": co_space_id,
+            "co_space_name": f"load-{run_tag}-{index}",
+            "co_space_created_by_user_id": member_ids[0],
+        })
+
+        members, funds = _member_rows(co_space_id, member_ids)
+        member_rows += members
+        member_fund_rows += funds
+
+        spaces.append((co_space_id, member_ids))
+
+        for user_id in member_ids:
+            memberships.setdefault(user_id, []).append(co_space_id)
+
+    db = SessionLocal()
+
+    try:
+        _chunked_insert(db, User, user_rows)
+        _chunked_insert(db, UserFund, fund_rows)
+        _chunked_insert(db, Expense, expense_rows)
+        _chunked_insert(db, CoSpace, space_rows)
+        _chunked_insert(db, CoSpaceMember, member_rows)
+        _chunked_insert(db, CoSpaceFund, member_fund_rows)
+        db.commit()
+
+        rebuild_co_space_rollups(db)
+        rebuild_spending_periods(db)
+    finally:
+        db.close()
+
+    return Dataset(
+        run_tag=run_tag,
+        user_ids=user_ids,
+        co_spaces=spaces[:-1],
+        fan_in=spaces[-1],
+        memberships=memberships
+    )
@@ -0,0 +1,88 @@
+"""
+Index and constraint helpers for migrations that touch large tables.
+
+On Postgres indexes are built with CREATE INDEX CONCURRENTLY (outside the
+migration transaction), so writes keep flowing while they build; unique
+constraints are attached to such an index afterwards. Other dialects
+(SQLite in development) use the plain operations.
+
+A CONCURRENTLY build that fails leaves an INVALID index behind; drop it
+before re-running the migration.
+"""
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def create_index(name: str, table: str, columns: list, where: str = None, include: list = None):
+
+    options = {}
+
+    if where is not None:
+        options["postgresql_where"] = sa.text(where)
+        options["sqlite_where"] = sa.text(where)
+
+    if include:
+        options["postgresql_include"] = include
+
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, postgresql_concurrently=True, **options)
+    else:
+        op.create_index(name, table, columns, **options)
+
+
+def drop_index(name: str, table: str):
+
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    else:
+        op.drop_index(name, table_name=table)
+
+
+def check_no_duplicates(name: str, table: str, columns: list):
+    """
+    Fails with the offending keys rather than a bare constraint error.
+    Call for every constraint before the first DDL statement: concurrent
+    builds are not rolled back when a later step fails.
+    """
+
+    if context.is_offline_mode():
+        return
+
+    key = ", ".join(columns)
+    duplicates = op.get_bind().execute(sa.text(
+        f"SELECT {key}, COUNT(*) FROM {table} GROUP BY {key} HAVING COUNT(*) > 1 LIMIT 5"
+    )).all()
+
+    if duplicates:
+        raise RuntimeError(
+            f"Cannot add {name}: {table} has duplicate ({key}) rows, "
+            f"e.g. {[tuple(row) for row in duplicates]}. Merge them and re-run."
+        )
+
+
+def create_unique_constraint(name: str, table: str, columns: list):
+
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, unique=True, postgresql_concurrently=True)
+
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {name}")
+    else:
+        with op.batch_alter_table(table) as batch:
+            batch.create_unique_constraint(name, columns)
+
+
+def drop_unique_constraint(name: str, table: str):
+
+    if _is_postgres():
+        op.drop_constraint(name, table, type_="unique")
+    else:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_constraint(name, type_="unique")
@@ -0,0 +1,170 @@
+"""Baseline: the schema as it existed before migrations
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18
+
+Databases created before migrations were introduced already have these
+tables; mark them with `alembic stamp 0001_baseline` instead of running
+this revision.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.create_table(
+        "users",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_name", sa.String(), nullable=False),
+        sa.Column("user_email", sa.String(), nullable=False, unique=True),
+        sa.Column("user_gender", sa.String()),
+        sa.Column("user_age", sa.Integer()),
+        sa.Column("user_is_active", sa.Boolean()),
+        sa.Column("user_created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+        sa.Column("user_updated_at", sa.TIMESTAMP()),
+        sa.Column("user_password", sa.String(), nullable=False),
+    )
+    op.create_index("ix_users_user_id", "users", ["user_id"])
+
+    op.create_table(
+        "user_funds",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        sa.Column("user_fund_total_amount", sa.DECIMAL(15, 2)),
+        sa.Column("user_fund_monthly_expense_total", sa.DECIMAL(15, 2)),
+        sa.Column("user_fund_yearly_expense_total", sa.DECIMAL(15, 2)),
+        sa.Column("user_fund_remaining_amount", sa.DECIMAL(15, 2)),
+        sa.Column("user_fund_updated_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        "co_spaces",
+        sa.Column("co_space_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("co_space_name", sa.String(), nullable=False),
+        sa.Column(
+            "co_space_created_by_user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column("co_space_created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+        sa.Column("co_space_updated_at", sa.TIMESTAMP()),
+    )
+    op.create_index("ix_co_spaces_co_space_id", "co_spaces", ["co_space_id"])
+
+    op.create_table(
+        "co_space_members",
+        sa.Column("co_space_member_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "co_space_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("co_spaces.co_space_id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column("co_space_member_status", sa.String(), nullable=False),
+        sa.Column("co_space_member_joined_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+        sa.Column("co_space_member_updated_at", sa.TIMESTAMP()),
+    )
+
+    op.create_table(
+        "co_space_funds",
+        sa.Column("co_space_fund_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "co_space_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("co_spaces.co_space_id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column("co_space_fund_total_amount", sa.DECIMAL(15, 2)),
+        sa.Column("co_space_fund_monthly_expense_total", sa.DECIMAL(15, 2)),
+        sa.Column("co_space_fund_yearly_expense_total", sa.DECIMAL(15, 2)),
+        sa.Column("co_space_fund_remaining_amount", sa.DECIMAL(15, 2)),
+        sa.Column("co_space_fund_updated_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        "expenses",
+        sa.Column("expense_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "expense_payer_user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column(
+            "co_space_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("co_spaces.co_space_id", ondelete="CASCADE"),
+            nullable=True
+        ),
+        sa.Column("expense_amount", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("expense_message", sa.TEXT()),
+        sa.Column("expense_from_fund_type", sa.VARCHAR(), nullable=False),
+        sa.Column("expense_is_for_type", sa.VARCHAR(), nullable=False),
+        sa.Column(
+            "expense_related_user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="SET NULL"),
+            nullable=True
+        ),
+        sa.Column("expense_status", sa.VARCHAR(), nullable=False),
+        sa.Column("expense_created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+        sa.Column("expense_updated_at", sa.TIMESTAMP()),
+    )
+
+    op.create_table(
+        "expense_approvals",
+        sa.Column("expense_approval_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "expense_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("expenses.expense_id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column("expense_approval_status", sa.VARCHAR(), nullable=False),
+        sa.Column("expense_approval_responded_at", sa.TIMESTAMP(), nullable=True),
+    )
+
+
+def downgrade():
+
+    op.drop_table("expense_approvals")
+    op.drop_table("expenses")
+    op.drop_table("co_space_funds")
+    op.drop_table("co_space_members")
+    op.drop_index("ix_co_spaces_co_space_id", table_name="co_spaces")
+    op.drop_table("co_spaces")
+    op.drop_table("user_funds")
+    op.drop_index("ix_users_user_id", table_name="users")
+    op.drop_table("users")
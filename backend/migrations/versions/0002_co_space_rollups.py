@@ -0,0 +1,41 @@
+"""co_space_rollups: per-co-space dashboard totals
+
+Revision ID: 0002_co_space_rollups
+Revises: 0001_baseline
+Create Date: 2026-10-18
+
+The table starts empty and the dashboard falls back to the base tables
+until a row exists; backfill with `python -m app.scripts.rebuild_co_space_rollups`.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0002_co_space_rollups"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.create_table(
+        "co_space_rollups",
+        sa.Column(
+            "co_space_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("co_spaces.co_space_id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        sa.Column("co_space_rollup_total_contribution", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("co_space_rollup_total_remaining", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("co_space_rollup_total_spent", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("co_space_rollup_pending_count", sa.Integer(), nullable=False),
+        sa.Column("co_space_rollup_member_count", sa.Integer(), nullable=False),
+        sa.Column("co_space_rollup_updated_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+
+def downgrade():
+    op.drop_table("co_space_rollups")
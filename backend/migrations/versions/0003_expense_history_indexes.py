@@ -0,0 +1,48 @@
+"""Expense history indexes (payer / co-space, newest first)
+
+Revision ID: 0003_expense_history_indexes
+Revises: 0002_co_space_rollups
+Create Date: 2026-10-18
+
+Leading scope column, then (expense_created_at, expense_id) for keyset
+pagination, with the history filter columns INCLUDEd so a filtered page
+is found with an index-only scan.
+"""
+from migrations import online_ddl
+
+
+revision = "0003_expense_history_indexes"
+down_revision = "0002_co_space_rollups"
+branch_labels = None
+depends_on = None
+
+
+HISTORY_FILTER_COLUMNS = [
+    "expense_status",
+    "expense_from_fund_type",
+    "expense_is_for_type",
+    "expense_related_user_id",
+    "expense_amount",
+]
+
+
+def upgrade():
+
+    online_ddl.create_index(
+        "ix_expenses_payer_created",
+        "expenses",
+        ["expense_payer_user_id", "expense_created_at", "expense_id"],
+        include=HISTORY_FILTER_COLUMNS
+    )
+    online_ddl.create_index(
+        "ix_expenses_co_space_created",
+        "expenses",
+        ["co_space_id", "expense_created_at", "expense_id"],
+        include=HISTORY_FILTER_COLUMNS
+    )
+
+
+def downgrade():
+
+    online_ddl.drop_index("ix_expenses_co_space_created", "expenses")
+    online_ddl.drop_index("ix_expenses_payer_created", "expenses")
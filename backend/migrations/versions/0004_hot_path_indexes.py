@@ -0,0 +1,84 @@
+"""Hot-path indexes and uniqueness for approvals, members and funds
+
+Revision ID: 0004_hot_path_indexes
+Revises: 0003_expense_history_indexes
+Create Date: 2026-10-18
+
+Partial indexes cover the "status = 'pending'" filters (the pending rows
+are a small, hot fraction of each table). Unique constraints make one
+member row / fund row per (co_space_id, user_id) and one approval per
+(expense_id, user_id) a database guarantee; they double as the lookup
+indexes for those pairs. The migration stops if duplicates already exist.
+
+Expense(expense_payer_user_id, expense_created_at) is served by
+ix_expenses_payer_created from 0003.
+"""
+from migrations import online_ddl
+
+
+revision = "0004_hot_path_indexes"
+down_revision = "0003_expense_history_indexes"
+branch_labels = None
+depends_on = None
+
+
+UNIQUE_CONSTRAINTS = [
+    ("uq_expense_approvals_expense_user", "expense_approvals", ["expense_id", "user_id"]),
+    ("uq_co_space_members_co_space_user", "co_space_members", ["co_space_id", "user_id"]),
+    ("uq_co_space_funds_co_space_user", "co_space_funds", ["co_space_id", "user_id"]),
+]
+
+
+def upgrade():
+
+    for name, table, columns in UNIQUE_CONSTRAINTS:
+        online_ddl.check_no_duplicates(name, table, columns)
+
+    for name, table, columns in UNIQUE_CONSTRAINTS:
+        online_ddl.create_unique_constraint(name, table, columns)
+
+    # expense_approvals
+    online_ddl.create_index(
+        "ix_expense_approvals_user_pending",
+        "expense_approvals",
+        ["user_id", "expense_id"],
+        where="expense_approval_status = 'pending'"
+    )
+    online_ddl.create_index(
+        "ix_expense_approvals_expense_pending",
+        "expense_approvals",
+        ["expense_id"],
+        where="expense_approval_status = 'pending'"
+    )
+
+    # co_space_members
+    online_ddl.create_index(
+        "ix_co_space_members_co_space_status",
+        "co_space_members",
+        ["co_space_id", "co_space_member_status", "user_id"]
+    )
+    online_ddl.create_index(
+        "ix_co_space_members_user_status",
+        "co_space_members",
+        ["user_id", "co_space_member_status"]
+    )
+
+    # expenses
+    online_ddl.create_index(
+        "ix_expenses_co_space_pending",
+        "expenses",
+        ["co_space_id"],
+        where="expense_status = 'pending'"
+    )
+
+
+def downgrade():
+
+    online_ddl.drop_index("ix_expenses_co_space_pending", "expenses")
+    online_ddl.drop_index("ix_co_space_members_user_status", "co_space_members")
+    online_ddl.drop_index("ix_co_space_members_co_space_status", "co_space_members")
+    online_ddl.drop_index("ix_expense_approvals_expense_pending", "expense_approvals")
+    online_ddl.drop_index("ix_expense_approvals_user_pending", "expense_approvals")
+
+    for name, table, _ in reversed(UNIQUE_CONSTRAINTS):
+        online_ddl.drop_unique_constraint(name, table)
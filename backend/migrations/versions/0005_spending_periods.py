@@ -0,0 +1,63 @@
+"""Spending periods: per-user and per-co-space-member monthly buckets
+
+Revision ID: 0005_spending_periods
+Revises: 0004_hot_path_indexes
+Create Date: 2026-10-18
+
+Both tables start empty; backfill with
+`python -m app.scripts.rebuild_spending_periods` before relying on the
+period reports and dashboard totals.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0005_spending_periods"
+down_revision = "0004_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.create_table(
+        "user_spending_periods",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        sa.Column("period_year", sa.SmallInteger(), primary_key=True),
+        sa.Column("period_month", sa.SmallInteger(), primary_key=True),
+        sa.Column("user_spending_period_total", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("user_spending_period_expense_count", sa.Integer(), nullable=False),
+        sa.Column("user_spending_period_updated_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        "co_space_member_spending_periods",
+        sa.Column(
+            "co_space_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("co_spaces.co_space_id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        sa.Column("period_year", sa.SmallInteger(), primary_key=True),
+        sa.Column("period_month", sa.SmallInteger(), primary_key=True),
+        sa.Column("co_space_member_spending_period_total", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("co_space_member_spending_period_expense_count", sa.Integer(), nullable=False),
+        sa.Column("co_space_member_spending_period_updated_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+
+def downgrade():
+    op.drop_table("co_space_member_spending_periods")
+    op.drop_table("user_spending_periods")
@@ -0,0 +1,78 @@
+"""Fund ledger: append-only fund movements and balance snapshots
+
+Revision ID: 0006_fund_ledger
+Revises: 0005_spending_periods
+Create Date: 2026-10-18
+
+Every existing fund with a non-zero balance gets an "opening" entry
+holding its current amounts, so the ledger reconciles from day one.
+Deploy the ledger-writing code together with this migration; movements
+made by older processes in between show up in
+`python -m app.scripts.reconcile_fund_ledger`.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0006_fund_ledger"
+down_revision = "0005_spending_periods"
+branch_labels = None
+depends_on = None
+
+
+ENTRY_ID = sa.BigInteger().with_variant(sa.Integer(), "sqlite")
+
+
+def upgrade():
+
+    op.create_table(
+        "fund_ledger_entries",
+        sa.Column("fund_ledger_entry_id", ENTRY_ID, primary_key=True, autoincrement=True),
+        sa.Column("fund_ledger_fund_type", sa.VARCHAR(), nullable=False),
+        sa.Column("fund_ledger_fund_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("fund_ledger_entry_type", sa.VARCHAR(), nullable=False),
+        sa.Column("fund_ledger_total_delta", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("fund_ledger_remaining_delta", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("expense_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("fund_ledger_created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    # New, empty table: no need to build the index concurrently
+    op.create_index(
+        "ix_fund_ledger_entries_fund",
+        "fund_ledger_entries",
+        ["fund_ledger_fund_type", "fund_ledger_fund_id", "fund_ledger_entry_id"],
+        postgresql_include=["fund_ledger_total_delta", "fund_ledger_remaining_delta"]
+    )
+
+    op.create_table(
+        "fund_balance_snapshots",
+        sa.Column("fund_ledger_fund_type", sa.VARCHAR(), primary_key=True),
+        sa.Column("fund_ledger_fund_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("through_entry_id", ENTRY_ID, primary_key=True, autoincrement=False),
+        sa.Column("fund_balance_snapshot_total_amount", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("fund_balance_snapshot_remaining_amount", sa.DECIMAL(15, 2), nullable=False),
+        sa.Column("fund_balance_snapshot_created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+    # Opening balances
+    op.execute(
+        "INSERT INTO fund_ledger_entries (fund_ledger_fund_type, fund_ledger_fund_id, "
+        "fund_ledger_entry_type, fund_ledger_total_delta, fund_ledger_remaining_delta) "
+        "SELECT 'user', user_id, 'opening', COALESCE(user_fund_total_amount, 0), "
+        "COALESCE(user_fund_remaining_amount, 0) FROM user_funds "
+        "WHERE COALESCE(user_fund_total_amount, 0) <> 0 OR COALESCE(user_fund_remaining_amount, 0) <> 0"
+    )
+    op.execute(
+        "INSERT INTO fund_ledger_entries (fund_ledger_fund_type, fund_ledger_fund_id, "
+        "fund_ledger_entry_type, fund_ledger_total_delta, fund_ledger_remaining_delta) "
+        "SELECT 'co_space', co_space_fund_id, 'opening', COALESCE(co_space_fund_total_amount, 0), "
+        "COALESCE(co_space_fund_remaining_amount, 0) FROM co_space_funds "
+        "WHERE COALESCE(co_space_fund_total_amount, 0) <> 0 OR COALESCE(co_space_fund_remaining_amount, 0) <> 0"
+    )
+
+
+def downgrade():
+    op.drop_table("fund_balance_snapshots")
+    op.drop_table("fund_ledger_entries")
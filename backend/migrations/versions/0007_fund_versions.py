@@ -0,0 +1,39 @@
+"""Version columns for optimistic concurrency on user and co-space funds
+
+Revision ID: 0007_fund_versions
+Revises: 0006_fund_ledger
+Create Date: 2026-10-18
+
+NOT NULL with a constant default, which Postgres 11+ adds without
+rewriting the table.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007_fund_versions"
+down_revision = "0006_fund_ledger"
+branch_labels = None
+depends_on = None
+
+
+VERSION_COLUMNS = [
+    ("user_funds", "user_fund_version"),
+    ("co_space_funds", "co_space_fund_version"),
+]
+
+
+def upgrade():
+
+    for table, column in VERSION_COLUMNS:
+        op.add_column(
+            table,
+            sa.Column(column, sa.Integer(), nullable=False, server_default=sa.text("1"))
+        )
+
+
+def downgrade():
+
+    for table, column in VERSION_COLUMNS:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column(column)
@@ -0,0 +1,29 @@
+"""Version column on users (optimistic concurrency, profile ETags)
+
+Revision ID: 0008_user_version
+Revises: 0007_fund_versions
+Create Date: 2026-10-18
+
+NOT NULL with a constant default, which Postgres 11+ adds without
+rewriting the table.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008_user_version"
+down_revision = "0007_fund_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "users",
+        sa.Column("user_version", sa.Integer(), nullable=False, server_default=sa.text("1"))
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("user_version")